@@ -56,19 +56,23 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LSM6DS.git"
 
 import struct
+import sys
+from array import array
 from math import radians
-from time import sleep
+from time import monotonic, sleep
 
-from adafruit_bus_device import i2c_device
+from adafruit_bus_device import i2c_device, spi_device
 from adafruit_register.i2c_bit import ROBit, RWBit
 from adafruit_register.i2c_bits import RWBits
-from adafruit_register.i2c_struct import ROUnaryStruct, Struct
+from adafruit_register.i2c_struct import ROUnaryStruct, Struct, UnaryStruct
 from micropython import const
 
 try:
-    from typing import Optional, Tuple
+    from typing import Callable, Iterator, List, Optional, Tuple, Union
 
     from busio import I2C
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+    from digitalio import DigitalInOut
 except ImportError:
     pass
 
@@ -102,6 +106,31 @@ class GyroRange(CV):
     """Options for ``gyro_data_range``"""
 
 
+# The values are the ranges themselves, because the full scale selection bits that encode a
+# range differ between families. Each family lists the ranges it supports in
+# ``LSM6DS._ACCEL_RANGES`` and ``LSM6DS._GYRO_RANGES``
+AccelRange.add_values(
+    (
+        ("RANGE_2G", 2, 2, 0.061),
+        ("RANGE_4G", 4, 4, 0.122),
+        ("RANGE_8G", 8, 8, 0.244),
+        ("RANGE_16G", 16, 16, 0.488),
+        ("RANGE_32G", 32, 32, 0.976),
+    )
+)
+
+GyroRange.add_values(
+    (
+        ("RANGE_125_DPS", 125, 125, 4.375),
+        ("RANGE_250_DPS", 250, 250, 8.75),
+        ("RANGE_500_DPS", 500, 500, 17.50),
+        ("RANGE_1000_DPS", 1000, 1000, 35.0),
+        ("RANGE_2000_DPS", 2000, 2000, 70.0),
+        ("RANGE_4000_DPS", 4000, 4000, 140.0),
+    )
+)
+
+
 class Rate(CV):
     """Options for ``accelerometer_data_rate`` and ``gyro_data_rate``"""
 
@@ -137,30 +166,201 @@ AccelHPF.add_values(
     )
 )
 
+
+class FIFOMode(CV):
+    """Options for ``fifo_mode``"""
+
+
+FIFOMode.add_values(
+    (
+        ("BYPASS", 0, "Bypass", None),
+        ("FIFO", 1, "FIFO", None),
+        ("CONTINUOUS_TO_FIFO", 3, "Continuous-to-FIFO", None),
+        ("BYPASS_TO_CONTINUOUS", 4, "Bypass-to-Continuous", None),
+        ("CONTINUOUS", 6, "Continuous", None),
+        ("BYPASS_TO_FIFO", 7, "Bypass-to-FIFO", None),
+    )
+)
+
+
+class FIFOTag(CV):
+    """Sensor tags of the words returned by ``read_fifo``"""
+
+
+FIFOTag.add_values(
+    (
+        ("GYRO", 0x01, "Gyroscope", None),
+        ("ACCEL", 0x02, "Accelerometer", None),
+        ("TEMPERATURE", 0x03, "Temperature", None),
+        ("TIMESTAMP", 0x04, "Timestamp", None),
+        ("CFG_CHANGE", 0x05, "Configuration change", None),
+        ("SENSOR_HUB_SLAVE0", 0x0E, "Sensor hub slave 0", None),
+        ("SENSOR_HUB_SLAVE1", 0x0F, "Sensor hub slave 1", None),
+        ("SENSOR_HUB_SLAVE2", 0x10, "Sensor hub slave 2", None),
+        ("SENSOR_HUB_SLAVE3", 0x11, "Sensor hub slave 3", None),
+        ("STEP_COUNTER", 0x12, "Step counter", None),
+    )
+)
+
+
+class InterruptSource(CV):
+    """Signals that can be routed to the INT1 and INT2 pins with ``int1_sources`` and
+    ``int2_sources``. Combine several with ``|``"""
+
+
+InterruptSource.add_values(
+    (
+        ("ACCEL_DATA_READY", 0x01, "Accelerometer data ready", None),
+        ("GYRO_DATA_READY", 0x02, "Gyro data ready", None),
+        ("FIFO_WATERMARK", 0x08, "FIFO watermark", None),
+        ("FIFO_OVERRUN", 0x10, "FIFO overrun", None),
+        ("FIFO_FULL", 0x20, "FIFO full", None),
+    )
+)
+_INTERRUPT_SOURCE_MASK = const(0x3B)
+
+
+class Event(CV):
+    """Events reported by the sensor's event detectors, as returned by ``read_events`` and
+    routed to the INT1 and INT2 pins with ``route_events``. Combine several with ``|``"""
+
+
+Event.add_values(
+    (
+        ("FREE_FALL", 0x0001, "Free-fall", None),
+        ("WAKE_UP", 0x0002, "Wake-up", None),
+        ("SINGLE_TAP", 0x0004, "Single tap", None),
+        ("DOUBLE_TAP", 0x0008, "Double tap", None),
+        ("ORIENTATION", 0x0010, "6D/4D orientation change", None),
+        ("SLEEP_CHANGE", 0x0020, "Activity/inactivity change", None),
+        ("STEP_DETECTOR", 0x0800, "Step detected", None),
+        ("TILT", 0x1000, "Tilt", None),
+        ("SIGNIFICANT_MOTION", 0x2000, "Significant motion", None),
+    )
+)
+# ALL_INT_SRC bits, and the EMB_FUNC_STATUS_MAINPAGE bits shifted up by 8
+_BASIC_EVENT_MASK = const(0x003F)
+_EMBEDDED_EVENT_MASK = const(0x3800)
+# (Event, MDx_CFG bit) of the events routed through MD1_CFG and MD2_CFG
+_MD_CFG_EVENT_BITS = (
+    (0x0001, 0x10),
+    (0x0002, 0x20),
+    (0x0004, 0x40),
+    (0x0008, 0x08),
+    (0x0010, 0x04),
+    (0x0020, 0x80),
+)
+
+
+class InactivityMode(CV):
+    """What the sensor does while it detects no motion, set with ``configure_inactivity``.
+    The accelerometer runs at 12.5 Hz while inactive in all modes but ``DISABLED``"""
+
+
+InactivityMode.add_values(
+    (
+        ("DISABLED", 0, "Disabled", None),
+        ("ACCEL_LOW_POWER", 1, "Accelerometer at 12.5 Hz, gyro unchanged", None),
+        ("GYRO_SLEEP", 2, "Accelerometer at 12.5 Hz, gyro in sleep mode", None),
+        ("GYRO_POWER_DOWN", 3, "Accelerometer at 12.5 Hz, gyro powered down", None),
+    )
+)
+
 LSM6DS_DEFAULT_ADDRESS = const(0x6A)
 
 LSM6DS_CHIP_ID = const(0x6C)
 
+LSM6DS_SPI_DEFAULT_BAUDRATE = const(10000000)
+
+_LSM6DS_FIFO_CTRL1 = const(0x07)
+_LSM6DS_FIFO_CTRL2 = const(0x08)
+_LSM6DS_FIFO_CTRL3 = const(0x09)
+_LSM6DS_FIFO_CTRL4 = const(0x0A)
 _LSM6DS_MLC_INT1 = const(0x0D)
+_LSM6DS_INT1_CTRL = const(0x0D)
+_LSM6DS_INT2_CTRL = const(0x0E)
 _LSM6DS_WHOAMI = const(0xF)
 _LSM6DS_CTRL1_XL = const(0x10)
 _LSM6DS_CTRL2_G = const(0x11)
 _LSM6DS_CTRL3_C = const(0x12)
+_LSM6DS_CTRL6_C = const(0x15)
+_LSM6DS_CTRL7_G = const(0x16)
 _LSM6DS_CTRL8_XL = const(0x17)
 _LSM6DS_CTRL9_XL = const(0x18)
 _LSM6DS_CTRL10_C = const(0x19)
 _LSM6DS_ALL_INT_SRC = const(0x1A)
+_LSM6DS_STATUS_REG = const(0x1E)
+_LSM6DS_EMB_FUNC_STATUS_MAINPAGE = const(0x35)
 _LSM6DS_OUT_TEMP_L = const(0x20)
 _LSM6DS_OUTX_L_G = const(0x22)
 _LSM6DS_OUTX_L_A = const(0x28)
 _LSM6DS_MLC_STATUS = const(0x38)
+_LSM6DS_STATUS_MASTER_MAINPAGE = const(0x39)
+_LSM6DS_FIFO_STATUS1 = const(0x3A)
+_LSM6DS_TIMESTAMP0 = const(0x40)
+_LSM6DS_TIMESTAMP2 = const(0x42)
 _LSM6DS_STEP_COUNTER = const(0x4B)
 _LSM6DS_TAP_CFG0 = const(0x56)
+_LSM6DS_TAP_CFG1 = const(0x57)
+_LSM6DS_TAP_THS_6D = const(0x59)
+_LSM6DS_INT_DUR2 = const(0x5A)
+_LSM6DS_WAKE_UP_THS = const(0x5B)
+_LSM6DS_WAKE_UP_DUR = const(0x5C)
+_LSM6DS_FREE_FALL = const(0x5D)
+_LSM6DS_MD1_CFG = const(0x5E)
+_LSM6DS_MD2_CFG = const(0x5F)
+_LSM6DS_INTERNAL_FREQ_FINE = const(0x63)
 _LSM6DS_TAP_CFG = const(0x58)
 _LSM6DS_MLC0_SRC = const(0x70)
+_LSM6DS_X_OFS_USR = const(0x73)
+_LSM6DS_FIFO_DATA_OUT_TAG = const(0x78)
 _MILLI_G_TO_ACCEL = 0.00980665
 _TEMPERATURE_SENSITIVITY = 256
 _TEMPERATURE_OFFSET = 25.0
+_FIXED_POINT_MAX_MULTIPLIER = const(0x7FFF)
+_CTRL_ODR_MASK = const(0xF0)
+_CTRL1_XL_FS_MASK = const(0x0C)
+_CTRL2_G_FS_MASK = const(0x0F)
+_CTRL2_G_FS_125 = const(0x02)
+_CTRL3_C_SW_RESET = const(0x01)
+_CTRL3_C_BDU = const(0x40)
+# samples to discard after an ODR or full scale change, from the datasheet turn-on tables
+_ACCEL_SETTLE_SAMPLES = const(2)
+_GYRO_SETTLE_SAMPLES = const(4)
+_STATUS_XLDA = const(0x01)
+_STATUS_GDA = const(0x02)
+_STATUS_TDA = const(0x04)
+_TIMESTAMP_RESET = const(0xAA)
+# TAP_CFG0..FREE_FALL, read and written together when the event detectors are configured
+_EVENT_CONFIG_REGISTERS = const(8)
+_TAP_CFG0_LIR = const(0x01)
+_TAP_CFG0_INT_CLR_ON_READ = const(0x40)
+_TAP_CFG2_INTERRUPTS_ENABLE = const(0x80)
+# ALL_INT_SRC..D6D_SRC, then EMB_FUNC_STATUS_MAINPAGE read on its own
+_EVENT_SOURCES = const(4)
+_EVENT_SOURCES_EMBEDDED = const(5)
+_TIMESTAMP_FREQUENCY = 40000  # Hz, nominally 25 us per LSB
+_TIMESTAMP_FREQ_FINE_STEP = 0.0015
+# weights of the X/Y/Z_OFS_USR registers in mg/LSB, selected with USR_OFF_W
+_USER_OFFSET_WEIGHT_FINE = 1000 / 1024
+_USER_OFFSET_WEIGHT_COARSE = 1000 / 64
+_CALIBRATION_VERSION = const(1)
+# version, then the accelerometer bias in mg and gyro bias in mdps
+_CALIBRATION_FORMAT = "<Bffffff"
+_SPI_READ = const(0x80)
+_FIFO_WORD_SIZE = const(7)
+_FIFO_BURST_WORDS = const(32)
+_FIFO_DIFF_MASK = const(0x03FF)
+_FIFO_FULL_IA = const(0x2000)
+_FIFO_OVR_IA = const(0x4000)
+_FIFO_WTM_IA = const(0x8000)
+# compressed FIFO tags: NC_T_2, NC_T_1, 2xC and 3xC for the accelerometer, then the gyro
+_FIFO_TAG_ACCEL_NC_T_2 = const(0x06)
+_FIFO_TAG_GYRO_NC_T_2 = const(0x0A)
+_FIFO_TAG_GYRO_3XC = const(0x0D)
+_FIFO_COMPRESSION_2XC = const(2)
+_FIFO_COMPRESSION_3XC = const(3)
+_FIFO_UNCOMPRESSED_RATES = (0, 8, 16, 32)  # batch data rate periods, the UNCOPTR_RATE values
 
 _LSM6DS_EMB_FUNC_EN_A = const(0x04)
 _LSM6DS_EMB_FUNC_EN_B = const(0x05)
@@ -168,13 +368,449 @@ _LSM6DS_FUNC_CFG_ACCESS = const(0x01)
 _LSM6DS_FUNC_CFG_BANK_USER = const(0)
 _LSM6DS_FUNC_CFG_BANK_HUB = const(1)
 _LSM6DS_FUNC_CFG_BANK_EMBED = const(2)
+_LSM6DS_FUNC_CFG_BANK_MASK = const(0xC0)
+_FUNC_CFG_EMBEDDED = const(0x80)
+_FUNC_CFG_SENSOR_HUB = const(0x40)
+# embedded function bank registers
+_LSM6DS_EMB_FUNC_INT1 = const(0x0A)
+_LSM6DS_EMB_MLC_INT1 = const(0x0D)
+_LSM6DS_EMB_MLC_INT2 = const(0x11)
+_LSM6DS_EMB_MLC_STATUS = const(0x15)
+_LSM6DS_EMB_FUNC_FIFO_CFG = const(0x44)
+_LSM6DS_EMB_STEP_COUNTER = const(0x62)
+_LSM6DS_EMB_FUNC_SRC = const(0x64)
+# INT1 and INT2 routing registers of the embedded functions, from EMB_FUNC_INT1 to MLC_INT2
+_EMB_ROUTING_REGISTERS = const(8)
+_EMB_FUNC_EN_A_PEDO = const(0x08)
+_EMB_FUNC_EN_A_TILT = const(0x10)
+_EMB_FUNC_EN_A_SIGN_MOTION = const(0x20)
+_EMB_FUNC_EN_B_FIFO_COMPR = const(0x08)
+_EMB_FUNC_INT_STEP_DETECTOR = const(0x08)
+_EMB_FUNC_FIFO_CFG_PEDO = const(0x40)
+_EMB_FUNC_SRC_PEDO_RST_STEP = const(0x80)
+_MD_CFG_INT_EMB_FUNC = const(0x02)
+# sensor hub bank registers
+_LSM6DS_SENSOR_HUB_1 = const(0x02)
+_LSM6DS_MASTER_CONFIG = const(0x14)
+_LSM6DS_SLV0_ADD = const(0x15)
+_LSM6DS_SLV0_CONFIG = const(0x17)
+_LSM6DS_DATAWRITE_SLV0 = const(0x21)
+_SENSOR_HUB_OUTPUTS = const(18)
+_SENSOR_HUB_SLAVES = const(4)
+_SENSOR_HUB_SLAVE_READS = const(7)
+# SLVx_ADD, SLVx_SUBADD and SLVx_CONFIG of each slave
+_SENSOR_HUB_SLAVE_REGISTERS = const(3)
+_SENSOR_HUB_RATES = (104, 52, 26, 12.5)  # Hz, the SHUB_ODR values of SLV0_CONFIG
+_MASTER_CONFIG_MASTER_ON = const(0x04)
+_MASTER_CONFIG_SHUB_PU_EN = const(0x08)
+_MASTER_CONFIG_WRITE_ONCE = const(0x40)
+_SLV_ADD_READ = const(0x01)
+_SLV_CONFIG_BATCH = const(0x08)
+_SLV0_CONFIG_SHUB_ODR_MASK = const(0xC0)
+_STATUS_MASTER_WR_ONCE_DONE = const(0x80)
+
+# (first register, number of registers) of the configuration blocks kept by the register cache
+_CACHED_REGISTER_BLOCKS = (
+    (_LSM6DS_FUNC_CFG_ACCESS, 25),  # FUNC_CFG_ACCESS..CTRL10_C, including FIFO and INTx_CTRL
+    (_LSM6DS_TAP_CFG0, 10),  # TAP_CFG0..MD2_CFG
+)
+
+
+class _RegisterCache:
+    """Write-through shadow of the configuration registers, used in place of the
+    ``I2CDevice``. Reads that fall entirely within loaded, user bank registers are served
+    from the shadow; everything else is passed through to ``device``"""
+
+    def __init__(self, device: i2c_device.I2CDevice) -> None:
+        self.device = device
+        self.shadow = bytearray(0x80)
+        self.valid = bytearray(0x80)
+
+    def __enter__(self) -> "_RegisterCache":
+        # the bus is only locked by the transactions that actually reach it
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
+
+    def invalidate(self) -> None:
+        """Pass every access through to the device until the next `load`"""
+        for i in range(len(self.valid)):
+            self.valid[i] = 0
+
+    def load(self) -> None:
+        """Read the configuration registers into the shadow, one burst per block"""
+        cmd = bytearray(1)
+        with self.device as i2c:
+            for first, count in _CACHED_REGISTER_BLOCKS:
+                cmd[0] = first
+                i2c.write_then_readinto(cmd, self.shadow, in_start=first, in_end=first + count)
+        for first, count in _CACHED_REGISTER_BLOCKS:
+            for register in range(first, first + count):
+                self.valid[register] = 1
+
+    def _cached(self, register: int, count: int) -> bool:
+        if register + count > len(self.valid):
+            return False
+        if register != _LSM6DS_FUNC_CFG_ACCESS and (
+            self.shadow[_LSM6DS_FUNC_CFG_ACCESS] & _LSM6DS_FUNC_CFG_BANK_MASK
+        ):
+            return False
+        for i in range(register, register + count):
+            if not self.valid[i]:
+                return False
+        return True
+
+    def write(self, buf: ReadableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Write ``buf`` to the device, updating the shadow of any loaded registers"""
+        if end is None:
+            end = len(buf)
+        with self.device as i2c:
+            i2c.write(buf, start=start, end=end)
+        register = buf[start]
+        user_bank = not self.shadow[_LSM6DS_FUNC_CFG_ACCESS] & _LSM6DS_FUNC_CFG_BANK_MASK
+        for i in range(start + 1, end):
+            if register >= len(self.valid):
+                break
+            if self.valid[register] and (user_bank or register == _LSM6DS_FUNC_CFG_ACCESS):
+                self.shadow[register] = buf[i]
+            register += 1
+
+    def readinto(self, buf: WriteableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Read into ``buf`` from the device"""
+        with self.device as i2c:
+            i2c.readinto(buf, start=start, end=end)
+
+    def write_then_readinto(
+        self,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Read registers from the shadow when possible, otherwise from the device"""
+        if in_end is None:
+            in_end = len(in_buffer)
+        register = out_buffer[out_start]
+        if self._cached(register, in_end - in_start):
+            for i in range(in_start, in_end):
+                in_buffer[i] = self.shadow[register]
+                register += 1
+            return
+        with self.device as i2c:
+            i2c.write_then_readinto(
+                out_buffer,
+                in_buffer,
+                out_start=out_start,
+                out_end=out_end,
+                in_start=in_start,
+                in_end=in_end,
+            )
+
+
+class _SPIRegisterDevice:
+    """Presents an ``SPIDevice`` with the ``I2CDevice`` methods used by the register
+    descriptors. Each call is one SPI transaction with chip select asserted for its
+    duration, starting with the register address, which has its top bit set for reads. The
+    sensor's register auto-increment then applies to bursts just as it does over I2C"""
+
+    def __init__(self, device: spi_device.SPIDevice) -> None:
+        self.device = device
+        self._cmd = bytearray(1)
+
+    def __enter__(self) -> "_SPIRegisterDevice":
+        # the bus is locked and chip select asserted by each transaction
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
+
+    def write(self, buf: ReadableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Write the register address in ``buf[start]`` followed by its values"""
+        if end is None:
+            end = len(buf)
+        self._cmd[0] = buf[start] & ~_SPI_READ
+        with self.device as spi:
+            spi.write(self._cmd)
+            if end > start + 1:
+                spi.write(buf, start=start + 1, end=end)
+
+    def readinto(self, buf: WriteableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Read into ``buf`` from the register last addressed, as an I2C read would"""
+        if end is None:
+            end = len(buf)
+        self._cmd[0] |= _SPI_READ
+        with self.device as spi:
+            spi.write(self._cmd)
+            spi.readinto(buf, start=start, end=end)
+
+    def write_then_readinto(
+        self,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Read the registers starting at the address in ``out_buffer[out_start]`` into
+        ``in_buffer``"""
+        if in_end is None:
+            in_end = len(in_buffer)
+        self._cmd[0] = out_buffer[out_start] | _SPI_READ
+        with self.device as spi:
+            spi.write(self._cmd)
+            spi.readinto(in_buffer, start=in_start, end=in_end)
+
+
+class _InstrumentedDevice:
+    """Wraps the ``I2CDevice`` to count the transactions, bytes and time spent on the bus,
+    per register and, when ``per_method`` is set, per public method of ``owner``"""
+
+    def __init__(self, device: i2c_device.I2CDevice, owner: "LSM6DS") -> None:
+        self.device = device
+        self.owner = owner
+        self.per_method = False
+        self.totals = [0, 0, 0, 0]  # transactions, bytes read, bytes written, seconds
+        self.registers = {}
+        self.methods = {}
+        self._register = None
+
+    def __enter__(self) -> "_InstrumentedDevice":
+        self.device.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return self.device.__exit__(exc_type, exc_val, exc_tb)
+
+    def reset(self) -> None:
+        """Set all of the counters back to zero"""
+        self.totals = [0, 0, 0, 0]
+        self.registers = {}
+        self.methods = {}
+
+    def _method(self) -> Optional[str]:
+        """The name of the outermost public method of ``owner`` on the call stack"""
+        getframe = getattr(sys, "_getframe", None)
+        if getframe is None:
+            # CircuitPython cannot inspect the stack
+            return None
+        method = None
+        frame = getframe(2)
+        while frame is not None:
+            name = frame.f_code.co_name
+            if frame.f_locals.get("self") is self.owner and not name.startswith("_"):
+                method = name
+            frame = frame.f_back
+        return method
+
+    def _record(self, start: float, read: int, written: int) -> None:
+        elapsed = monotonic() - start
+        method = self._method() if self.per_method else None
+        for counters in (
+            self.totals,
+            self.registers.setdefault(self._register, [0, 0, 0, 0]),
+            self.methods.setdefault(method, [0, 0, 0, 0]) if method else None,
+        ):
+            if counters is not None:
+                counters[0] += 1
+                counters[1] += read
+                counters[2] += written
+                counters[3] += elapsed
+
+    def write(self, buf: ReadableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Write ``buf`` to the device"""
+        if end is None:
+            end = len(buf)
+        self._register = buf[start]
+        begin = monotonic()
+        self.device.write(buf, start=start, end=end)
+        self._record(begin, 0, end - start)
+
+    def readinto(self, buf: WriteableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Read into ``buf`` from the device"""
+        if end is None:
+            end = len(buf)
+        begin = monotonic()
+        self.device.readinto(buf, start=start, end=end)
+        self._record(begin, end - start, 0)
+
+    def write_then_readinto(
+        self,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write ``out_buffer`` and then read into ``in_buffer`` in one transaction"""
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        self._register = out_buffer[out_start]
+        begin = monotonic()
+        self.device.write_then_readinto(
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        self._record(begin, in_end - in_start, out_end - out_start)
+
+
+def _stats_entry(counters: list) -> dict:
+    return {
+        "transactions": counters[0],
+        "bytes_read": counters[1],
+        "bytes_written": counters[2],
+        "time": counters[3],
+    }
+
+
+def _fixed_point_scale(lsb: float) -> Tuple[int, int]:
+    """Returns a ``(multiplier, shift)`` pair that converts a raw 16-bit reading to ``lsb`` units
+    with ``(raw * multiplier) >> shift``, keeping the product within a small int"""
+    shift = 0
+    while lsb * (2 << shift) < _FIXED_POINT_MAX_MULTIPLIER:
+        shift += 1
+    return int(lsb * (1 << shift) + 0.5), shift
+
+
+class _SampleStream:
+    """Asynchronous iterator returned by `LSM6DS.stream`"""
+
+    def __init__(self, sensor: "LSM6DS", interval: float) -> None:
+        self._sensor = sensor
+        self._interval = interval
+        self._delay = 0
+
+    def __aiter__(self) -> "_SampleStream":
+        return self
+
+    async def __anext__(self) -> Tuple:
+        import asyncio  # noqa: PLC0415, loaded only by asyncio applications
+
+        while True:
+            await asyncio.sleep(self._delay)
+            sample = self._sensor.read_all()
+            data_ready = sample[3]
+            if data_ready[0] or data_ready[1]:
+                self._delay = self._interval
+                return sample
+            # no new data yet, so the next sample is close; poll more often until it arrives
+            self._delay = self._interval / 4
+
+
+class _RegisterBank:
+    """Context manager returned by `LSM6DS.embedded_bank` and `LSM6DS.sensor_hub_bank`.
+    FUNC_CFG_ACCESS is written once on entry and once on exit, and each `read`, `readinto`
+    or `write` inside the block is a single auto-increment transaction"""
+
+    def __init__(self, sensor: "LSM6DS", access: int) -> None:
+        self._sensor = sensor
+        self._select = bytearray((_LSM6DS_FUNC_CFG_ACCESS, access))
+        self._deselect = bytearray((_LSM6DS_FUNC_CFG_ACCESS, 0))
+        self._cmd = bytearray(1)
+        self._buf = bytearray(9)
+
+    def __enter__(self) -> "_RegisterBank":
+        with self._sensor.i2c_device as i2c:
+            i2c.write(self._select)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        # always return to the user bank, whatever FUNC_CFG_ACCESS held before
+        with self._sensor.i2c_device as i2c:
+            i2c.write(self._deselect)
+        return False
+
+    def readinto(
+        self, register: int, buf: WriteableBuffer, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Read ``buf[start:end]`` from consecutive registers starting at ``register``"""
+        self._cmd[0] = register
+        with self._sensor.i2c_device as i2c:
+            i2c.write_then_readinto(self._cmd, buf, in_start=start, in_end=end)
+
+    def read(self, register: int, count: int) -> bytearray:
+        """Read ``count`` consecutive registers starting at ``register``"""
+        buf = bytearray(count)
+        self.readinto(register, buf)
+        return buf
+
+    def write(self, register: int, values: ReadableBuffer) -> None:
+        """Write ``values`` to consecutive registers starting at ``register``"""
+        count = len(values)
+        if count >= len(self._buf):
+            self._buf = bytearray(count + 1)
+        buf = self._buf
+        buf[0] = register
+        buf[1 : count + 1] = bytes(values)
+        with self._sensor.i2c_device as i2c:
+            i2c.write(buf, end=count + 1)
+
+
+def _xyz_array(data: bytearray, scale: float, offset: Tuple[int, int, int]) -> object:
+    """Decode little-endian x, y, z 16-bit samples, remove the raw ``offset`` and scale them,
+    as an ``N x 3`` ndarray when ``ulab`` or ``numpy`` is available and as a flat
+    ``array("f")`` otherwise"""
+    try:
+        from ulab import numpy as np  # noqa: PLC0415, loaded only when arrays are requested
+    except ImportError:
+        try:
+            import numpy as np  # noqa: PLC0415
+        except ImportError:
+            np = None
+    if np is None:
+        values = struct.unpack("<%dh" % (len(data) // 2), data)
+        return array("f", ((value - offset[i % 3]) * scale for i, value in enumerate(values)))
+    raw = np.frombuffer(data, dtype=np.int16)
+    raw = raw.reshape((len(raw) // 3, 3))
+    if any(offset):
+        return (raw - np.array(offset)) * scale
+    return raw * scale
+
+
+def _settle_time(accel_rate: int, gyro_rate: int) -> float:
+    """Seconds to wait for valid data after a change at the given ``Rate`` values"""
+    settle = 0
+    if accel_rate != Rate.RATE_SHUTDOWN:
+        settle = _ACCEL_SETTLE_SAMPLES / Rate.string[accel_rate]
+    if gyro_rate != Rate.RATE_SHUTDOWN:
+        settle = max(settle, _GYRO_SETTLE_SAMPLES / Rate.string[gyro_rate])
+    return settle
 
 
 class LSM6DS:
     """Driver for the LSM6DSOX 6-axis accelerometer and gyroscope.
 
-    :param ~busio.I2C i2c_bus: The I2C bus the LSM6DSOX is connected to.
+    :param ~busio.I2C i2c_bus: The I2C bus the LSM6DSOX is connected to, or the SPI bus when
+        ``spi_cs`` is given
     :param int address: TThe I2C device address. Defaults to :const:`0x6A`
+    :param str ucf: Path to a UCF file to load into the machine learning core. Optional
+    :param bool cache_registers: Keep a write-through copy of the configuration registers
+        (CTRL1_XL..CTRL10_C, FIFO, interrupt and tap configuration) so that reading settings
+        and changing individual bits does not need to read them from the sensor. Only enable
+        this when nothing else changes the sensor's configuration. Defaults to `False`
+    :param bool configure_defaults: Set block data update, 104 Hz data rates and the default
+        ranges after the reset. When `False` the sensor is left in its power-on state, with
+        both sensors shut down, for a later call to `configure`. Defaults to `True`
+    :param bool instrument: Count the bus transactions, bytes and time used per register, for
+        `stats`. This slows every transaction down, so only enable it while measuring. Set
+        `stats_per_method` to also count them per public method. Defaults to `False`
+    :param ~digitalio.DigitalInOut spi_cs: The chip select pin, to connect over SPI instead of
+        I2C. ``i2c_bus`` must then be a ``busio.SPI`` bus and ``address`` is not used.
+        Burst and FIFO reads work the same way over both buses
+    :param int spi_baudrate: The SPI clock rate. Defaults to the sensors' maximum of 10 MHz
 
     """
 
@@ -185,6 +821,8 @@ class LSM6DS:
     _raw_accel_data = Struct(_LSM6DS_OUTX_L_A, "<hhh")
     _raw_gyro_data = Struct(_LSM6DS_OUTX_L_G, "<hhh")
     _raw_temp_data = Struct(_LSM6DS_OUT_TEMP_L, "<h")
+    _raw_motion_data = Struct(_LSM6DS_OUTX_L_G, "<hhhhhh")
+    _raw_all_data = Struct(_LSM6DS_STATUS_REG, "<Bxhhhhhhh")
     _emb_func_en_a = Struct(_LSM6DS_EMB_FUNC_EN_A, "<b")
     _emb_func_en_b = Struct(_LSM6DS_EMB_FUNC_EN_B, "<b")
     _mlc0_src = Struct(_LSM6DS_MLC0_SRC, "<bbbbbbbb")
@@ -211,89 +849,453 @@ class LSM6DS:
     _tap_latch = RWBit(_LSM6DS_TAP_CFG0, 0)
     _tap_clear = RWBit(_LSM6DS_TAP_CFG0, 6)
     _ped_enable = RWBit(_LSM6DS_TAP_CFG, 6)
-    pedometer_steps = ROUnaryStruct(_LSM6DS_STEP_COUNTER, "<h")
-    """The number of steps detected by the pedometer. You must enable with `pedometer_enable`
-    before calling. Use ``pedometer_reset`` to reset the number of steps"""
+    _int1_step_detector = RWBit(_LSM6DS_INT1_CTRL, 7)
+    _step_counter = ROUnaryStruct(_LSM6DS_STEP_COUNTER, "<H")
+
+    _fifo_watermark = RWBits(9, _LSM6DS_FIFO_CTRL1, 0, register_width=2)
+    _fifo_stop_on_wtm = RWBit(_LSM6DS_FIFO_CTRL2, 7)
+    _fifo_compression_rt = RWBit(_LSM6DS_FIFO_CTRL2, 6)
+    _fifo_uncompressed_rate = RWBits(2, _LSM6DS_FIFO_CTRL2, 1)
+    _fifo_accel_bdr = RWBits(4, _LSM6DS_FIFO_CTRL3, 0)
+    _fifo_gyro_bdr = RWBits(4, _LSM6DS_FIFO_CTRL3, 4)
+    _fifo_mode = RWBits(3, _LSM6DS_FIFO_CTRL4, 0)
+    _fifo_temp_bdr = RWBits(2, _LSM6DS_FIFO_CTRL4, 4)
+    _fifo_ts_decimation = RWBits(2, _LSM6DS_FIFO_CTRL4, 6)
+    _fifo_status = ROUnaryStruct(_LSM6DS_FIFO_STATUS1, "<H")
+
+    _timestamp_enable = RWBit(_LSM6DS_CTRL10_C, 5)
+    _raw_timestamp = ROUnaryStruct(_LSM6DS_TIMESTAMP0, "<I")
+    _timestamp_reset = UnaryStruct(_LSM6DS_TIMESTAMP2, "<B")
+    _internal_freq_fine = ROUnaryStruct(_LSM6DS_INTERNAL_FREQ_FINE, "<b")
+    _status_master = ROUnaryStruct(_LSM6DS_STATUS_MASTER_MAINPAGE, "<B")
+
+    _usr_off_w = RWBit(_LSM6DS_CTRL6_C, 3)
+    _usr_off_on_out = RWBit(_LSM6DS_CTRL7_G, 1)
+    _user_offsets = Struct(_LSM6DS_X_OFS_USR, "<bbb")
+
+    _int1_ctrl = RWBits(6, _LSM6DS_INT1_CTRL, 0)
+    _int2_ctrl = RWBits(6, _LSM6DS_INT2_CTRL, 0)
+    _int1_emb_func = RWBit(_LSM6DS_MD1_CFG, 1)
+    _int2_emb_func = RWBit(_LSM6DS_MD2_CFG, 1)
     CHIP_ID = None
+    _supports_tagged_fifo = False
+    _supports_timestamp = False
+    _supports_user_offset = False
+    _supports_embedded_functions = False
+    _supports_sensor_hub = False
+    # (name, FS value, range, sensitivity) of the ranges supported by this family. The
+    # sensitivities are in mg/LSB and mdps/LSB
+    _ACCEL_RANGES = (
+        ("RANGE_2G", 0, 2, 0.061),
+        ("RANGE_16G", 1, 16, 0.488),
+        ("RANGE_4G", 2, 4, 0.122),
+        ("RANGE_8G", 3, 8, 0.244),
+    )
+    _GYRO_RANGES = (
+        ("RANGE_125_DPS", 125, 125, 4.375),
+        ("RANGE_250_DPS", 0, 250, 8.75),
+        ("RANGE_500_DPS", 1, 500, 17.50),
+        ("RANGE_1000_DPS", 2, 1000, 35.0),
+        ("RANGE_2000_DPS", 3, 2000, 70.0),
+    )
 
     def __init__(
-        self, i2c_bus: I2C, address: int = LSM6DS_DEFAULT_ADDRESS, ucf: str = None
+        self,
+        i2c_bus: I2C,
+        address: int = LSM6DS_DEFAULT_ADDRESS,
+        ucf: str = None,
+        cache_registers: bool = False,
+        configure_defaults: bool = True,
+        instrument: bool = False,
+        spi_cs: Optional[DigitalInOut] = None,
+        spi_baudrate: int = LSM6DS_SPI_DEFAULT_BAUDRATE,
     ) -> None:
         self._cached_accel_range = None
         self._cached_gyro_range = None
-
-        self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
+        self._fixed_point = False
+        # full scale selection bits and sensitivities of this family's ranges, by
+        # ``AccelRange`` and ``GyroRange`` value
+        self._accel_fs = {getattr(AccelRange, name): fs for name, fs, _, _ in self._ACCEL_RANGES}
+        self._accel_lsb = {getattr(AccelRange, name): lsb for name, _, _, lsb in self._ACCEL_RANGES}
+        self._gyro_fs = {getattr(GyroRange, name): fs for name, fs, _, _ in self._GYRO_RANGES}
+        self._gyro_lsb = {getattr(GyroRange, name): lsb for name, _, _, lsb in self._GYRO_RANGES}
+        self._accel_scale = None
+        self._gyro_scale = None
+        self._accel_fixed_scale = None
+        self._gyro_fixed_scale = None
+        # calibration biases in mg and mdps, and the matching raw offsets at the current
+        # ranges, which are subtracted before scaling
+        self._accel_bias = (0.0, 0.0, 0.0)
+        self._gyro_bias = (0.0, 0.0, 0.0)
+        self._accel_offset = (0, 0, 0)
+        self._gyro_offset = (0, 0, 0)
+        self._cmd = bytearray(1)
+        self._timestamp_lsb = None
+        self._timestamp_ticks = 0
+        self._timestamp_last = 0
+        self._timestamp_running = False
+        self._mlc_outputs = bytearray(8)
+        self._mlc_previous = bytearray(8)
+        # MLC_STATUS_MAINPAGE, followed by TIMESTAMP0..3 where the counter exists
+        self._mlc_status_buffer = bytearray(5 if self._supports_timestamp else 1)
+        self._raw_buffer = bytearray(6)
+        # TIMESTAMP0..3 followed by STATUS_REG to OUTZ_H_A, for `read_timestamped`
+        self._timestamped_buffer = bytearray(20) if self._supports_timestamp else None
+        self._event_buffer = bytearray(_EVENT_SOURCES_EMBEDDED)
+        self._embedded_bank = _RegisterBank(self, _FUNC_CFG_EMBEDDED)
+        self._sensor_hub_bank = _RegisterBank(self, _FUNC_CFG_SENSOR_HUB)
+        if self._supports_tagged_fifo:
+            self._fifo_cmd = bytearray((_LSM6DS_FIFO_DATA_OUT_TAG,))
+            self._fifo_buffer = bytearray(_FIFO_WORD_SIZE * _FIFO_BURST_WORDS)
+            # the last raw gyro and accelerometer samples read, indexed by FIFOTag, which
+            # compressed words hold differences from
+            self._fifo_previous = [None, None, None]
+
+        if spi_cs is None:
+            self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
+        else:
+            self.i2c_device = _SPIRegisterDevice(
+                spi_device.SPIDevice(i2c_bus, spi_cs, baudrate=spi_baudrate)
+            )
+        self._instrumentation = None
+        if instrument:
+            # inside the cache, so that only transactions that reach the bus are counted
+            self._instrumentation = _InstrumentedDevice(self.i2c_device, self)
+            self.i2c_device = self._instrumentation
+        if cache_registers:
+            self.i2c_device = _RegisterCache(self.i2c_device)
         if self.CHIP_ID is None:
             raise AttributeError("LSM6DS Parent Class cannot be directly instantiated")
         if self._chip_id != self.CHIP_ID:
             raise RuntimeError("Failed to find %s - check your wiring!" % self.__class__.__name__)
         self.reset()
-        if not hasattr(GyroRange, "string"):
-            self._add_gyro_ranges()
-        self._bdu = True
-
-        self._add_accel_ranges()
-        self.accelerometer_data_rate = Rate.RATE_104_HZ
-        self.gyro_data_rate = Rate.RATE_104_HZ
-
-        self.accelerometer_range = AccelRange.RANGE_4G
-        self.gyro_range = GyroRange.RANGE_250_DPS
+        if configure_defaults:
+            self._configure_defaults()
+        else:
+            # the power-on full scale selections are both encoded as 0
+            self._cache_accel_range(next(k for k, fs in self._accel_fs.items() if fs == 0))
+            self._cache_gyro_range(next(k for k, fs in self._gyro_fs.items() if fs == 0))
         # Load and configure MLC if UCF file is provided
         if ucf is not None:
             self.load_mlc(ucf)
 
     def reset(self) -> None:
         "Resets the sensor's configuration into an initial state"
-        self._sw_reset = True
+        self._start_reset()
         while self._sw_reset:
             sleep(0.001)
+        self._finish_reset()
 
-    @staticmethod
-    def _add_gyro_ranges() -> None:
-        GyroRange.add_values(
-            (
-                ("RANGE_125_DPS", 125, 125, 4.375),
-                ("RANGE_250_DPS", 0, 250, 8.75),
-                ("RANGE_500_DPS", 1, 500, 17.50),
-                ("RANGE_1000_DPS", 2, 1000, 35.0),
-                ("RANGE_2000_DPS", 3, 2000, 70.0),
-            )
+    async def areset(self) -> None:
+        """Like `reset`, but polls for the end of the reset with ``asyncio.sleep``"""
+        import asyncio  # noqa: PLC0415, loaded only by asyncio applications
+
+        self._start_reset()
+        while self._sw_reset:
+            await asyncio.sleep(0.001)
+        self._finish_reset()
+
+    def _start_reset(self) -> None:
+        if isinstance(self.i2c_device, _RegisterCache):
+            self.i2c_device.invalidate()
+        self._sw_reset = True
+
+    def _finish_reset(self) -> None:
+        if isinstance(self.i2c_device, _RegisterCache):
+            self.i2c_device.load()
+        # the reset also clears the X/Y/Z_OFS_USR registers and stops the timestamp counter
+        self._set_biases((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+        self._timestamp_running = False
+
+    def _configure_defaults(self) -> None:
+        self.configure(
+            accel_range=AccelRange.RANGE_4G,
+            gyro_range=GyroRange.RANGE_250_DPS,
+            accel_rate=Rate.RATE_104_HZ,
+            gyro_rate=Rate.RATE_104_HZ,
+            block_data_update=True,
         )
 
-    @staticmethod
-    def _add_accel_ranges() -> None:
-        AccelRange.add_values(
-            (
-                ("RANGE_2G", 0, 2, 0.061),
-                ("RANGE_16G", 1, 16, 0.488),
-                ("RANGE_4G", 2, 4, 0.122),
-                ("RANGE_8G", 3, 8, 0.244),
+    def configure(
+        self,
+        accel_range: Optional[int] = None,
+        gyro_range: Optional[int] = None,
+        accel_rate: Optional[int] = None,
+        gyro_rate: Optional[int] = None,
+        block_data_update: Optional[bool] = None,
+        settle: bool = True,
+    ) -> None:
+        """Set several measurement settings at once. CTRL1_XL, CTRL2_G and CTRL3_C are read and
+        then written back in a single transaction, and settings left as `None` are unchanged.
+
+        :param int accel_range: The accelerometer range. Must be an ``AccelRange``
+        :param int gyro_range: The gyro range. Must be a ``GyroRange``
+        :param int accel_rate: The accelerometer data rate. Must be a ``Rate``
+        :param int gyro_rate: The gyro data rate. Must be a ``Rate``
+        :param bool block_data_update: Whether the output registers are only updated once both
+            bytes of a sample have been read
+        :param bool settle: Wait for the samples the datasheet says to discard after a change
+            at the new data rates, instead of a fixed delay. Defaults to `True`
+        """
+        settle_time = self._write_configuration(
+            accel_range, gyro_range, accel_rate, gyro_rate, block_data_update
+        )
+        if settle:
+            sleep(settle_time)
+
+    async def aconfigure(
+        self,
+        accel_range: Optional[int] = None,
+        gyro_range: Optional[int] = None,
+        accel_rate: Optional[int] = None,
+        gyro_rate: Optional[int] = None,
+        block_data_update: Optional[bool] = None,
+    ) -> None:
+        """Like `configure`, but waits for the new settings to settle with ``asyncio.sleep``
+        so other tasks can run in the meantime"""
+        import asyncio  # noqa: PLC0415, loaded only by asyncio applications
+
+        await asyncio.sleep(
+            self._write_configuration(
+                accel_range, gyro_range, accel_rate, gyro_rate, block_data_update
             )
         )
 
+    def _write_configuration(
+        self,
+        accel_range: Optional[int],
+        gyro_range: Optional[int],
+        accel_rate: Optional[int],
+        gyro_rate: Optional[int],
+        block_data_update: Optional[bool],
+    ) -> float:
+        """Write the settings for `configure`, returning the time they take to settle"""
+        if accel_range is not None and accel_range not in self._accel_lsb:
+            raise AttributeError("range must be an `AccelRange`")
+        if gyro_range is not None and gyro_range not in self._gyro_lsb:
+            raise AttributeError("range must be a `GyroRange`")
+        if accel_rate is not None and not Rate.is_valid(accel_rate):
+            raise AttributeError("accelerometer_data_rate must be a `Rate`")
+        if gyro_rate is not None and not Rate.is_valid(gyro_rate):
+            raise AttributeError("gyro_data_rate must be a `Rate`")
+
+        # ISM330DHCX requires enabling low-power mode for 1.6 Hz ODR
+        if accel_rate == Rate.RATE_1_6_HZ and getattr(self, "_supports_low_power_odr", False):
+            self.low_power_mode = True
+
+        buf = bytearray(4)
+        buf[0] = _LSM6DS_CTRL1_XL
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+        if accel_range is not None:
+            buf[1] = (buf[1] & ~_CTRL1_XL_FS_MASK) | self._accel_fs[accel_range] << 2
+        if accel_rate is not None:
+            buf[1] = (buf[1] & ~_CTRL_ODR_MASK) | accel_rate << 4
+        if gyro_range is not None:
+            buf[2] = (buf[2] & ~_CTRL2_G_FS_MASK) | self._gyro_range_bits(gyro_range)
+        if gyro_rate is not None:
+            buf[2] = (buf[2] & ~_CTRL_ODR_MASK) | gyro_rate << 4
+        buf[3] &= ~_CTRL3_C_SW_RESET
+        if block_data_update is not None:
+            buf[3] = (buf[3] & ~_CTRL3_C_BDU) | (_CTRL3_C_BDU if block_data_update else 0)
+        with self.i2c_device as i2c:
+            i2c.write(buf)
+
+        if accel_range is not None:
+            self._cache_accel_range(accel_range)
+        if gyro_range is not None:
+            self._cache_gyro_range(gyro_range)
+        return _settle_time(buf[1] >> 4, buf[2] >> 4)
+
+    def _gyro_range_bits(self, value: int) -> int:
+        """The FS_125 and FS_G bits of CTRL2_G for a ``GyroRange``"""
+        if value == GyroRange.RANGE_125_DPS:
+            return _CTRL2_G_FS_125
+        return self._gyro_fs[value] << 2
+
     @property
     def acceleration(self) -> Tuple[float, float, float]:
         """The x, y, z acceleration values returned in a 3-tuple and are in m / s ^ 2."""
         raw_accel_data = self._raw_accel_data
-
-        x = self._scale_xl_data(raw_accel_data[0])
-        y = self._scale_xl_data(raw_accel_data[1])
-        z = self._scale_xl_data(raw_accel_data[2])
-
-        return (x, y, z)
+        return self._convert_accel(raw_accel_data[0], raw_accel_data[1], raw_accel_data[2])
 
     @property
     def gyro(self) -> Tuple[float, float, float]:
         """The x, y, z angular velocity values returned in a 3-tuple and are in radians / second"""
         raw_gyro_data = self._raw_gyro_data
-        x, y, z = (radians(self._scale_gyro_data(i)) for i in raw_gyro_data)
-        return (x, y, z)
+        return self._convert_gyro(raw_gyro_data[0], raw_gyro_data[1], raw_gyro_data[2])
+
+    @property
+    def motion(self) -> Tuple[float, float, float, float, float, float]:
+        """The x, y, z acceleration in m / s ^ 2 followed by the x, y, z angular velocity in
+        radians / second, returned in a 6-tuple. Both are read in a single transaction so they
+        come from the same sample"""
+        raw = self._raw_motion_data
+        return self._convert_accel(raw[3], raw[4], raw[5]) + self._convert_gyro(
+            raw[0], raw[1], raw[2]
+        )
+
+    def read_all(
+        self,
+    ) -> Tuple[
+        Tuple[float, float, float], Tuple[float, float, float], float, Tuple[bool, bool, bool]
+    ]:
+        """Read the status, temperature, gyro and acceleration registers in a single transaction.
+
+        Returns an ``(acceleration, gyro, temperature, data_ready)`` tuple, where ``acceleration``
+        and ``gyro`` are scaled like `acceleration` and `gyro`, ``temperature`` is in Celsius and
+        ``data_ready`` is a 3-tuple of booleans that are `True` if new accelerometer, gyro and
+        temperature data, respectively, was available when the registers were read.
+        """
+        return self._decode_all(self._raw_all_data)
+
+    def read_timestamped(
+        self,
+    ) -> Tuple[
+        float,
+        Tuple[float, float, float],
+        Tuple[float, float, float],
+        float,
+        Tuple[bool, bool, bool],
+    ]:
+        """Like `read_all`, but also reads the timestamp counter while holding the bus and
+        returns a ``(timestamp, acceleration, gyro, temperature, data_ready)`` tuple, where
+        ``timestamp`` is `timestamp` at the time of the read. `timestamp_enabled` must be
+        set"""
+        self._check_timestamp()
+        buf = self._timestamped_buffer
+        cmd = self._cmd
+        with self.i2c_device as i2c:
+            cmd[0] = _LSM6DS_TIMESTAMP0
+            i2c.write_then_readinto(cmd, buf, in_end=4)
+            cmd[0] = _LSM6DS_STATUS_REG
+            i2c.write_then_readinto(cmd, buf, in_start=4)
+        raw = struct.unpack_from("<IBxhhhhhhh", buf)
+        return (self._timestamp_seconds(raw[0]),) + self._decode_all(raw[1:])
+
+    def _decode_all(self, raw: Tuple) -> Tuple:
+        status = raw[0]
+        acceleration = self._convert_accel(raw[5], raw[6], raw[7])
+        gyro = self._convert_gyro(raw[2], raw[3], raw[4])
+        temperature = raw[1] / _TEMPERATURE_SENSITIVITY + _TEMPERATURE_OFFSET
+        data_ready = (
+            bool(status & _STATUS_XLDA),
+            bool(status & _STATUS_GDA),
+            bool(status & _STATUS_TDA),
+        )
+        return acceleration, gyro, temperature, data_ready
+
+    def read_acceleration_into(self, buf: Union[array, WriteableBuffer]) -> None:
+        """Read the x, y, z acceleration in m / s ^ 2 into the first three items of ``buf``,
+        which must hold floats, such as an ``array("f")``, or integers when `fixed_point` is
+        enabled. Uses preallocated buffers so repeated calls do not allocate memory for the bus
+        transaction"""
+        if self._fixed_point:
+            scale, shift = self._accel_fixed_scale
+            self._read_xyz_into(_LSM6DS_OUTX_L_A, buf, scale, shift, self._accel_offset)
+        else:
+            self._read_xyz_into(_LSM6DS_OUTX_L_A, buf, self._accel_scale, offset=self._accel_offset)
+
+    def read_gyro_into(self, buf: Union[array, WriteableBuffer]) -> None:
+        """Read the x, y, z angular velocity in radians / second into the first three items of
+        ``buf``, which must hold floats, such as an ``array("f")``, or integers when
+        `fixed_point` is enabled. Uses preallocated buffers so repeated calls do not allocate
+        memory for the bus transaction"""
+        if self._fixed_point:
+            scale, shift = self._gyro_fixed_scale
+            self._read_xyz_into(_LSM6DS_OUTX_L_G, buf, scale, shift, self._gyro_offset)
+        else:
+            self._read_xyz_into(_LSM6DS_OUTX_L_G, buf, self._gyro_scale, offset=self._gyro_offset)
+
+    def read_raw_acceleration_into(self, buf: Union[array, WriteableBuffer]) -> None:
+        """Read the raw, signed 16-bit x, y, z accelerometer values into the first three items
+        of ``buf``, such as an ``array("h")``, without allocating memory"""
+        self._read_xyz_into(_LSM6DS_OUTX_L_A, buf)
+
+    def read_raw_gyro_into(self, buf: Union[array, WriteableBuffer]) -> None:
+        """Read the raw, signed 16-bit x, y, z gyro values into the first three items of
+        ``buf``, such as an ``array("h")``, without allocating memory"""
+        self._read_xyz_into(_LSM6DS_OUTX_L_G, buf)
+
+    def _read_xyz_into(
+        self,
+        register: int,
+        buf: Union[array, WriteableBuffer],
+        scale: Optional[float] = None,
+        shift: Optional[int] = None,
+        offset: Tuple[int, int, int] = (0, 0, 0),
+    ) -> None:
+        raw = self._raw_buffer
+        self._cmd[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._cmd, raw)
+        for i in range(3):
+            value = raw[2 * i] | raw[2 * i + 1] << 8
+            if value & 0x8000:
+                value -= 0x10000
+            value -= offset[i]
+            if scale is None:
+                buf[i] = value
+            elif shift is None:
+                buf[i] = value * scale
+            else:
+                buf[i] = (value * scale) >> shift
+
+    def _convert_accel(self, x: int, y: int, z: int) -> Tuple:
+        offset = self._accel_offset
+        x -= offset[0]
+        y -= offset[1]
+        z -= offset[2]
+        if self._fixed_point:
+            scale, shift = self._accel_fixed_scale
+            return ((x * scale) >> shift, (y * scale) >> shift, (z * scale) >> shift)
+        scale = self._accel_scale
+        return (x * scale, y * scale, z * scale)
+
+    def _convert_gyro(self, x: int, y: int, z: int) -> Tuple:
+        offset = self._gyro_offset
+        x -= offset[0]
+        y -= offset[1]
+        z -= offset[2]
+        if self._fixed_point:
+            scale, shift = self._gyro_fixed_scale
+            return ((x * scale) >> shift, (y * scale) >> shift, (z * scale) >> shift)
+        scale = self._gyro_scale
+        return (x * scale, y * scale, z * scale)
+
+    def stream(self, interval: Optional[float] = None) -> "_SampleStream":
+        """An asynchronous iterator of new samples, for use in asyncio applications.
+
+        Each sample is a tuple like those returned by `read_all`, and is only produced when the
+        status register shows new accelerometer or gyro data. Between reads the iterator waits
+        with ``asyncio.sleep`` for roughly one sample period, so other tasks can run.
+
+        .. code-block:: python
+
+            async for acceleration, gyro, temperature, data_ready in sensor.stream():
+                print(acceleration, gyro)
+
+        :param float interval: Seconds between reads. Defaults to the period of the faster
+            of the accelerometer and gyro data rates
+        """
+        if interval is None:
+            rate = max(Rate.string[self.accelerometer_data_rate], Rate.string[self.gyro_data_rate])
+            if not rate:
+                raise RuntimeError("Both the accelerometer and the gyro are shut down")
+            interval = 1 / rate
+        return _SampleStream(self, interval)
 
-    def _scale_xl_data(self, raw_measurement: int) -> float:
-        return raw_measurement * AccelRange.lsb[self._cached_accel_range] * _MILLI_G_TO_ACCEL
+    @property
+    def fixed_point(self) -> bool:
+        """When `True`, acceleration is returned as integer milli-g and angular velocity as
+        integer millidegrees / second instead of floats in m / s ^ 2 and radians / second.
+        Scaling then uses a precomputed integer multiply and shift per range, which is much
+        faster on boards without a floating point unit"""
+        return self._fixed_point
 
-    def _scale_gyro_data(self, raw_measurement: int) -> float:
-        return raw_measurement * GyroRange.lsb[self._cached_gyro_range] / 1000
+    @fixed_point.setter
+    def fixed_point(self, value: bool) -> None:
+        self._fixed_point = bool(value)
 
     @property
     def accelerometer_range(self) -> int:
@@ -303,10 +1305,10 @@ class LSM6DS:
 
     @accelerometer_range.setter
     def accelerometer_range(self, value: int) -> None:
-        if not AccelRange.is_valid(value):
+        if value not in self._accel_lsb:
             raise AttributeError("range must be an `AccelRange`")
-        self._accel_range = value
-        self._cached_accel_range = value
+        self._accel_range = self._accel_fs[value]
+        self._cache_accel_range(value)
         sleep(0.2)  # needed to let new range settle
 
     @property
@@ -322,18 +1324,34 @@ class LSM6DS:
         sleep(0.2)
 
     def _set_gyro_range(self, value: int) -> None:
-        if not GyroRange.is_valid(value):
+        if value not in self._gyro_lsb:
             raise AttributeError("range must be a `GyroRange`")
 
-        # range uses `FS_G` enum
-        if value <= GyroRange.RANGE_2000_DPS:
-            self._gyro_range_125dps = False
-            self._gyro_range = value
         # range uses the `FS_125` bit
-        if value is GyroRange.RANGE_125_DPS:
+        if value == GyroRange.RANGE_125_DPS:
             self._gyro_range_125dps = True
+        # range uses `FS_G` enum
+        elif value != GyroRange.RANGE_4000_DPS:
+            self._gyro_range_125dps = False
+            self._gyro_range = self._gyro_fs[value]
 
-        self._cached_gyro_range = value  # needed to let new range settle
+        self._cache_gyro_range(value)
+
+    def _cache_accel_range(self, value: int) -> None:
+        lsb = self._accel_lsb[value]
+        self._cached_accel_range = value
+        self._accel_scale = lsb * _MILLI_G_TO_ACCEL
+        self._accel_fixed_scale = _fixed_point_scale(lsb)
+        if not self._supports_user_offset:
+            # otherwise the sensor removes the bias itself
+            self._accel_offset = tuple(round(bias / lsb) for bias in self._accel_bias)
+
+    def _cache_gyro_range(self, value: int) -> None:
+        lsb = self._gyro_lsb[value]
+        self._cached_gyro_range = value
+        self._gyro_scale = radians(lsb / 1000)
+        self._gyro_fixed_scale = _fixed_point_scale(lsb)
+        self._gyro_offset = tuple(round(bias / lsb) for bias in self._gyro_bias)
 
     @property
     def accelerometer_data_rate(self) -> int:
@@ -367,15 +1385,81 @@ class LSM6DS:
 
     @property
     def pedometer_enable(self) -> bool:
-        """Whether the pedometer function on the accelerometer is enabled"""
+        """Whether the pedometer function on the accelerometer is enabled. Enabling it resets
+        `pedometer_steps` to 0"""
+        if self._supports_embedded_functions:
+            return self._embedded_function_enabled(_EMB_FUNC_EN_A_PEDO)
         return self._ped_enable and self._func_enable
 
     @pedometer_enable.setter
     def pedometer_enable(self, enable: bool) -> None:
+        if self._supports_embedded_functions:
+            # one bank window for the enable and the step counter reset
+            with self._embedded_bank as bank:
+                enable_a = bank.read(_LSM6DS_EMB_FUNC_EN_A, 1)
+                if enable:
+                    enable_a[0] |= _EMB_FUNC_EN_A_PEDO
+                else:
+                    enable_a[0] &= ~_EMB_FUNC_EN_A_PEDO
+                bank.write(_LSM6DS_EMB_FUNC_EN_A, enable_a)
+                if enable:
+                    bank.write(_LSM6DS_EMB_FUNC_SRC, (_EMB_FUNC_SRC_PEDO_RST_STEP,))
+            return
         self._ped_enable = enable
         self._func_enable = enable
         self._pedometer_reset = enable
 
+    @property
+    def pedometer_steps(self) -> int:
+        """The number of steps detected by the pedometer. You must enable with
+        `pedometer_enable` before calling. The 16-bit counter wraps from 65535 back to 0;
+        `adafruit_lsm6ds.pedometer.StepCounter` keeps a total that does not"""
+        if self._supports_embedded_functions:
+            raw = self._raw_buffer
+            with self._embedded_bank as bank:
+                bank.readinto(_LSM6DS_EMB_STEP_COUNTER, raw, 0, 2)
+            return raw[0] | raw[1] << 8
+        return self._step_counter
+
+    @property
+    def fifo_pedometer(self) -> bool:
+        """Whether the step counter is batched in the FIFO. Each detected step then stores a
+        ``FIFOTag.STEP_COUNTER`` word holding `pedometer_steps` and the `timestamp` of the
+        step, so the steps can be read in bursts with `read_fifo` instead of by polling.
+        Enable `timestamp_enabled` for the timestamps to count"""
+        self._check_fifo()
+        with self._embedded_bank as bank:
+            return bool(bank.read(_LSM6DS_EMB_FUNC_FIFO_CFG, 1)[0] & _EMB_FUNC_FIFO_CFG_PEDO)
+
+    @fifo_pedometer.setter
+    def fifo_pedometer(self, value: bool) -> None:
+        self._check_fifo()
+        with self._embedded_bank as bank:
+            bank.write(_LSM6DS_EMB_FUNC_FIFO_CFG, (_EMB_FUNC_FIFO_CFG_PEDO if value else 0,))
+
+    def route_step_interrupts(self, int1: bool = False, int2: bool = False) -> None:
+        """Route the pedometer's step detector to the INT1 and INT2 pins, so the pin pulses at
+        each detected step. The pulse is short, so wait for it with a ``countio.Counter`` or
+        an edge triggered callable rather than a ``digitalio.DigitalInOut``. Parts without
+        embedded functions can only route the step detector to INT1.
+
+        :param bool int1: Whether to route the step detector to INT1. Defaults to `False`
+        :param bool int2: Whether to route the step detector to INT2. Defaults to `False`
+        """
+        if self._supports_embedded_functions:
+            self._route_embedded_interrupts(
+                _LSM6DS_EMB_FUNC_INT1,
+                _EMB_FUNC_INT_STEP_DETECTOR if int1 else 0,
+                _EMB_FUNC_INT_STEP_DETECTOR if int2 else 0,
+                _EMB_FUNC_INT_STEP_DETECTOR,
+            )
+            return
+        if int2:
+            raise RuntimeError(
+                "%s can only route the step detector to INT1" % self.__class__.__name__
+            )
+        self._int1_step_detector = int1
+
     @property
     def high_pass_filter(self) -> int:
         """The high pass filter applied to accelerometer data"""
@@ -399,34 +1483,988 @@ class LSM6DS:
 
         return temp / _TEMPERATURE_SENSITIVITY + _TEMPERATURE_OFFSET
 
-    def _set_embedded_functions(self, enable, emb_ab=None):
-        """Enable/disable embedded functions - returns prior settings when disabled"""
-        self._mem_bank = 1
-        if enable:
-            self._emb_func_en_a = emb_ab[0]
-            self._emb_func_en_b = emb_ab[1]
+    def calibrate(self, samples: int = 100) -> bytes:
+        """Measure the accelerometer and gyro bias while the sensor is held still and level,
+        with one axis pointing straight up or down, and apply the correction.
+
+        The accelerometer bias, apart from 1 g of gravity along the axis closest to vertical,
+        is written to the X/Y/Z_OFS_USR registers on parts that have them, so the sensor
+        removes it from every sample itself. The gyro bias, and the accelerometer bias on
+        other parts, is subtracted from the raw readings before scaling. Both sensors must be
+        running, and the current data rates are used.
+
+        Returns the new `calibration`, which can be stored and restored later.
+
+        :param int samples: The number of samples to average. Defaults to 100
+        """
+        accel_rate = Rate.string[self.accelerometer_data_rate]
+        gyro_rate = Rate.string[self.gyro_data_rate]
+        if not accel_rate or not gyro_rate:
+            raise RuntimeError("Both the accelerometer and the gyro must be running")
+        self.clear_calibration()
+        accel_lsb = self._accel_lsb[self._cached_accel_range]
+        gyro_lsb = self._gyro_lsb[self._cached_gyro_range]
+
+        accel_sum = [0, 0, 0]
+        gyro_sum = [0, 0, 0]
+        accel_count = gyro_count = 0
+        poll_interval = 1 / max(accel_rate, gyro_rate)
+        while accel_count < samples or gyro_count < samples:
+            sleep(poll_interval)
+            raw = self._raw_all_data
+            if raw[0] & _STATUS_XLDA and accel_count < samples:
+                accel_count += 1
+                for i in range(3):
+                    accel_sum[i] += raw[5 + i]
+            if raw[0] & _STATUS_GDA and gyro_count < samples:
+                gyro_count += 1
+                for i in range(3):
+                    gyro_sum[i] += raw[2 + i]
+
+        accel_bias = [total * accel_lsb / samples for total in accel_sum]
+        vertical = max(range(3), key=lambda i: abs(accel_bias[i]))
+        accel_bias[vertical] -= 1000 if accel_bias[vertical] > 0 else -1000
+        gyro_bias = [total * gyro_lsb / samples for total in gyro_sum]
+        self._apply_calibration(accel_bias, gyro_bias)
+        return self.calibration
+
+    @property
+    def calibration(self) -> bytes:
+        """The accelerometer and gyro bias measured by `calibrate`, packed into a small
+        binary blob that can be saved to a file or NVM. Set it to a saved blob to restore the
+        calibration without measuring it again"""
+        return struct.pack(
+            _CALIBRATION_FORMAT, _CALIBRATION_VERSION, *self._accel_bias, *self._gyro_bias
+        )
+
+    @calibration.setter
+    def calibration(self, blob: ReadableBuffer) -> None:
+        if len(blob) != struct.calcsize(_CALIBRATION_FORMAT) or blob[0] != _CALIBRATION_VERSION:
+            raise AttributeError("calibration must be a blob returned by `calibrate`")
+        values = struct.unpack(_CALIBRATION_FORMAT, blob)
+        self._apply_calibration(values[1:4], values[4:7])
+
+    def clear_calibration(self) -> None:
+        """Remove the accelerometer and gyro bias corrections"""
+        self._set_biases((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+        if self._supports_user_offset:
+            self._user_offsets = (0, 0, 0)
+
+    def _set_biases(self, accel_bias: Tuple, gyro_bias: Tuple) -> None:
+        self._accel_bias = tuple(accel_bias)
+        self._gyro_bias = tuple(gyro_bias)
+        if self._cached_accel_range is not None:
+            self._cache_accel_range(self._cached_accel_range)
+        if self._cached_gyro_range is not None:
+            self._cache_gyro_range(self._cached_gyro_range)
+
+    def _apply_calibration(self, accel_bias: Tuple, gyro_bias: Tuple) -> None:
+        self._set_biases(accel_bias, gyro_bias)
+        if not self._supports_user_offset:
+            return
+        largest = max(abs(bias) for bias in accel_bias)
+        coarse = largest > 127 * _USER_OFFSET_WEIGHT_FINE
+        weight = _USER_OFFSET_WEIGHT_COARSE if coarse else _USER_OFFSET_WEIGHT_FINE
+        # the registers are subtracted from the measured acceleration
+        self._user_offsets = tuple(max(-128, min(127, round(bias / weight))) for bias in accel_bias)
+        self._usr_off_w = coarse
+        if self._supports_tagged_fifo:
+            # the LSM6DSO family only applies the offsets to the output registers when asked
+            self._usr_off_on_out = True
+
+    def stats(self) -> dict:
+        """A snapshot of the bus usage counted since the sensor was created or `reset_stats`
+        was called. Requires ``instrument=True``.
+
+        Returns a dictionary with the ``"transactions"``, ``"bytes_read"``, ``"bytes_written"``
+        and ``"time"``, in seconds, of all transactions, and the same counters per register
+        address under ``"registers"`` and, while `stats_per_method` is set, per public method
+        or property under ``"methods"``.
+        """
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            raise RuntimeError("Create the sensor with instrument=True to collect stats")
+        stats = _stats_entry(instrumentation.totals)
+        stats["registers"] = {
+            register: _stats_entry(counters)
+            for register, counters in instrumentation.registers.items()
+        }
+        stats["methods"] = {
+            method: _stats_entry(counters) for method, counters in instrumentation.methods.items()
+        }
+        return stats
+
+    def reset_stats(self) -> None:
+        """Set the counters reported by `stats` back to zero"""
+        if self._instrumentation is None:
+            raise RuntimeError("Create the sensor with instrument=True to collect stats")
+        self._instrumentation.reset()
+
+    @property
+    def stats_per_method(self) -> bool:
+        """When `True`, `stats` also counts the bus usage per public method or property.
+        Transactions are attributed to the outermost public method that made them, so the
+        method counters show the full cost of each call. Finding that method walks the call
+        stack on every transaction, so it is off by default, and it only works where the
+        stack can be inspected, which excludes CircuitPython. Requires ``instrument=True``"""
+        return self._instrumentation is not None and self._instrumentation.per_method
+
+    @stats_per_method.setter
+    def stats_per_method(self, value: bool) -> None:
+        if self._instrumentation is None:
+            raise RuntimeError("Create the sensor with instrument=True to collect stats")
+        self._instrumentation.per_method = bool(value)
+
+    def _check_fifo(self) -> None:
+        if not self._supports_tagged_fifo:
+            raise RuntimeError("%s does not have a tagged FIFO" % self.__class__.__name__)
+
+    @property
+    def fifo_mode(self) -> int:
+        """The operating mode of the FIFO. Must be a ``FIFOMode``. Setting ``FIFOMode.BYPASS``
+        stops batching and empties the FIFO"""
+        self._check_fifo()
+        return self._fifo_mode
+
+    @fifo_mode.setter
+    def fifo_mode(self, value: int) -> None:
+        self._check_fifo()
+        if not FIFOMode.is_valid(value):
+            raise AttributeError("fifo_mode must be a `FIFOMode`")
+        self._fifo_mode = value
+        if value == FIFOMode.BYPASS:
+            self._fifo_previous = [None, None, None]
+
+    @property
+    def fifo_watermark(self) -> int:
+        """The number of FIFO words, from 0 to 511, at which the FIFO watermark flag is set"""
+        self._check_fifo()
+        return self._fifo_watermark
+
+    @fifo_watermark.setter
+    def fifo_watermark(self, value: int) -> None:
+        self._check_fifo()
+        if not 0 <= value <= 511:
+            raise AttributeError("fifo_watermark must be between 0 and 511")
+        self._fifo_watermark = value
+
+    @property
+    def fifo_stop_on_watermark(self) -> bool:
+        """When `True` the FIFO depth is limited to ``fifo_watermark`` words"""
+        self._check_fifo()
+        return self._fifo_stop_on_wtm
+
+    @fifo_stop_on_watermark.setter
+    def fifo_stop_on_watermark(self, value: bool) -> None:
+        self._check_fifo()
+        self._fifo_stop_on_wtm = value
+
+    @property
+    def fifo_compression(self) -> bool:
+        """Whether the accelerometer and gyro samples are compressed in the FIFO. Samples that
+        differ little from the previous one are stored as 8-bit differences, two per word, or
+        5-bit differences, three per word, cutting the FIFO words to read by up to three times.
+        `read_fifo` and `read_fifo_arrays` decode them back into full samples.
+
+        Set `fifo_mode` to ``FIFOMode.BYPASS`` before changing it, so that the FIFO does not
+        hold samples of both formats"""
+        self._check_fifo()
+        return self._fifo_compression_rt
+
+    @fifo_compression.setter
+    def fifo_compression(self, value: bool) -> None:
+        self._check_fifo()
+        self._enable_embedded_function(_EMB_FUNC_EN_B_FIFO_COMPR, value, _LSM6DS_EMB_FUNC_EN_B)
+        self._fifo_compression_rt = value
+        self._fifo_previous = [None, None, None]
+
+    @property
+    def fifo_uncompressed_rate(self) -> int:
+        """With `fifo_compression`, force an uncompressed sample every 8, 16 or 32 batched
+        samples, bounding how long a corrupted or missed word affects the decoded samples.
+        0, the default, only stores uncompressed samples when the differences are too large"""
+        self._check_fifo()
+        return _FIFO_UNCOMPRESSED_RATES[self._fifo_uncompressed_rate]
+
+    @fifo_uncompressed_rate.setter
+    def fifo_uncompressed_rate(self, value: int) -> None:
+        self._check_fifo()
+        if value not in _FIFO_UNCOMPRESSED_RATES:
+            raise AttributeError("fifo_uncompressed_rate must be 0, 8, 16 or 32")
+        self._fifo_uncompressed_rate = _FIFO_UNCOMPRESSED_RATES.index(value)
+
+    @property
+    def fifo_accel_batch_rate(self) -> int:
+        """The rate at which accelerometer samples are stored in the FIFO. Must be a ``Rate``.
+        ``Rate.RATE_SHUTDOWN`` disables accelerometer batching"""
+        self._check_fifo()
+        return self._fifo_accel_bdr
+
+    @fifo_accel_batch_rate.setter
+    def fifo_accel_batch_rate(self, value: int) -> None:
+        self._check_fifo()
+        if not Rate.is_valid(value):
+            raise AttributeError("fifo_accel_batch_rate must be a `Rate`")
+        self._fifo_accel_bdr = value
+
+    @property
+    def fifo_gyro_batch_rate(self) -> int:
+        """The rate at which gyro samples are stored in the FIFO. Must be a ``Rate``.
+        ``Rate.RATE_SHUTDOWN`` disables gyro batching. ``Rate.RATE_1_6_HZ`` selects 6.5 Hz
+        for the gyro"""
+        self._check_fifo()
+        return self._fifo_gyro_bdr
+
+    @fifo_gyro_batch_rate.setter
+    def fifo_gyro_batch_rate(self, value: int) -> None:
+        self._check_fifo()
+        if not Rate.is_valid(value):
+            raise AttributeError("fifo_gyro_batch_rate must be a `Rate`")
+        self._fifo_gyro_bdr = value
+
+    @property
+    def fifo_temperature_batch_rate(self) -> int:
+        """The rate at which temperature samples are stored in the FIFO: 0 disables temperature
+        batching, 1 selects 1.6 Hz, 2 selects 12.5 Hz and 3 selects 52 Hz"""
+        self._check_fifo()
+        return self._fifo_temp_bdr
+
+    @fifo_temperature_batch_rate.setter
+    def fifo_temperature_batch_rate(self, value: int) -> None:
+        self._check_fifo()
+        if not 0 <= value <= 3:
+            raise AttributeError("fifo_temperature_batch_rate must be between 0 and 3")
+        self._fifo_temp_bdr = value
+
+    @property
+    def fifo_count(self) -> int:
+        """The number of unread words in the FIFO"""
+        self._check_fifo()
+        return self._fifo_status & _FIFO_DIFF_MASK
+
+    @property
+    def fifo_watermark_reached(self) -> bool:
+        """`True` if the number of unread FIFO words is at or above ``fifo_watermark``"""
+        self._check_fifo()
+        return bool(self._fifo_status & _FIFO_WTM_IA)
+
+    @property
+    def fifo_overrun(self) -> bool:
+        """`True` if the FIFO is full and at least one sample has been overwritten"""
+        self._check_fifo()
+        return bool(self._fifo_status & _FIFO_OVR_IA)
+
+    def read_fifo(self, max_words: Optional[int] = None) -> Iterator[Tuple[int, object]]:
+        """Drain the FIFO, yielding a ``(tag, data)`` tuple for each word.
+
+        The words available when the call is made are read in multi-word bursts. ``tag`` is a
+        ``FIFOTag``. For ``FIFOTag.ACCEL`` and ``FIFOTag.GYRO`` ``data`` is an x, y, z 3-tuple
+        scaled like `acceleration` and `gyro`, for ``FIFOTag.TEMPERATURE`` it is the temperature
+        in Celsius, for ``FIFOTag.TIMESTAMP`` it is the `timestamp` in seconds at which the
+        following batch was stored, for ``FIFOTag.STEP_COUNTER`` it is a
+        ``(pedometer_steps, timestamp)`` tuple and for any other tag it is the raw 3-tuple of
+        signed 16-bit values. With `fifo_compression`, each compressed word is decoded into
+        the one to three ``FIFOTag.ACCEL`` or ``FIFOTag.GYRO`` samples it holds.
+
+        :param int max_words: The maximum number of words to read. Defaults to all available
+        """
+        for buf, length in self._read_fifo_bursts(max_words):
+            for offset in range(0, length, _FIFO_WORD_SIZE):
+                tag = buf[offset] >> 3
+                if _FIFO_TAG_ACCEL_NC_T_2 <= tag <= _FIFO_TAG_GYRO_3XC:
+                    sensor, samples = self._decompress_fifo_word(buf, offset)
+                    if sensor == FIFOTag.ACCEL:
+                        for raw in samples:
+                            yield sensor, self._convert_accel(raw[0], raw[1], raw[2])
+                    else:
+                        for raw in samples:
+                            yield sensor, self._convert_gyro(raw[0], raw[1], raw[2])
+                else:
+                    yield self._decode_fifo_word(buf, offset)
+
+    def read_fifo_arrays(self, max_words: Optional[int] = None) -> Tuple[object, object]:
+        """Drain the FIFO like `read_fifo`, returning the accelerometer and gyro samples as
+        two arrays instead of one tuple per word. Words with other tags are discarded.
+
+        The raw samples of each sensor are gathered into one buffer, then decoded with
+        ``frombuffer`` and scaled with a single multiply when ``ulab`` or ``numpy`` is
+        available, giving ``N x 3`` arrays of floats in m / s ^ 2 and radians / second.
+        Otherwise each is a flat ``array("f")`` of x, y, z values. `fixed_point` does not
+        apply to these arrays.
+
+        :param int max_words: The maximum number of words to read. Defaults to all available
+        """
+        accel = bytearray()
+        gyro = bytearray()
+        for buf, length in self._read_fifo_bursts(max_words):
+            for offset in range(0, length, _FIFO_WORD_SIZE):
+                tag = buf[offset] >> 3
+                if tag == FIFOTag.ACCEL:
+                    accel.extend(buf[offset + 1 : offset + _FIFO_WORD_SIZE])
+                elif tag == FIFOTag.GYRO:
+                    gyro.extend(buf[offset + 1 : offset + _FIFO_WORD_SIZE])
+                elif _FIFO_TAG_ACCEL_NC_T_2 <= tag <= _FIFO_TAG_GYRO_3XC:
+                    sensor = FIFOTag.ACCEL if tag < _FIFO_TAG_GYRO_NC_T_2 else FIFOTag.GYRO
+                    data = accel if sensor == FIFOTag.ACCEL else gyro
+                    if data:
+                        self._fifo_previous[sensor] = struct.unpack_from(
+                            "<hhh", data, len(data) - 6
+                        )
+                    for raw in self._decompress_fifo_word(buf, offset)[1]:
+                        data.extend(struct.pack("<hhh", *raw))
+        for sensor, data in ((FIFOTag.ACCEL, accel), (FIFOTag.GYRO, gyro)):
+            if data:
+                self._fifo_previous[sensor] = struct.unpack_from("<hhh", data, len(data) - 6)
+        return (
+            _xyz_array(accel, self._accel_scale, self._accel_offset),
+            _xyz_array(gyro, self._gyro_scale, self._gyro_offset),
+        )
+
+    def _read_fifo_bursts(self, max_words: Optional[int]) -> Iterator[Tuple[bytearray, int]]:
+        """Read the available FIFO words, yielding the burst buffer and its length in bytes"""
+        self._check_fifo()
+        remaining = self.fifo_count
+        if max_words is not None:
+            remaining = min(remaining, max_words)
+        buf = self._fifo_buffer
+        while remaining:
+            words = min(remaining, _FIFO_BURST_WORDS)
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(self._fifo_cmd, buf, in_end=words * _FIFO_WORD_SIZE)
+            remaining -= words
+            yield buf, words * _FIFO_WORD_SIZE
+
+    def _decode_fifo_word(self, buf: bytearray, offset: int) -> Tuple[int, object]:
+        tag = buf[offset] >> 3
+        raw = struct.unpack_from("<hhh", buf, offset + 1)
+        if tag == FIFOTag.ACCEL:
+            self._fifo_previous[tag] = raw
+            return tag, self._convert_accel(raw[0], raw[1], raw[2])
+        if tag == FIFOTag.GYRO:
+            self._fifo_previous[tag] = raw
+            return tag, self._convert_gyro(raw[0], raw[1], raw[2])
+        if tag == FIFOTag.TEMPERATURE:
+            return tag, raw[0] / _TEMPERATURE_SENSITIVITY + _TEMPERATURE_OFFSET
+        if tag == FIFOTag.TIMESTAMP:
+            return tag, self._timestamp_seconds(struct.unpack_from("<I", buf, offset + 1)[0])
+        if tag == FIFOTag.STEP_COUNTER:
+            steps, timestamp = struct.unpack_from("<HI", buf, offset + 1)
+            return tag, (steps, self._timestamp_seconds(timestamp))
+        return tag, raw
+
+    def _decompress_fifo_word(
+        self, buf: bytearray, offset: int
+    ) -> Tuple[int, List[Tuple[int, int, int]]]:
+        """Decode a compressed FIFO word into ``(tag, samples)``, where ``tag`` is
+        ``FIFOTag.ACCEL`` or ``FIFOTag.GYRO`` and ``samples`` holds the raw samples, oldest
+        first. NC_T_2 and NC_T_1 words hold one uncompressed sample, 2xC and 3xC words hold
+        two or three differences from the previous sample and are skipped until one is known"""
+        tag = buf[offset] >> 3
+        sensor = FIFOTag.ACCEL if tag < _FIFO_TAG_GYRO_NC_T_2 else FIFOTag.GYRO
+        kind = (tag - _FIFO_TAG_ACCEL_NC_T_2) & 0x03
+        if kind < _FIFO_COMPRESSION_2XC:
+            raw = struct.unpack_from("<hhh", buf, offset + 1)
+            self._fifo_previous[sensor] = raw
+            return sensor, [raw]
+        previous = self._fifo_previous[sensor]
+        if previous is None:
+            return sensor, []
+        if kind == _FIFO_COMPRESSION_3XC:
+            diffs = []
+            for packed in struct.unpack_from("<HHH", buf, offset + 1):
+                for shift in (0, 5, 10):
+                    diff = packed >> shift & 0x1F
+                    diffs.append(diff - 0x20 if diff & 0x10 else diff)
         else:
-            emb_a = self._emb_func_en_a
-            emb_b = self._emb_func_en_b
-            self._emb_func_en_a = (emb_a[0] & 0xC7,)
-            self._emb_func_en_b = (emb_b[0] & 0xE6,)
-            emb_ab = (emb_a, emb_b)
+            diffs = struct.unpack_from("<bbbbbb", buf, offset + 1)
+        x, y, z = previous
+        samples = []
+        for i in range(0, len(diffs), 3):
+            x += diffs[i]
+            y += diffs[i + 1]
+            z += diffs[i + 2]
+            samples.append((x, y, z))
+        self._fifo_previous[sensor] = samples[-1]
+        return sensor, samples
+
+    def _check_timestamp(self) -> None:
+        if not self._supports_timestamp:
+            raise RuntimeError("%s does not have a timestamp counter" % self.__class__.__name__)
+
+    @property
+    def timestamp_enabled(self) -> bool:
+        """Whether the on-chip timestamp counter is running"""
+        self._check_timestamp()
+        return self._timestamp_enable
+
+    @timestamp_enabled.setter
+    def timestamp_enabled(self, value: bool) -> None:
+        self._check_timestamp()
+        self._timestamp_enable = value
+        self._timestamp_running = bool(value)
+
+    @property
+    def timestamp_resolution(self) -> float:
+        """The duration of one timestamp counter tick in seconds: nominally 25 us, corrected
+        with the sensor's factory trimmed INTERNAL_FREQ_FINE value"""
+        self._check_timestamp()
+        if self._timestamp_lsb is None:
+            freq_fine = self._internal_freq_fine
+            self._timestamp_lsb = 1 / (
+                _TIMESTAMP_FREQUENCY * (1 + _TIMESTAMP_FREQ_FINE_STEP * freq_fine)
+            )
+        return self._timestamp_lsb
+
+    @property
+    def timestamp(self) -> float:
+        """The time in seconds since the timestamp counter was enabled or reset. The 32-bit
+        counter wraps after about 30 hours; this is extended across wraps as long as it, or a
+        FIFO timestamp, is read at least once between them"""
+        self._check_timestamp()
+        return self._timestamp_seconds(self._raw_timestamp)
+
+    def reset_timestamp(self) -> None:
+        """Restart the timestamp counter from zero"""
+        self._check_timestamp()
+        self._timestamp_reset = _TIMESTAMP_RESET
+        self._timestamp_ticks = 0
+        self._timestamp_last = 0
+
+    def _timestamp_seconds(self, raw: int) -> float:
+        # extend the 32-bit counter; readings up to half a wrap older than the newest one seen,
+        # such as FIFO timestamps, are placed before it rather than counted as a wrap
+        delta = (raw - self._timestamp_last) & 0xFFFFFFFF
+        if delta & 0x80000000:
+            delta -= 0x100000000
+        ticks = self._timestamp_ticks + delta
+        if delta > 0:
+            self._timestamp_ticks = ticks
+            self._timestamp_last = raw
+        return ticks * self.timestamp_resolution
+
+    @property
+    def fifo_timestamp_decimation(self) -> int:
+        """How often a ``FIFOTag.TIMESTAMP`` word is stored in the FIFO: 0 never, 1 with every
+        batch, 2 every 8 batches and 3 every 32 batches. Requires `timestamp_enabled`"""
+        self._check_fifo()
+        return self._fifo_ts_decimation
+
+    @fifo_timestamp_decimation.setter
+    def fifo_timestamp_decimation(self, value: int) -> None:
+        self._check_fifo()
+        if not 0 <= value <= 3:
+            raise AttributeError("fifo_timestamp_decimation must be between 0 and 3")
+        self._fifo_ts_decimation = value
+
+    @property
+    def int1_sources(self) -> int:
+        """The signals routed to the INT1 pin, as a combination of ``InterruptSource``
+        values. The FIFO signals are only available on parts with a tagged FIFO"""
+        return self._int1_ctrl & _INTERRUPT_SOURCE_MASK
+
+    @int1_sources.setter
+    def int1_sources(self, value: int) -> None:
+        if value & ~_INTERRUPT_SOURCE_MASK:
+            raise AttributeError("int1_sources must be a combination of `InterruptSource`")
+        self._int1_ctrl = (self._int1_ctrl & ~_INTERRUPT_SOURCE_MASK) | value
+
+    @property
+    def int2_sources(self) -> int:
+        """The signals routed to the INT2 pin, as a combination of ``InterruptSource``
+        values. The FIFO signals are only available on parts with a tagged FIFO"""
+        return self._int2_ctrl & _INTERRUPT_SOURCE_MASK
+
+    @int2_sources.setter
+    def int2_sources(self, value: int) -> None:
+        if value & ~_INTERRUPT_SOURCE_MASK:
+            raise AttributeError("int2_sources must be a combination of `InterruptSource`")
+        self._int2_ctrl = (self._int2_ctrl & ~_INTERRUPT_SOURCE_MASK) | value
+
+    @staticmethod
+    def wait_for_interrupt(pin: object, timeout: Optional[float] = None) -> bool:
+        """Wait until an interrupt pin is asserted, without any bus traffic.
+
+        ``pin`` can be a ``digitalio.DigitalInOut`` input, which is waited on until it reads
+        high, a ``countio.Counter``, which is waited on until it has counted an edge and is then
+        reset, or a callable taking the timeout and returning `True` if the interrupt occurred,
+        such as a wrapper around a GPIO edge wait. Pins and counters are polled every
+        millisecond; a ``countio.Counter`` also catches pulses shorter than that.
+
+        :param pin: The pin connected to INT1 or INT2
+        :param float timeout: Seconds to wait for. Defaults to waiting forever
+        :return: `True` if the interrupt occurred, `False` on a timeout
+        """
+        if callable(pin):
+            return bool(pin(timeout))
+        deadline = None if timeout is None else monotonic() + timeout
+        counter = hasattr(pin, "count")
+        while not (pin.count if counter else pin.value):
+            if deadline is not None and monotonic() >= deadline:
+                return False
+            sleep(0.001)
+        if counter:
+            pin.reset()
+        return True
+
+    def read_fifo_on_interrupt(
+        self,
+        pin: Union[object, Callable[[Optional[float]], bool]],
+        timeout: Optional[float] = None,
+        max_words: Optional[int] = None,
+    ) -> Iterator[Tuple[int, object]]:
+        """Wait for an interrupt with `wait_for_interrupt`, then drain the FIFO like
+        `read_fifo`. Nothing is read if the wait times out. Route
+        ``InterruptSource.FIFO_WATERMARK`` to the pin so the host only wakes once
+        ``fifo_watermark`` words are available.
+
+        :param pin: The pin connected to INT1 or INT2. See `wait_for_interrupt`
+        :param float timeout: Seconds to wait for. Defaults to waiting forever
+        :param int max_words: The maximum number of words to read. Defaults to all available
+        """
+        if self.wait_for_interrupt(pin, timeout):
+            yield from self.read_fifo(max_words)
+
+    def _check_events(self) -> None:
+        if not self._supports_embedded_functions:
+            raise RuntimeError("%s does not support event detection" % self.__class__.__name__)
+
+    def _update_event_configuration(self, *changes: Tuple[int, int, int]) -> None:
+        """Apply ``(register, mask, value)`` changes to TAP_CFG0..FREE_FALL, which are read and
+        then written back in a single transaction. The basic interrupts are enabled, leaving
+        their latching, set with `latch_events`, as it is"""
+        self._check_events()
+        buf = bytearray(_EVENT_CONFIG_REGISTERS + 1)
+        buf[0] = _LSM6DS_TAP_CFG0
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+        for register, mask, value in changes:
+            index = register - _LSM6DS_TAP_CFG0 + 1
+            buf[index] = buf[index] & ~mask | value & mask
+        buf[_LSM6DS_TAP_CFG - _LSM6DS_TAP_CFG0 + 1] |= _TAP_CFG2_INTERRUPTS_ENABLE
+        with self.i2c_device as i2c:
+            i2c.write(buf)
+
+    def configure_tap(
+        self,
+        threshold: int = 9,
+        double_tap: bool = False,
+        axes: str = "xyz",
+        shock: int = 2,
+        quiet: int = 1,
+        duration: int = 7,
+    ) -> None:
+        """Configure the tap detector, which reports ``Event.SINGLE_TAP`` and, when
+        ``double_tap`` is set, ``Event.DOUBLE_TAP``. The times are in accelerometer samples.
+
+        :param int threshold: The acceleration threshold, from 0 to 31, in steps of 1/32 of
+            the accelerometer range. Defaults to 9
+        :param bool double_tap: Whether to detect double taps as well as single taps.
+            Defaults to `False`
+        :param str axes: The axes to detect taps on. Defaults to ``"xyz"``
+        :param int shock: The maximum length of a tap, from 0 to 3: 4 samples for 0, otherwise
+            8 samples per step. Defaults to 2
+        :param int quiet: The quiet time after a tap, from 0 to 3: 2 samples for 0, otherwise 4
+            samples per step. Defaults to 1
+        :param int duration: The maximum time between the taps of a double tap, from 0 to 15:
+            16 samples for 0, otherwise 32 samples per step. Defaults to 7
+        """
+        if not 0 <= threshold <= 31:
+            raise AttributeError("threshold must be between 0 and 31")
+        if not 0 <= shock <= 3 or not 0 <= quiet <= 3:
+            raise AttributeError("shock and quiet must be between 0 and 3")
+        if not 0 <= duration <= 15:
+            raise AttributeError("duration must be between 0 and 15")
+        enable = 0
+        for axis, bit in (("x", 0x08), ("y", 0x04), ("z", 0x02)):
+            if axis in axes:
+                enable |= bit
+        self._update_event_configuration(
+            (_LSM6DS_TAP_CFG0, 0x0E, enable),
+            (_LSM6DS_TAP_CFG1, 0x1F, threshold),
+            (_LSM6DS_TAP_CFG, 0x1F, threshold),
+            (_LSM6DS_TAP_THS_6D, 0x1F, threshold),
+            (_LSM6DS_INT_DUR2, 0xFF, duration << 4 | quiet << 2 | shock),
+            (_LSM6DS_WAKE_UP_THS, 0x80, 0x80 if double_tap else 0),
+        )
+
+    def configure_free_fall(self, threshold: int = 3, duration: int = 6) -> None:
+        """Configure the free-fall detector, which reports ``Event.FREE_FALL``.
+
+        :param int threshold: The acceleration below which the sensor is falling, from 0 to 7
+            for 156, 219, 250, 312, 344, 406, 469 and 500 mg. Defaults to 3
+        :param int duration: The time the acceleration must stay below the threshold, from 0
+            to 63 accelerometer samples. Defaults to 6
+        """
+        if not 0 <= threshold <= 7:
+            raise AttributeError("threshold must be between 0 and 7")
+        if not 0 <= duration <= 63:
+            raise AttributeError("duration must be between 0 and 63")
+        self._update_event_configuration(
+            (_LSM6DS_FREE_FALL, 0xFF, (duration & 0x1F) << 3 | threshold),
+            (_LSM6DS_WAKE_UP_DUR, 0x80, (duration & 0x20) << 2),
+        )
+
+    def configure_wake_up(self, threshold: int = 2, duration: int = 0) -> None:
+        """Configure the wake-up detector, which reports ``Event.WAKE_UP`` when the
+        high-pass filtered acceleration on any axis exceeds the threshold.
+
+        :param int threshold: The acceleration threshold, from 0 to 63, in steps of 1/64 of
+            the accelerometer range. Defaults to 2
+        :param int duration: The time the threshold must be exceeded for, from 0 to 3
+            accelerometer samples. Defaults to 0
+        """
+        if not 0 <= threshold <= 63:
+            raise AttributeError("threshold must be between 0 and 63")
+        if not 0 <= duration <= 3:
+            raise AttributeError("duration must be between 0 and 3")
+        self._update_event_configuration(
+            (_LSM6DS_WAKE_UP_THS, 0x3F, threshold),
+            (_LSM6DS_WAKE_UP_DUR, 0x70, duration << 5),
+        )
+
+    def configure_orientation(self, threshold: int = 0, four_d: bool = False) -> None:
+        """Configure the orientation detector, which reports ``Event.ORIENTATION`` when the
+        side of the sensor facing up changes.
+
+        :param int threshold: The angle from the vertical at which a side is considered up,
+            from 0 to 3 for 80, 70, 60 and 50 degrees. Defaults to 0
+        :param bool four_d: Ignore the z axis, detecting only portrait and landscape
+            orientations. Defaults to `False`
+        """
+        if not 0 <= threshold <= 3:
+            raise AttributeError("threshold must be between 0 and 3")
+        self._update_event_configuration(
+            (_LSM6DS_TAP_THS_6D, 0xE0, (0x80 if four_d else 0) | threshold << 5),
+        )
+
+    def configure_inactivity(
+        self, mode: int = InactivityMode.GYRO_SLEEP, duration: int = 4
+    ) -> None:
+        """Configure the activity/inactivity detection. When no wake-up has been detected for
+        ``duration``, the sensor lowers its data rates as set by ``mode`` and reports
+        ``Event.SLEEP_CHANGE``. The next wake-up, see `configure_wake_up`, restores the
+        configured data rates and reports ``Event.SLEEP_CHANGE`` again. The sleep state is
+        bit 4 of WAKE_UP_SRC, ``sources[1]`` in `read_events`.
+
+        :param int mode: What to do while inactive. Must be an ``InactivityMode``. Defaults to
+            ``InactivityMode.GYRO_SLEEP``
+        :param int duration: The time without motion before the sensor is inactive, from 0 to
+            15, in steps of 512 accelerometer samples at the active data rate; 0 selects 16
+            samples. Defaults to 4
+        """
+        if not InactivityMode.is_valid(mode):
+            raise AttributeError("mode must be an `InactivityMode`")
+        if not 0 <= duration <= 15:
+            raise AttributeError("duration must be between 0 and 15")
+        self._update_event_configuration(
+            (_LSM6DS_TAP_CFG, 0x60, mode << 5),
+            (_LSM6DS_WAKE_UP_DUR, 0x0F, duration),
+        )
+
+    @property
+    def latch_events(self) -> bool:
+        """Whether the basic events stay flagged, and the pins they are routed to asserted,
+        until `read_events` reads them. Otherwise they only last while the condition is
+        detected, and the pins pulse. The embedded function events are not affected"""
+        self._check_events()
+        return bool(self._tap_latch)
+
+    @latch_events.setter
+    def latch_events(self, latch: bool) -> None:
+        self._check_events()
+        self._update_event_configuration(
+            (
+                _LSM6DS_TAP_CFG0,
+                _TAP_CFG0_LIR | _TAP_CFG0_INT_CLR_ON_READ,
+                _TAP_CFG0_LIR | _TAP_CFG0_INT_CLR_ON_READ if latch else 0,
+            ),
+        )
+
+    @property
+    def tilt_enable(self) -> bool:
+        """Whether the tilt detector, which reports ``Event.TILT``, is enabled"""
+        self._check_events()
+        return self._embedded_function_enabled(_EMB_FUNC_EN_A_TILT)
+
+    @tilt_enable.setter
+    def tilt_enable(self, enable: bool) -> None:
+        self._check_events()
+        self._enable_embedded_function(_EMB_FUNC_EN_A_TILT, enable)
+
+    @property
+    def significant_motion_enable(self) -> bool:
+        """Whether the significant motion detector, which reports
+        ``Event.SIGNIFICANT_MOTION``, is enabled"""
+        self._check_events()
+        return self._embedded_function_enabled(_EMB_FUNC_EN_A_SIGN_MOTION)
+
+    @significant_motion_enable.setter
+    def significant_motion_enable(self, enable: bool) -> None:
+        self._check_events()
+        self._enable_embedded_function(_EMB_FUNC_EN_A_SIGN_MOTION, enable)
+
+    def route_events(self, int1: int = 0, int2: int = 0) -> None:
+        """Route events to the INT1 and INT2 pins. Only the events in ``int1`` or ``int2``
+        change: each is routed to the pins it is given for and removed from the other pin.
+        The routes of other events, such as the step detector routed with
+        `route_step_interrupts`, are left as they are. Set `latch_events` to keep the pins
+        asserted until `read_events` is called.
+
+        :param int int1: The events to route to INT1, as a combination of ``Event`` values.
+            Defaults to none
+        :param int int2: The events to route to INT2, as for ``int1``. Defaults to none
+        """
+        self._set_event_routes(int1 | int2, int1, int2)
+
+    def unroute_events(self, events: int) -> None:
+        """Stop routing ``events`` to the INT1 and INT2 pins, leaving the routes of other
+        events as they are.
+
+        :param int events: A combination of ``Event`` values
+        """
+        self._set_event_routes(events, 0, 0)
+
+    def _set_event_routes(self, events: int, int1: int, int2: int) -> None:
+        """Route the ``events`` in ``int1`` and ``int2`` to those pins and the other
+        ``events`` to neither, without touching the routes of any other event"""
+        self._check_events()
+        if events & ~(_BASIC_EVENT_MASK | _EMBEDDED_EVENT_MASK):
+            raise AttributeError("events must be a combination of `Event`")
+        if events & _BASIC_EVENT_MASK:
+            buf = bytearray(3)
+            buf[0] = _LSM6DS_MD1_CFG
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+            for index, routed in ((1, int1), (2, int2)):
+                for event, bit in _MD_CFG_EVENT_BITS:
+                    if not events & event:
+                        continue
+                    if routed & event:
+                        buf[index] |= bit
+                    else:
+                        buf[index] &= ~bit
+            with self.i2c_device as i2c:
+                i2c.write(buf)
+        embedded = events >> 8 & _EMBEDDED_EVENT_MASK >> 8
+        if embedded:
+            self._route_embedded_interrupts(_LSM6DS_EMB_FUNC_INT1, int1 >> 8, int2 >> 8, embedded)
+
+    def read_events(self, embedded: bool = True) -> Tuple[int, bytearray]:
+        """Read the event sources, clearing the latched events.
+
+        Returns ``(events, sources)``, where ``events`` is the combination of ``Event`` values
+        that occurred and ``sources`` holds ALL_INT_SRC, WAKE_UP_SRC at index 1, TAP_SRC at 2,
+        D6D_SRC at 3 and, when ``embedded`` is set, EMB_FUNC_STATUS_MAINPAGE at 4. ``sources``
+        is reused by the next call.
+
+        The four source registers are read in one burst and EMB_FUNC_STATUS_MAINPAGE in a
+        second read while the bus is held, rather than bursting through the registers in
+        between, since reading STATUS_REG and the outputs would clear their data-ready flags.
+
+        :param bool embedded: Whether to read the step detector, tilt and significant motion
+            events too, which adds a 1-byte read. Defaults to `True`
+        """
+        self._check_events()
+        buf = self._event_buffer
+        cmd = self._cmd
+        with self.i2c_device as i2c:
+            cmd[0] = _LSM6DS_ALL_INT_SRC
+            i2c.write_then_readinto(cmd, buf, out_end=1, in_end=_EVENT_SOURCES)
+            if embedded:
+                cmd[0] = _LSM6DS_EMB_FUNC_STATUS_MAINPAGE
+                i2c.write_then_readinto(
+                    cmd, buf, out_end=1, in_start=_EVENT_SOURCES, in_end=_EVENT_SOURCES_EMBEDDED
+                )
+        events = buf[0] & _BASIC_EVENT_MASK
+        if embedded:
+            events |= buf[_EVENT_SOURCES] << 8 & _EMBEDDED_EVENT_MASK
+        return events, buf
+
+    def _embedded_function_enabled(self, bit: int) -> bool:
+        with self._embedded_bank as bank:
+            return bool(bank.read(_LSM6DS_EMB_FUNC_EN_A, 1)[0] & bit)
+
+    def _enable_embedded_function(
+        self, bit: int, enable: bool, register: int = _LSM6DS_EMB_FUNC_EN_A
+    ) -> None:
+        with self._embedded_bank as bank:
+            enable_ab = bank.read(register, 1)
+            if enable:
+                enable_ab[0] |= bit
+            else:
+                enable_ab[0] &= ~bit
+            bank.write(register, enable_ab)
+
+    def embedded_bank(self) -> _RegisterBank:
+        """Select the embedded function register bank for the duration of a ``with`` block.
+
+        FUNC_CFG_ACCESS is written once when the block is entered and set back to the user
+        bank once when it exits, rather than read and written around every register access.
+        Inside the block, ``read(register, count)``, ``readinto(register, buf, start, end)``
+        and ``write(register, values)`` access consecutive embedded function registers in
+        one transaction each. Blocks do not nest.
+
+        .. code-block:: python
+
+            with sensor.embedded_bank() as bank:
+                enable_a, enable_b = bank.read(0x04, 2)
+        """
+        return self._embedded_bank
+
+    def sensor_hub_bank(self) -> _RegisterBank:
+        """Select the sensor hub register bank for the duration of a ``with`` block. See
+        `embedded_bank`"""
+        return self._sensor_hub_bank
+
+    def _check_sensor_hub(self) -> None:
+        if not self._supports_sensor_hub:
+            raise RuntimeError("%s does not have a sensor hub" % self.__class__.__name__)
+
+    def sensor_hub_write(
+        self, address: int, register: int, value: int, pull_up: bool = False, timeout: float = 0.1
+    ) -> None:
+        """Write a register of a device on the auxiliary I2C bus, the SDx and SCx pins, through
+        slave 0 of the sensor hub. The write happens at the next accelerometer sample, so the
+        accelerometer must be running. This overwrites the configuration of slave 0 and stops
+        the sensor hub: configure the reads with `configure_sensor_hub_read` and call
+        `start_sensor_hub` once the device is set up.
+
+        :param int address: The 7-bit I2C address of the device
+        :param int register: The register to write
+        :param int value: The value to write
+        :param bool pull_up: Enable the internal pull-ups on the auxiliary bus, for boards
+            without external ones. Defaults to `False`
+        :param float timeout: Seconds to wait for the write. Defaults to 0.1
+        """
+        self._check_sensor_hub()
+        with self._sensor_hub_bank as bank:
+            bank.write(_LSM6DS_SLV0_ADD, (address << 1, register, 0))
+            bank.write(_LSM6DS_DATAWRITE_SLV0, (value,))
+            bank.write(
+                _LSM6DS_MASTER_CONFIG,
+                (
+                    _MASTER_CONFIG_MASTER_ON
+                    | _MASTER_CONFIG_WRITE_ONCE
+                    | (_MASTER_CONFIG_SHUB_PU_EN if pull_up else 0),
+                ),
+            )
+        deadline = monotonic() + timeout
+        done = False
+        while not done and monotonic() < deadline:
+            done = bool(self._status_master & _STATUS_MASTER_WR_ONCE_DONE)
+            if not done:
+                sleep(0.001)
+        with self._sensor_hub_bank as bank:
+            bank.write(_LSM6DS_MASTER_CONFIG, (0,))
+        if not done:
+            raise RuntimeError("Sensor hub write timed out, is the accelerometer running?")
+
+    def configure_sensor_hub_read(
+        self, slave: int, address: int, register: int, count: int, batch: bool = False
+    ) -> None:
+        """Make a slave of the sensor hub read ``count`` consecutive registers of a device on
+        the auxiliary I2C bus at each sensor hub cycle. The slaves' data are stored one after
+        the other, in slave order, from SENSOR_HUB_1, and read with `read_sensor_hub_into`.
+
+        :param int slave: The slave, from 0 to 3
+        :param int address: The 7-bit I2C address of the device
+        :param int register: The first register to read
+        :param int count: The number of registers to read, from 1 to 7
+        :param bool batch: Also store the data in the FIFO, as ``FIFOTag.SENSOR_HUB_SLAVE0``
+            to ``FIFOTag.SENSOR_HUB_SLAVE3`` words of 6 bytes. Defaults to `False`
+        """
+        self._check_sensor_hub()
+        if not 0 <= slave < _SENSOR_HUB_SLAVES:
+            raise AttributeError("slave must be between 0 and 3")
+        if not 1 <= count <= _SENSOR_HUB_SLAVE_READS:
+            raise AttributeError("count must be between 1 and 7")
+        with self._sensor_hub_bank as bank:
+            bank.write(
+                _LSM6DS_SLV0_ADD + slave * _SENSOR_HUB_SLAVE_REGISTERS,
+                (
+                    address << 1 | _SLV_ADD_READ,
+                    register,
+                    count | (_SLV_CONFIG_BATCH if batch else 0),
+                ),
+            )
+
+    def start_sensor_hub(self, slaves: int = 1, rate: float = 104, pull_up: bool = False) -> None:
+        """Start the sensor hub, which reads the devices configured with
+        `configure_sensor_hub_read` after each accelerometer sample, so their data are
+        sampled together with the accelerometer and gyro without any host bus traffic.
+
+        :param int slaves: The number of slaves to run, from 1 to 4, starting with slave 0.
+            Defaults to 1
+        :param float rate: The sensor hub rate in Hz: 104, 52, 26 or 12.5, capped at the
+            accelerometer data rate. Defaults to 104
+        :param bool pull_up: Enable the internal pull-ups on the auxiliary bus, for boards
+            without external ones. Defaults to `False`
+        """
+        self._check_sensor_hub()
+        if not 1 <= slaves <= _SENSOR_HUB_SLAVES:
+            raise AttributeError("slaves must be between 1 and 4")
+        if rate not in _SENSOR_HUB_RATES:
+            raise AttributeError("rate must be 104, 52, 26 or 12.5")
+        with self._sensor_hub_bank as bank:
+            config = bank.read(_LSM6DS_SLV0_CONFIG, 1)
+            config[0] = config[0] & ~_SLV0_CONFIG_SHUB_ODR_MASK | _SENSOR_HUB_RATES.index(rate) << 6
+            bank.write(_LSM6DS_SLV0_CONFIG, config)
+            bank.write(
+                _LSM6DS_MASTER_CONFIG,
+                (
+                    slaves - 1
+                    | _MASTER_CONFIG_MASTER_ON
+                    | (_MASTER_CONFIG_SHUB_PU_EN if pull_up else 0),
+                ),
+            )
 
-        self._mem_bank = 0
+    def stop_sensor_hub(self) -> None:
+        """Stop the sensor hub"""
+        self._check_sensor_hub()
+        with self._sensor_hub_bank as bank:
+            bank.write(_LSM6DS_MASTER_CONFIG, (0,))
+
+    def read_sensor_hub_into(
+        self, buf: WriteableBuffer, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Read the sensor hub outputs, from SENSOR_HUB_1, into ``buf[start:end]`` in a single
+        burst. At most 18 bytes can be read.
+
+        :param buf: The buffer to read into
+        :param int start: The first index of ``buf`` to fill. Defaults to 0
+        :param int end: The index of ``buf`` to stop at. Defaults to the end of ``buf``
+        """
+        self._check_sensor_hub()
+        if (len(buf) if end is None else end) - start > _SENSOR_HUB_OUTPUTS:
+            raise AttributeError("At most 18 sensor hub outputs can be read")
+        with self._sensor_hub_bank as bank:
+            bank.readinto(_LSM6DS_SENSOR_HUB_1, buf, start, end)
+
+    def _set_embedded_functions(self, enable, emb_ab=None):
+        """Enable/disable embedded functions - returns prior settings when disabled"""
+        with self._embedded_bank as bank:
+            if enable:
+                bank.write(_LSM6DS_EMB_FUNC_EN_A, emb_ab)
+            else:
+                emb_ab = bank.read(_LSM6DS_EMB_FUNC_EN_A, 2)
+                bank.write(_LSM6DS_EMB_FUNC_EN_A, (emb_ab[0] & 0xC7, emb_ab[1] & 0xE6))
         return emb_ab
 
     def load_mlc(self, ucf):
-        """Load MLC configuration file into sensor"""
-        buf = bytearray(2)
+        """Load MLC configuration file into sensor.
+
+        ``ucf`` is the path of a UCF text file or of a file compiled with
+        `adafruit_lsm6ds.ucf.compile_ucf`, or compiled data as bytes. Compiled files load
+        faster and need less memory. Writes to consecutive registers are sent as one
+        auto-increment write and ``WAIT`` lines are honoured"""
+        from .ucf import ucf_commands  # noqa: PLC0415, loaded only when the MLC is used
+
         with self.i2c_device as i2c:
-            # Load MLC config from file
-            with open(ucf) as ucf_file:
-                for line in ucf_file:
-                    if line.startswith("Ac"):
-                        command = [int(v, 16) for v in line.strip().split(" ")[1:3]]
-                        buf[0] = command[0]
-                        buf[1] = command[1]
-                        i2c.write(buf)
+            for buf, end in ucf_commands(ucf):
+                if buf is None:
+                    sleep(end / 1000)
+                else:
+                    i2c.write(buf, end=end)
 
         # Disable embudded function -- save current settings
         emb_ab = self._set_embedded_functions(False)
@@ -438,9 +2476,8 @@ class LSM6DS:
         self._block_data_enable = 1
 
         # Route signals on interrupt pin 1
-        self._mem_bank = 1
-        self._route_int1 &= 1
-        self._mem_bank = 0
+        with self._embedded_bank:
+            self._route_int1 &= 1
 
         # Configure interrupt pin mode
         self._tap_latch = 1
@@ -449,11 +2486,98 @@ class LSM6DS:
         # Enabble Embedded Functions using previously stored settings
         self._set_embedded_functions(True, emb_ab)
 
+    def route_mlc_interrupts(self, int1: int = 0, int2: int = 0) -> None:
+        """Route the machine learning core decision trees to the INT1 and INT2 pins, so
+        the pin signals when a tree's output changes.
+
+        :param int int1: The trees to route to INT1, as a bit mask where bit 0 is the first
+            tree. Defaults to none
+        :param int int2: The trees to route to INT2, as for ``int1``. Defaults to none
+        """
+        self._route_embedded_interrupts(_LSM6DS_EMB_MLC_INT1, int1, int2, 0xFF)
+
+    def _route_embedded_interrupts(self, register: int, int1: int, int2: int, mask: int) -> None:
+        """Set the ``mask`` bits of an embedded function's INT1 routing ``register`` and of the
+        matching INT2 register, then enable the embedded function interrupts on the pins that
+        have any embedded function routed to them"""
+        with self._embedded_bank as bank:
+            routes = bank.read(_LSM6DS_EMB_FUNC_INT1, _EMB_ROUTING_REGISTERS)
+            index = register - _LSM6DS_EMB_FUNC_INT1
+            routes[index] = routes[index] & ~mask | int1 & mask
+            index += _EMB_ROUTING_REGISTERS // 2
+            routes[index] = routes[index] & ~mask | int2 & mask
+            bank.write(_LSM6DS_EMB_FUNC_INT1, routes)
+        self._int1_emb_func = any(routes[: _EMB_ROUTING_REGISTERS // 2])
+        self._int2_emb_func = any(routes[_EMB_ROUTING_REGISTERS // 2 :])
+
+    def read_mlc_changes(self) -> list:
+        """Read the outputs of the machine learning core decision trees that have new
+        results, returning a list of ``(timestamp, tree, value)`` events for the trees whose
+        output changed, where ``tree`` counts from 0.
+
+        When nothing is new this is a single read of MLC_STATUS. Otherwise the embedded
+        function bank is selected once, the flagged trees are read in one burst and the
+        latched status is cleared. ``timestamp`` is `timestamp` when `timestamp_enabled` is
+        set, read right after MLC_STATUS while holding the bus, and `time.monotonic`
+        otherwise.
+        """
+        buf = self._mlc_status_buffer
+        outputs = self._mlc_outputs
+        previous = self._mlc_previous
+        cmd = self._cmd
+        with self.i2c_device as i2c:
+            cmd[0] = _LSM6DS_MLC_STATUS
+            i2c.write_then_readinto(cmd, buf, in_end=1)
+            if buf[0] and self._timestamp_running:
+                # a separate read, as a burst from MLC_STATUS would also read FIFO_STATUS2,
+                # clearing its latched overrun flag
+                cmd[0] = _LSM6DS_TIMESTAMP0
+                i2c.write_then_readinto(cmd, buf, in_start=1)
+        status = buf[0]
+        if not status:
+            return []
+        first = 0
+        while not status & 1 << first:
+            first += 1
+        last = 7
+        while not status & 1 << last:
+            last -= 1
+        for tree in range(first, last + 1):
+            previous[tree] = outputs[tree]
+        with self._embedded_bank as bank:
+            # reading the embedded MLC_STATUS clears a latched interrupt
+            bank.readinto(_LSM6DS_EMB_MLC_STATUS, cmd)
+            bank.readinto(_LSM6DS_MLC0_SRC + first, outputs, first, last + 1)
+        if self._timestamp_running:
+            timestamp = self._timestamp_seconds(struct.unpack_from("<I", buf, 1)[0])
+        else:
+            timestamp = monotonic()
+        return [
+            (timestamp, tree, outputs[tree])
+            for tree in range(first, last + 1)
+            if status & 1 << tree and outputs[tree] != previous[tree]
+        ]
+
+    def read_mlc_on_interrupt(
+        self,
+        pin: Union[object, Callable[[Optional[float]], bool]],
+        timeout: Optional[float] = None,
+    ) -> list:
+        """Wait for an interrupt with `wait_for_interrupt`, then return `read_mlc_changes`.
+        Returns an empty list if the wait times out. Route the trees to the pin with
+        `route_mlc_interrupts` first.
+
+        :param pin: The pin connected to INT1 or INT2. See `wait_for_interrupt`
+        :param float timeout: Seconds to wait for. Defaults to waiting forever
+        """
+        if self.wait_for_interrupt(pin, timeout):
+            return self.read_mlc_changes()
+        return []
+
     def read_mlc_output(self):
         """Read MLC results"""
         buf = None
         if self._mlc_status:
-            self._mem_bank = 1
-            buf = self._mlc0_src
-            self._mem_bank = 0
+            with self._embedded_bank:
+                buf = self._mlc0_src
         return buf
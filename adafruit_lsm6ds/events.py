@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.events`
+================================================================================
+
+Calls functions when the sensor's event detectors report taps, free-falls, wake-ups,
+orientation changes, tilts or significant motion, so the host can wait for events instead
+of streaming samples to detect them itself
+
+Each `EventDispatcher.poll` reads every event source the callbacks need in one burst with
+`adafruit_lsm6ds.LSM6DS.read_events`.
+
+.. code-block:: python
+
+    def tapped(event, source):
+        print("double tap" if event == Event.DOUBLE_TAP else "tap")
+
+    sensor.configure_tap(double_tap=True)
+    sensor.latch_events = True
+    sensor.route_events(int1=Event.SINGLE_TAP | Event.DOUBLE_TAP)
+    events = EventDispatcher(sensor)
+    events.add_callback(Event.SINGLE_TAP | Event.DOUBLE_TAP, tapped)
+    while True:
+        events.poll_on_interrupt(int1)
+
+"""
+
+from . import LSM6DS, Event
+
+try:
+    from typing import Callable, Optional, Union
+except ImportError:
+    pass
+
+# (Event, index in the sources returned by LSM6DS.read_events of the register describing it)
+_EVENT_SOURCES = (
+    (Event.FREE_FALL, 1),
+    (Event.WAKE_UP, 1),
+    (Event.SINGLE_TAP, 2),
+    (Event.DOUBLE_TAP, 2),
+    (Event.ORIENTATION, 3),
+    (Event.SLEEP_CHANGE, 1),
+    (Event.STEP_DETECTOR, 4),
+    (Event.TILT, 4),
+    (Event.SIGNIFICANT_MOTION, 4),
+)
+_EMBEDDED_EVENTS = Event.STEP_DETECTOR | Event.TILT | Event.SIGNIFICANT_MOTION
+
+
+class EventDispatcher:
+    """Reads a sensor's event sources and calls the callbacks registered for the events that
+    occurred.
+
+    A callback is called as ``callback(event, source)``, where ``event`` is a single
+    ``Event`` value and ``source`` is the raw value of the register that describes it:
+    WAKE_UP_SRC for ``Event.FREE_FALL``, ``Event.WAKE_UP`` and ``Event.SLEEP_CHANGE``, with
+    the axes that woke the sensor and the sleep state, TAP_SRC for the taps, with the axis
+    and sign of the tap, D6D_SRC for ``Event.ORIENTATION``, with the sides facing up and
+    down, and EMB_FUNC_STATUS_MAINPAGE for the embedded function events.
+
+    :param sensor: The sensor to read. Configure its detectors first
+    """
+
+    def __init__(self, sensor: LSM6DS) -> None:
+        self.sensor = sensor
+        self._callbacks = []
+        self._events = 0
+
+    def add_callback(self, events: int, callback: Callable[[int, int], None]) -> None:
+        """Call ``callback`` when any of ``events`` occurs.
+
+        :param int events: A combination of ``Event`` values
+        :param callback: The function to call with the event and its source register
+        """
+        self._callbacks.append((events, callback))
+        self._events |= events
+
+    def remove_callback(self, callback: Callable[[int, int], None]) -> None:
+        """Stop calling ``callback``"""
+        self._callbacks = [entry for entry in self._callbacks if entry[1] is not callback]
+        self._events = 0
+        for events, _ in self._callbacks:
+            self._events |= events
+
+    def poll(self) -> int:
+        """Read the event sources and call the callbacks of the events that occurred, in the
+        order of the ``Event`` values. The embedded function status is only read when a
+        callback needs it, saving a 1-byte read otherwise.
+
+        :return: The events that occurred, including those without a callback
+        """
+        events, sources = self.sensor.read_events(embedded=bool(self._events & _EMBEDDED_EVENTS))
+        if events & self._events:
+            for event, index in _EVENT_SOURCES:
+                if not events & event:
+                    continue
+                for wanted, callback in self._callbacks:
+                    if wanted & event:
+                        callback(event, sources[index])
+        return events
+
+    def poll_on_interrupt(
+        self,
+        pin: Union[object, Callable[[Optional[float]], bool]],
+        timeout: Optional[float] = None,
+    ) -> int:
+        """Wait for an interrupt with `adafruit_lsm6ds.LSM6DS.wait_for_interrupt`, then
+        `poll`. Returns 0 without reading the sensor if the wait times out. Route the events
+        to the pin with `adafruit_lsm6ds.LSM6DS.route_events` first.
+
+        :param pin: The pin connected to INT1 or INT2
+        :param float timeout: Seconds to wait for. Defaults to waiting forever
+        """
+        if self.sensor.wait_for_interrupt(pin, timeout):
+            return self.poll()
+        return 0
@@ -0,0 +1,283 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.fusion`
+================================================================================
+
+Madgwick and Mahony orientation filters that process batches of accelerometer and gyro
+samples, such as those from `adafruit_lsm6ds.LSM6DS.read_fifo` or
+`adafruit_lsm6ds.LSM6DS.read_all`
+
+The filters expect angular velocity in radians / second, as returned by the driver when
+``fixed_point`` is disabled. The acceleration may be in any unit since only its direction
+is used.
+
+When ``ulab`` (CircuitPython) or ``numpy`` (Blinka) is available and the batch is passed as
+``N x 3`` arrays, the accelerometer normalization for the whole batch is done with vector
+operations before the filter steps through the samples.
+
+The quaternion is kept in double precision where ``array`` supports it, as on CPython, and
+in the native single precision floats of CircuitPython builds without doubles.
+
+"""
+
+from array import array
+from math import asin, atan2, sqrt
+
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+try:
+    from typing import Sequence, Tuple, Union
+except ImportError:
+    pass
+
+try:
+    array("d")
+    _TYPECODE = "d"
+except ValueError:
+    _TYPECODE = "f"
+
+
+class _OrientationFilter:
+    """Quaternion state and batch handling shared by the filters, which implement ``_step``
+    to integrate one sample with unit acceleration"""
+
+    def __init__(self) -> None:
+        self._q = array(_TYPECODE, (1.0, 0.0, 0.0, 0.0))
+
+    def reset(self) -> None:
+        """Return the orientation to the identity quaternion"""
+        self._q[0] = 1.0
+        self._q[1] = 0.0
+        self._q[2] = 0.0
+        self._q[3] = 0.0
+
+    @property
+    def quaternion(self) -> Tuple[float, float, float, float]:
+        """The orientation as a ``(w, x, y, z)`` unit quaternion"""
+        q = self._q
+        return (q[0], q[1], q[2], q[3])
+
+    @property
+    def euler(self) -> Tuple[float, float, float]:
+        """The orientation as ``(roll, pitch, yaw)`` angles in radians"""
+        q0, q1, q2, q3 = self._q
+        roll = atan2(2 * (q0 * q1 + q2 * q3), 1 - 2 * (q1 * q1 + q2 * q2))
+        pitch = asin(max(-1.0, min(1.0, 2 * (q0 * q2 - q3 * q1))))
+        yaw = atan2(2 * (q0 * q3 + q1 * q2), 1 - 2 * (q2 * q2 + q3 * q3))
+        return (roll, pitch, yaw)
+
+    def update(
+        self,
+        gyro: Tuple[float, float, float],
+        acceleration: Tuple[float, float, float],
+        dt: float,
+    ) -> None:
+        """Update the orientation with a single sample.
+
+        :param gyro: The x, y, z angular velocity in radians / second
+        :param acceleration: The x, y, z acceleration
+        :param float dt: The time in seconds since the previous sample
+        """
+        ax, ay, az = acceleration
+        norm = sqrt(ax * ax + ay * ay + az * az)
+        if norm:
+            ax, ay, az = ax / norm, ay / norm, az / norm
+        self._step(gyro[0], gyro[1], gyro[2], ax, ay, az, dt, norm != 0)
+        self._normalize()
+
+    def update_batch(
+        self,
+        gyro: Sequence,
+        acceleration: Sequence,
+        dt: Union[float, Sequence[float]],
+    ) -> Tuple[float, float, float, float]:
+        """Update the orientation with a batch of samples, in order.
+
+        :param gyro: ``N`` x, y, z angular velocities in radians / second, as a sequence of
+            3-tuples or an ``N x 3`` array
+        :param acceleration: ``N`` x, y, z accelerations, as a sequence of 3-tuples or an
+            ``N x 3`` array
+        :param dt: The time in seconds between samples, or a sequence of ``N`` such times
+        :return: The `quaternion` after the last sample
+        """
+        count = len(gyro)
+        if len(acceleration) != count:
+            raise ValueError("gyro and acceleration must have the same number of samples")
+        fixed_dt = not hasattr(dt, "__len__")
+        if np is not None and isinstance(acceleration, np.ndarray):
+            norms = np.sqrt(np.sum(acceleration * acceleration, axis=1))
+            # rows of zeros stay zero and skip the correction step
+            unit = acceleration / np.maximum(norms, 1e-12).reshape((count, 1))
+            for i in range(count):
+                g = gyro[i]
+                a = unit[i]
+                self._step(
+                    g[0],
+                    g[1],
+                    g[2],
+                    a[0],
+                    a[1],
+                    a[2],
+                    dt if fixed_dt else dt[i],
+                    norms[i] != 0,
+                )
+                self._normalize()
+        else:
+            for i in range(count):
+                self.update(gyro[i], acceleration[i], dt if fixed_dt else dt[i])
+        return self.quaternion
+
+    def _normalize(self) -> None:
+        q = self._q
+        norm = sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+        q[0] /= norm
+        q[1] /= norm
+        q[2] /= norm
+        q[3] /= norm
+
+
+class Madgwick(_OrientationFilter):
+    """Madgwick's gradient descent orientation filter for accelerometer and gyro data.
+
+    :param float beta: The filter gain. Larger values correct gyro drift faster but let
+        more accelerometer noise through. Defaults to 0.1
+    """
+
+    def __init__(self, beta: float = 0.1) -> None:
+        super().__init__()
+        self.beta = beta
+
+    def _step(
+        self,
+        gx: float,
+        gy: float,
+        gz: float,
+        ax: float,
+        ay: float,
+        az: float,
+        dt: float,
+        correct: bool,
+    ) -> None:
+        q = self._q
+        q0, q1, q2, q3 = q[0], q[1], q[2], q[3]
+        # rate of change of the quaternion from the gyro
+        dq0 = 0.5 * (-q1 * gx - q2 * gy - q3 * gz)
+        dq1 = 0.5 * (q0 * gx + q2 * gz - q3 * gy)
+        dq2 = 0.5 * (q0 * gy - q1 * gz + q3 * gx)
+        dq3 = 0.5 * (q0 * gz + q1 * gy - q2 * gx)
+
+        if correct:
+            # gradient descent step towards the measured direction of gravity
+            s0, s1, s2, s3 = self._gradient(q0, q1, q2, q3, ax, ay, az)
+            norm = sqrt(s0 * s0 + s1 * s1 + s2 * s2 + s3 * s3)
+            if norm:
+                step = self.beta / norm
+                dq0 -= step * s0
+                dq1 -= step * s1
+                dq2 -= step * s2
+                dq3 -= step * s3
+
+        q[0] = q0 + dq0 * dt
+        q[1] = q1 + dq1 * dt
+        q[2] = q2 + dq2 * dt
+        q[3] = q3 + dq3 * dt
+
+    @staticmethod
+    def _gradient(
+        q0: float, q1: float, q2: float, q3: float, ax: float, ay: float, az: float
+    ) -> Tuple[float, float, float, float]:
+        q1q1 = q1 * q1
+        q2q2 = q2 * q2
+        s0 = 4 * q0 * q2q2 + 2 * q2 * ax + 4 * q0 * q1q1 - 2 * q1 * ay
+        s1 = (
+            4 * q1 * q3 * q3
+            - 2 * q3 * ax
+            + 4 * q0 * q0 * q1
+            - 2 * q0 * ay
+            - 4 * q1
+            + 8 * q1 * q1q1
+            + 8 * q1 * q2q2
+            + 4 * q1 * az
+        )
+        s2 = (
+            4 * q0 * q0 * q2
+            + 2 * q0 * ax
+            + 4 * q2 * q3 * q3
+            - 2 * q3 * ay
+            - 4 * q2
+            + 8 * q2 * q1q1
+            + 8 * q2 * q2q2
+            + 4 * q2 * az
+        )
+        s3 = 4 * q1q1 * q3 - 2 * q1 * ax + 4 * q2q2 * q3 - 2 * q2 * ay
+        return s0, s1, s2, s3
+
+
+class Mahony(_OrientationFilter):
+    """Mahony's complementary orientation filter for accelerometer and gyro data.
+
+    :param float kp: The proportional gain. Defaults to 1.0
+    :param float ki: The integral gain, which also estimates the gyro bias. Defaults to 0.0
+    """
+
+    def __init__(self, kp: float = 1.0, ki: float = 0.0) -> None:
+        super().__init__()
+        self.kp = kp
+        self.ki = ki
+        self._integral = array(_TYPECODE, (0.0, 0.0, 0.0))
+
+    def reset(self) -> None:
+        """Return the orientation to the identity quaternion and clear the integral term"""
+        super().reset()
+        self._integral[0] = 0.0
+        self._integral[1] = 0.0
+        self._integral[2] = 0.0
+
+    def _step(
+        self,
+        gx: float,
+        gy: float,
+        gz: float,
+        ax: float,
+        ay: float,
+        az: float,
+        dt: float,
+        correct: bool,
+    ) -> None:
+        q = self._q
+        q0, q1, q2, q3 = q[0], q[1], q[2], q[3]
+        if correct:
+            # error between the measured and estimated direction of gravity
+            vx = q1 * q3 - q0 * q2
+            vy = q0 * q1 + q2 * q3
+            vz = q0 * q0 - 0.5 + q3 * q3
+            ex = ay * vz - az * vy
+            ey = az * vx - ax * vz
+            ez = ax * vy - ay * vx
+            if self.ki > 0:
+                integral = self._integral
+                integral[0] += 2 * self.ki * ex * dt
+                integral[1] += 2 * self.ki * ey * dt
+                integral[2] += 2 * self.ki * ez * dt
+                gx += integral[0]
+                gy += integral[1]
+                gz += integral[2]
+            gx += 2 * self.kp * ex
+            gy += 2 * self.kp * ey
+            gz += 2 * self.kp * ez
+
+        gx *= 0.5 * dt
+        gy *= 0.5 * dt
+        gz *= 0.5 * dt
+        q[0] = q0 - q1 * gx - q2 * gy - q3 * gz
+        q[1] = q1 + q0 * gx + q2 * gz - q3 * gy
+        q[2] = q2 + q0 * gy - q1 * gz + q3 * gx
+        q[3] = q3 + q0 * gz + q1 * gy - q2 * gx
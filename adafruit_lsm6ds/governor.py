@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.governor`
+================================================================================
+
+Runs the sensor at a high data rate only while it is moving
+
+The sensor's activity/inactivity detection lowers the accelerometer to 12.5 Hz and puts the
+gyro to sleep once no motion has been seen for a while, and the wake-up detector restores
+the full data rates as soon as it moves again, without the host. `RateGovernor` sets this
+up and follows the changes from the ``Event.SLEEP_CHANGE`` events, so that the host can
+wait on the interrupt pin instead of polling while the sensor is idle.
+
+.. code-block:: python
+
+    governor = RateGovernor(sensor, Rate.RATE_416_HZ, inactivity_time=10)
+    sensor.route_events(int1=Event.SLEEP_CHANGE)
+    while True:
+        governor.wait_for_activity(int1)
+        acceleration, gyro, _, _ = sensor.read_all()
+
+"""
+
+from time import monotonic
+
+from . import LSM6DS, Event, InactivityMode, Rate
+
+try:
+    from typing import Callable, Optional, Union
+except ImportError:
+    pass
+
+_IDLE_RATE = 12.5  # Hz, the accelerometer rate while inactive
+_SLEEP_STATE = 0x10  # in WAKE_UP_SRC
+_SLEEP_DURATION_STEP = 512  # accelerometer samples
+_SLEEP_DURATION_MIN = 16  # accelerometer samples, for a duration of 0
+_SLEEP_DURATION_MAX = 15
+
+
+class RateGovernor:
+    """Switches a sensor between a high data rate while it moves and 12.5 Hz while it is
+    still, using the sensor's own wake-up and inactivity detection.
+
+    ``sensor`` is configured when the governor is created, with
+    `adafruit_lsm6ds.LSM6DS.latch_events` set, and is assumed to be active. Call `update`
+    from time to time, or register `handle_event` with an
+    `adafruit_lsm6ds.events.EventDispatcher`, to follow its state.
+
+    :param sensor: The sensor to govern
+    :param int active_rate: The accelerometer data rate while active. Must be a ``Rate``
+    :param int gyro_rate: The gyro data rate while active. Must be a ``Rate``. Defaults to
+        ``active_rate``; ``Rate.RATE_SHUTDOWN`` leaves the gyro off
+    :param float inactivity_time: Seconds without motion before the rates are lowered. It is
+        rounded up to a step of 512 samples at ``active_rate``, at most 15 steps. Defaults to 5
+    :param int wake_threshold: The wake-up threshold, from 0 to 63, in steps of 1/64 of the
+        accelerometer range. Defaults to 2
+    :param bool gyro_power_down: Power the gyro down while inactive instead of putting it in
+        sleep mode. This saves more current but the gyro takes longer to restart. Defaults to
+        `False`
+    """
+
+    def __init__(
+        self,
+        sensor: LSM6DS,
+        active_rate: int,
+        gyro_rate: Optional[int] = None,
+        inactivity_time: float = 5.0,
+        wake_threshold: int = 2,
+        gyro_power_down: bool = False,
+    ) -> None:
+        if not Rate.is_valid(active_rate) or active_rate == Rate.RATE_SHUTDOWN:
+            raise AttributeError("active_rate must be a `Rate` other than RATE_SHUTDOWN")
+        if gyro_rate is None:
+            gyro_rate = active_rate
+        samples = inactivity_time * Rate.string[active_rate]
+        duration = 0
+        if samples > _SLEEP_DURATION_MIN:
+            duration = -int(-samples // _SLEEP_DURATION_STEP)
+        if duration > _SLEEP_DURATION_MAX:
+            raise AttributeError(
+                "inactivity_time must be at most %d samples at active_rate"
+                % (_SLEEP_DURATION_MAX * _SLEEP_DURATION_STEP)
+            )
+        self.sensor = sensor
+        self.active_rate = active_rate
+        sensor.configure(accel_rate=active_rate, gyro_rate=gyro_rate)
+        sensor.configure_wake_up(wake_threshold)
+        # keep the pin asserted until the change is read, so a level can be waited on
+        sensor.latch_events = True
+        sensor.configure_inactivity(
+            InactivityMode.GYRO_POWER_DOWN if gyro_power_down else InactivityMode.GYRO_SLEEP,
+            duration,
+        )
+        self.active = True
+        """Whether the sensor was active when last seen"""
+        self.transitions = 0
+        """The number of changes between active and inactive"""
+        self._active_time = 0.0
+        self._idle_time = 0.0
+        self._since = monotonic()
+
+    @property
+    def data_rate(self) -> float:
+        """The current accelerometer data rate in Hz"""
+        return Rate.string[self.active_rate] if self.active else _IDLE_RATE
+
+    @property
+    def idle_fraction(self) -> float:
+        """The fraction of time, from 0 to 1, spent inactive since the governor was created"""
+        now = monotonic()
+        idle = self._idle_time
+        active = self._active_time
+        if self.active:
+            active += now - self._since
+        else:
+            idle += now - self._since
+        total = idle + active
+        return idle / total if total else 0.0
+
+    def handle_event(self, event: int, source: int) -> None:
+        """Follow an ``Event.SLEEP_CHANGE`` event. This can be registered as a callback with
+        `adafruit_lsm6ds.events.EventDispatcher.add_callback`
+
+        :param int event: The ``Event``
+        :param int source: The WAKE_UP_SRC register
+        """
+        if event != Event.SLEEP_CHANGE:
+            return
+        active = not source & _SLEEP_STATE
+        if active == self.active:
+            return
+        now = monotonic()
+        if self.active:
+            self._active_time += now - self._since
+        else:
+            self._idle_time += now - self._since
+        self._since = now
+        self.active = active
+        self.transitions += 1
+
+    def update(self) -> bool:
+        """Read the event sources with `adafruit_lsm6ds.LSM6DS.read_events` and follow any
+        change of state. This reads and clears all the latched events; use `handle_event`
+        with an `adafruit_lsm6ds.events.EventDispatcher` when other events are used too.
+
+        :return: `active`
+        """
+        events, sources = self.sensor.read_events(embedded=False)
+        if events & Event.SLEEP_CHANGE:
+            self.handle_event(Event.SLEEP_CHANGE, sources[1])
+        return self.active
+
+    def wait_for_activity(
+        self,
+        pin: Union[object, Callable[[Optional[float]], bool]],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Check the pin for a change of state, then, if the sensor is inactive, wait with
+        `adafruit_lsm6ds.LSM6DS.wait_for_interrupt` until it wakes up. The sensor is only read
+        when the pin is asserted, so there is no bus traffic while it stays active or idle.
+        Route ``Event.SLEEP_CHANGE`` to the pin first.
+
+        :param pin: The pin connected to INT1 or INT2
+        :param float timeout: Seconds to wait for. Defaults to waiting forever
+        :return: `active`, which is `False` if the wait timed out
+        """
+        if self.active and self.sensor.wait_for_interrupt(pin, 0):
+            self.update()
+        deadline = None if timeout is None else monotonic() + timeout
+        while not self.active:
+            remaining = None if deadline is None else max(0.0, deadline - monotonic())
+            if not self.sensor.wait_for_interrupt(pin, remaining):
+                break
+            self.update()
+        return self.active
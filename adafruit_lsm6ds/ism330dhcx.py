@@ -8,24 +8,37 @@ This module provides the `adafruit_lsm6ds.ism330dhcx` subclass of LSM6DS sensors
 
 from time import sleep
 
-from . import LSM6DS, LSM6DS_DEFAULT_ADDRESS, GyroRange, RWBit, const
+from . import LSM6DS, LSM6DS_DEFAULT_ADDRESS, LSM6DS_SPI_DEFAULT_BAUDRATE, GyroRange, RWBit, const
 
 try:
     import typing
+    from typing import Optional
 
     from busio import I2C
+    from digitalio import DigitalInOut
 except ImportError:
     pass
 
 _LSM6DS_CTRL2_G = const(0x11)
 _ISM330DHCX_CTRL6_C = const(0x15)
+_ISM330DHCX_CTRL2_G_FS_4000 = const(0x01)
 
 
 class ISM330DHCX(LSM6DS):
     """Driver for the ISM330DHCX 6-axis accelerometer and gyroscope.
 
-    :param ~busio.I2C i2c_bus: The I2C bus the device is connected to.
+    :param ~busio.I2C i2c_bus: The I2C bus the device is connected to, or the SPI bus when
+        ``spi_cs`` is given
     :param int address: The I2C device address. Defaults to :const:`0x6A`
+    :param bool cache_registers: Keep a write-through copy of the configuration registers.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `False`
+    :param bool configure_defaults: Apply the default measurement settings after the reset.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `True`
+    :param bool instrument: Count the bus usage for ``stats``.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `False`
+    :param ~digitalio.DigitalInOut spi_cs: The chip select pin, to connect over SPI instead.
+        See `adafruit_lsm6ds.LSM6DS`
+    :param int spi_baudrate: The SPI clock rate. Defaults to 10 MHz
 
 
     **Quickstart: Importing and using the device**
@@ -58,20 +71,33 @@ class ISM330DHCX(LSM6DS):
     CHIP_ID = 0x6B
     _gyro_range_4000dps = RWBit(_LSM6DS_CTRL2_G, 0)
     _supports_low_power_odr = True
+    _supports_tagged_fifo = True
+    _supports_timestamp = True
+    _supports_embedded_functions = True
+    _supports_sensor_hub = True
+    _supports_user_offset = True
+    _GYRO_RANGES = LSM6DS._GYRO_RANGES + (("RANGE_4000_DPS", 4000, 4000, 140.0),)
     low_power_mode = RWBit(_ISM330DHCX_CTRL6_C, 4)
 
-    def __init__(self, i2c_bus: I2C, address: int = LSM6DS_DEFAULT_ADDRESS) -> None:
-        GyroRange.add_values(
-            (
-                ("RANGE_125_DPS", 125, 125, 4.375),
-                ("RANGE_250_DPS", 0, 250, 8.75),
-                ("RANGE_500_DPS", 1, 500, 17.50),
-                ("RANGE_1000_DPS", 2, 1000, 35.0),
-                ("RANGE_2000_DPS", 3, 2000, 70.0),
-                ("RANGE_4000_DPS", 4000, 4000, 140.0),
-            )
+    def __init__(
+        self,
+        i2c_bus: I2C,
+        address: int = LSM6DS_DEFAULT_ADDRESS,
+        cache_registers: bool = False,
+        configure_defaults: bool = True,
+        instrument: bool = False,
+        spi_cs: Optional[DigitalInOut] = None,
+        spi_baudrate: int = LSM6DS_SPI_DEFAULT_BAUDRATE,
+    ) -> None:
+        super().__init__(
+            i2c_bus,
+            address,
+            cache_registers=cache_registers,
+            configure_defaults=configure_defaults,
+            instrument=instrument,
+            spi_cs=spi_cs,
+            spi_baudrate=spi_baudrate,
         )
-        super().__init__(i2c_bus, address)
 
         # Called DEVICE_CONF in the datasheet, but it recommends setting it
         self._i3c_disable = True
@@ -88,10 +114,15 @@ class ISM330DHCX(LSM6DS):
         super()._set_gyro_range(value)
 
         # range uses the `FS_4000` bit
-        if value is GyroRange.RANGE_4000_DPS:
+        if value == GyroRange.RANGE_4000_DPS:
             self._gyro_range_125dps = False
             self._gyro_range_4000dps = True
         else:
             self._gyro_range_4000dps = False
 
         sleep(0.2)  # needed to let new range settle
+
+    def _gyro_range_bits(self, value: int) -> int:
+        if value == GyroRange.RANGE_4000_DPS:
+            return _ISM330DHCX_CTRL2_G_FS_4000
+        return super()._gyro_range_bits(value)
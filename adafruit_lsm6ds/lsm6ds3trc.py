@@ -45,6 +45,7 @@ class LSM6DS3TRC(LSM6DS):
     """
 
     CHIP_ID = 0x6A
+    _supports_user_offset = True
 
     # This version of the IMU has a different register for enabling the pedometer
     # https://www.st.com/resource/en/datasheet/lsm6ds3tr-c.pdf
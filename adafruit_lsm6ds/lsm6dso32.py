@@ -6,12 +6,22 @@ This module provides the `adafruit_lsm6ds.lsm6dso32` subclass of LSM6DS sensors
 =================================================================================
 """
 
-from . import LSM6DS, LSM6DS_CHIP_ID, LSM6DS_DEFAULT_ADDRESS, AccelRange
+from . import (
+    LSM6DS,
+    LSM6DS_CHIP_ID,
+    LSM6DS_DEFAULT_ADDRESS,
+    LSM6DS_SPI_DEFAULT_BAUDRATE,
+    AccelRange,
+    GyroRange,
+    Rate,
+)
 
 try:
     import typing
+    from typing import Optional
 
     from busio import I2C
+    from digitalio import DigitalInOut
 except ImportError:
     pass
 
@@ -19,8 +29,18 @@ except ImportError:
 class LSM6DSO32(LSM6DS):
     """Driver for the LSM6DSO32 6-axis accelerometer and gyroscope.
 
-    :param ~busio.I2C i2c_bus: The I2C bus the LSM6DSO32 is connected to.
+    :param ~busio.I2C i2c_bus: The I2C bus the LSM6DSO32 is connected to, or the SPI bus when
+        ``spi_cs`` is given
     :param address: The I2C device address. Defaults to :const:`0x6A`
+    :param bool cache_registers: Keep a write-through copy of the configuration registers.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `False`
+    :param bool configure_defaults: Apply the default measurement settings after the reset.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `True`
+    :param bool instrument: Count the bus usage for ``stats``.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `False`
+    :param ~digitalio.DigitalInOut spi_cs: The chip select pin, to connect over SPI instead.
+        See `adafruit_lsm6ds.LSM6DS`
+    :param int spi_baudrate: The SPI clock rate. Defaults to 10 MHz
 
 
     **Quickstart: Importing and using the device**
@@ -51,19 +71,44 @@ class LSM6DSO32(LSM6DS):
     """
 
     CHIP_ID = LSM6DS_CHIP_ID
-
-    def __init__(self, i2c_bus: I2C, address: int = LSM6DS_DEFAULT_ADDRESS) -> None:
-        super().__init__(i2c_bus, address)
+    _supports_tagged_fifo = True
+    _supports_timestamp = True
+    _supports_embedded_functions = True
+    _supports_sensor_hub = True
+    _supports_user_offset = True
+    _ACCEL_RANGES = (
+        ("RANGE_4G", 0, 4, 0.122),
+        ("RANGE_32G", 1, 32, 0.976),
+        ("RANGE_8G", 2, 8, 0.244),
+        ("RANGE_16G", 3, 16, 0.488),
+    )
+
+    def __init__(
+        self,
+        i2c_bus: I2C,
+        address: int = LSM6DS_DEFAULT_ADDRESS,
+        cache_registers: bool = False,
+        configure_defaults: bool = True,
+        instrument: bool = False,
+        spi_cs: Optional[DigitalInOut] = None,
+        spi_baudrate: int = LSM6DS_SPI_DEFAULT_BAUDRATE,
+    ) -> None:
+        super().__init__(
+            i2c_bus,
+            address,
+            cache_registers=cache_registers,
+            configure_defaults=configure_defaults,
+            instrument=instrument,
+            spi_cs=spi_cs,
+            spi_baudrate=spi_baudrate,
+        )
         self._i3c_disable = True
-        self.accelerometer_range = AccelRange.RANGE_8G  # pylint:disable=no-member
-
-    @staticmethod
-    def _add_accel_ranges() -> None:
-        AccelRange.add_values(
-            (
-                ("RANGE_4G", 0, 4, 0.122),
-                ("RANGE_32G", 1, 32, 0.976),
-                ("RANGE_8G", 2, 8, 0.244),
-                ("RANGE_16G", 3, 16, 0.488),
-            )
+
+    def _configure_defaults(self) -> None:
+        self.configure(
+            accel_range=AccelRange.RANGE_8G,
+            gyro_range=GyroRange.RANGE_250_DPS,
+            accel_rate=Rate.RATE_104_HZ,
+            gyro_rate=Rate.RATE_104_HZ,
+            block_data_update=True,
         )
@@ -6,12 +6,14 @@ This module provides the `adafruit_lsm6ds.lsm6dsox` subclass of LSM6DS sensors
 ==============================================================================
 """
 
-from . import LSM6DS, LSM6DS_CHIP_ID, LSM6DS_DEFAULT_ADDRESS
+from . import LSM6DS, LSM6DS_CHIP_ID, LSM6DS_DEFAULT_ADDRESS, LSM6DS_SPI_DEFAULT_BAUDRATE
 
 try:
     import typing
+    from typing import Optional
 
     from busio import I2C
+    from digitalio import DigitalInOut
 except ImportError:
     pass
 
@@ -19,8 +21,18 @@ except ImportError:
 class LSM6DSOX(LSM6DS):
     """Driver for the LSM6DSOX 6-axis accelerometer and gyroscope.
 
-    :param ~busio.I2C i2c_bus: The I2C bus the LSM6DSOX is connected to.
+    :param ~busio.I2C i2c_bus: The I2C bus the LSM6DSOX is connected to, or the SPI bus when
+        ``spi_cs`` is given
     :param int address: The I2C device address. Defaults to :const:`0x6A`
+    :param bool cache_registers: Keep a write-through copy of the configuration registers.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `False`
+    :param bool configure_defaults: Apply the default measurement settings after the reset.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `True`
+    :param bool instrument: Count the bus usage for ``stats``.
+        See `adafruit_lsm6ds.LSM6DS`. Defaults to `False`
+    :param ~digitalio.DigitalInOut spi_cs: The chip select pin, to connect over SPI instead.
+        See `adafruit_lsm6ds.LSM6DS`
+    :param int spi_baudrate: The SPI clock rate. Defaults to 10 MHz
 
 
     **Quickstart: Importing and using the device**
@@ -50,9 +62,31 @@ class LSM6DSOX(LSM6DS):
     """
 
     CHIP_ID = LSM6DS_CHIP_ID
+    _supports_tagged_fifo = True
+    _supports_timestamp = True
+    _supports_embedded_functions = True
+    _supports_sensor_hub = True
+    _supports_user_offset = True
 
     def __init__(
-        self, i2c_bus: I2C, address: int = LSM6DS_DEFAULT_ADDRESS, ucf: str = None
+        self,
+        i2c_bus: I2C,
+        address: int = LSM6DS_DEFAULT_ADDRESS,
+        ucf: str = None,
+        cache_registers: bool = False,
+        configure_defaults: bool = True,
+        instrument: bool = False,
+        spi_cs: Optional[DigitalInOut] = None,
+        spi_baudrate: int = LSM6DS_SPI_DEFAULT_BAUDRATE,
     ) -> None:
-        super().__init__(i2c_bus, address, ucf)
+        super().__init__(
+            i2c_bus,
+            address,
+            ucf,
+            cache_registers=cache_registers,
+            configure_defaults=configure_defaults,
+            instrument=instrument,
+            spi_cs=spi_cs,
+            spi_baudrate=spi_baudrate,
+        )
         self._i3c_disable = True
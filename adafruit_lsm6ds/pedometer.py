@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.pedometer`
+================================================================================
+
+Turns readings of the pedometer's 16-bit step counter into a running step total that does
+not wrap at 65535, as ``(timestamp, total_steps)`` events
+
+The readings can come from ``FIFOTag.STEP_COUNTER`` words, which the sensor batches in the
+FIFO with the timestamp of each step when `adafruit_lsm6ds.LSM6DS.fifo_pedometer` is
+enabled, or from polling `adafruit_lsm6ds.LSM6DS.pedometer_steps`.
+
+.. code-block:: python
+
+    sensor.pedometer_enable = True
+    sensor.timestamp_enabled = True
+    sensor.fifo_pedometer = True
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    steps = StepCounter()
+    while True:
+        time.sleep(60)
+        for timestamp, total in steps.read_fifo_words(sensor.read_fifo()):
+            print(timestamp, total)
+
+"""
+
+from time import monotonic
+
+from . import LSM6DS, FIFOTag
+
+try:
+    from typing import Iterable, Iterator, Optional, Tuple
+except ImportError:
+    pass
+
+
+class StepCounter:
+    """Accumulates step counter readings into a total that does not wrap.
+
+    Each reading is compared with the previous one modulo 65536, so the counter may wrap
+    any number of times as long as fewer than 65536 steps are taken between two readings.
+
+    :param int total: The total to start from. Defaults to 0
+    :param int counter: The step counter value the next reading is compared with. Defaults
+        to 0, the value of the counter after `adafruit_lsm6ds.LSM6DS.pedometer_enable`
+        is set
+    """
+
+    def __init__(self, total: int = 0, counter: int = 0) -> None:
+        self.total = total
+        """The number of steps counted"""
+        self._counter = counter
+
+    def counter_reset(self) -> None:
+        """Note that the sensor's step counter was reset to 0, for example by setting
+        `adafruit_lsm6ds.LSM6DS.pedometer_enable` again, without changing `total`"""
+        self._counter = 0
+
+    def update(self, counter: int, timestamp: float) -> Optional[Tuple[float, int]]:
+        """Add a reading of the step counter.
+
+        :param int counter: The step counter value
+        :param float timestamp: The time of the reading, in seconds
+        :return: A ``(timestamp, total)`` event if the counter changed, otherwise `None`
+        """
+        delta = (counter - self._counter) & 0xFFFF
+        self._counter = counter
+        if not delta:
+            return None
+        self.total += delta
+        return (timestamp, self.total)
+
+    def read_fifo_words(self, words: Iterable[Tuple[int, object]]) -> Iterator[Tuple[float, int]]:
+        """Yield a ``(timestamp, total)`` event for each ``FIFOTag.STEP_COUNTER`` word in
+        ``words``, such as those returned by `adafruit_lsm6ds.LSM6DS.read_fifo`. Words with
+        other tags are skipped; pass step counter words to `update` instead to handle both.
+
+        :param words: ``(tag, data)`` FIFO words
+        """
+        for tag, data in words:
+            if tag == FIFOTag.STEP_COUNTER:
+                event = self.update(data[0], data[1])
+                if event is not None:
+                    yield event
+
+    def poll(self, sensor: LSM6DS) -> Optional[Tuple[float, int]]:
+        """Read `adafruit_lsm6ds.LSM6DS.pedometer_steps` and return a ``(timestamp, total)``
+        event, timestamped with `time.monotonic`, if it changed, otherwise `None`
+
+        :param sensor: The sensor to read
+        """
+        return self.update(sensor.pedometer_steps, monotonic())
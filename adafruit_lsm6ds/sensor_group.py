@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.sensor_group`
+================================================================================
+
+Polls several LSM6DS sensors, which may be spread over several buses, as one group
+
+"""
+
+from time import monotonic
+
+from . import LSM6DS, Rate
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # CircuitPython has no threads; the buses are then polled one after the other
+    ThreadPoolExecutor = None
+
+# a sensor is read again once this fraction of its sample period has passed, so that a loop
+# polling at the data rate does not skip a sample when its period jitters or rounds short
+_EARLY_READ = 0.9
+
+try:
+    from typing import Dict, Iterable, Optional, Tuple
+except ImportError:
+    pass
+
+
+def _bus_of(sensor: LSM6DS) -> object:
+    """The bus object a sensor's transactions go through, looking through any wrappers"""
+    device = sensor.i2c_device
+    while hasattr(device, "device"):
+        device = device.device
+    return getattr(device, "i2c", getattr(device, "spi", device))
+
+
+class SensorGroup:
+    """Reads a group of LSM6DS sensors with one burst read per sensor.
+
+    Each call to `read` visits the buses in turn and reads every sensor that is due a new
+    sample according to its data rate. Under Blinka, sensors on different buses are read in
+    parallel worker threads.
+
+    :param sensors: The sensors to poll. Sensors sharing a bus are read round-robin
+    :param bool threaded: Read each bus in its own worker thread. Defaults to `True` when
+        threads are available and the sensors are on more than one bus
+
+    .. code-block:: python
+
+        group = SensorGroup([sensor_a, sensor_b, sensor_c])
+        while True:
+            for sensor, (timestamp, acceleration, gyro) in group.read().items():
+                print(timestamp, acceleration, gyro)
+    """
+
+    def __init__(self, sensors: Iterable[LSM6DS], threaded: Optional[bool] = None) -> None:
+        self.sensors = list(sensors)
+        self._buses = {}
+        for sensor in self.sensors:
+            self._buses.setdefault(_bus_of(sensor), []).append(sensor)
+        if threaded is None:
+            threaded = ThreadPoolExecutor is not None and len(self._buses) > 1
+        if threaded and ThreadPoolExecutor is None:
+            raise RuntimeError("Threads are not available")
+        self._executor = ThreadPoolExecutor(max_workers=len(self._buses)) if threaded else None
+        self._intervals = {}
+        self._last_read = {}
+        self._busy = {}
+        self._stats_start = 0
+        self.refresh_rates()
+        self.reset_stats()
+
+    def __enter__(self) -> "SensorGroup":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Stop the worker threads, if any"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def refresh_rates(self) -> None:
+        """Read each sensor's data rates again. Call this after changing them"""
+        for sensor in self.sensors:
+            rate = max(
+                Rate.string[sensor.accelerometer_data_rate],
+                Rate.string[sensor.gyro_data_rate],
+            )
+            self._intervals[sensor] = _EARLY_READ / rate if rate else None
+            self._last_read[sensor] = None
+
+    def reset_stats(self) -> None:
+        """Restart the measurement of `bus_utilization`"""
+        for bus in self._buses:
+            self._busy[bus] = 0
+        self._stats_start = monotonic()
+
+    @property
+    def bus_utilization(self) -> Dict[object, float]:
+        """The fraction of time, from 0 to 1, that each bus has spent in `read` transactions
+        since the group was created or `reset_stats` was called"""
+        elapsed = monotonic() - self._stats_start
+        if not elapsed:
+            return {bus: 0.0 for bus in self._buses}
+        return {bus: busy / elapsed for bus, busy in self._busy.items()}
+
+    def read(self) -> Dict[LSM6DS, Tuple[float, Tuple, Tuple]]:
+        """Read every sensor that is due a new sample.
+
+        Returns a dictionary mapping each sensor that had new data to a
+        ``(timestamp, acceleration, gyro)`` tuple, where ``timestamp`` is the
+        `time.monotonic` value when the sensor's burst read completed.
+        """
+        batch = {}
+        if self._executor is None:
+            for bus in self._buses:
+                self._read_bus(bus, batch)
+        else:
+            # each worker only adds the keys of its own bus to the dictionary
+            for _ in self._executor.map(lambda bus: self._read_bus(bus, batch), self._buses):
+                pass
+        return batch
+
+    def _read_bus(self, bus: object, batch: Dict) -> None:
+        sensors = self._buses[bus]
+        start = monotonic()
+        for sensor in sensors:
+            interval = self._intervals[sensor]
+            last = self._last_read[sensor]
+            if interval is None or (last is not None and start - last < interval):
+                continue
+            acceleration, gyro, _, data_ready = sensor.read_all()
+            timestamp = monotonic()
+            if data_ready[0] or data_ready[1]:
+                self._last_read[sensor] = timestamp
+                batch[sensor] = (timestamp, acceleration, gyro)
+        self._busy[bus] += monotonic() - start
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.sensor_hub`
+================================================================================
+
+Reads a LIS3MDL magnetometer through the sensor hub of an LSM6DSOX, LSM6DSO32 or ISM330DHCX
+
+The sensor hub is an I2C master on the auxiliary bus, the SDx and SCx pins, that reads the
+magnetometer right after each accelerometer sample, so the host never addresses the
+magnetometer itself. Batched in the FIFO, the magnetometer data are read time-aligned with the
+accelerometer and gyro data in the same bursts. Polling them instead costs a bank switch on
+every read.
+
+The LIS3MDL must be wired to the auxiliary bus. On boards that put both sensors on the host's
+bus, keep using the adafruit_lis3mdl driver.
+
+.. code-block:: python
+
+    magnetometer = LIS3MDL(sensor, batch=True)
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    while True:
+        time.sleep(1)
+        for tag, data in magnetometer.read_fifo():
+            print(FIFOTag.string[tag], data)
+
+"""
+
+import struct
+
+from . import LSM6DS, FIFOTag
+
+try:
+    from typing import Iterator, Optional, Tuple
+except ImportError:
+    pass
+
+_LIS3MDL_DEFAULT_ADDRESS = 0x1C
+_LIS3MDL_CTRL_REG1 = 0x20
+_LIS3MDL_OUT_X_L = 0x28
+_LIS3MDL_AUTO_INCREMENT = 0x80  # in the register address, to read several registers
+# CTRL_REG1 to CTRL_REG5: ultra-high performance at 80 Hz, continuous conversion with block
+# data update. The full scale is set in CTRL_REG2
+_LIS3MDL_CONFIGURATION = (0x7C, 0x00, 0x00, 0x0C, 0x40)
+# (full scale in gauss, FS bits of CTRL_REG2, sensitivity in LSB/gauss)
+_LIS3MDL_RANGES = ((4, 0x00, 6842), (8, 0x20, 3421), (12, 0x40, 2281), (16, 0x60, 1711))
+_GAUSS_TO_UT = 100
+
+
+class LIS3MDL:
+    """A LIS3MDL magnetometer on the auxiliary bus of an LSM6DS, configured and read through
+    its sensor hub. The LIS3MDL is configured for ultra-high performance at 80 Hz and slave 0
+    of the sensor hub reads its 6 output registers at 104 Hz.
+
+    Creating it writes the LIS3MDL's configuration one register per accelerometer sample, so
+    the accelerometer must be running, and starts the sensor hub.
+
+    :param sensor: The LSM6DS the LIS3MDL is connected to
+    :param int address: The LIS3MDL's I2C address, :const:`0x1C` or :const:`0x1E`.
+        Defaults to :const:`0x1C`
+    :param int magnetic_range: The full scale in gauss: 4, 8, 12 or 16. Defaults to 4
+    :param bool batch: Also batch the magnetometer data in the FIFO, as
+        ``FIFOTag.SENSOR_HUB_SLAVE0`` words. Defaults to `False`
+    :param bool pull_up: Enable the LSM6DS's internal pull-ups on the auxiliary bus, for boards
+        without external ones. Defaults to `False`
+    """
+
+    def __init__(
+        self,
+        sensor: LSM6DS,
+        address: int = _LIS3MDL_DEFAULT_ADDRESS,
+        magnetic_range: int = 4,
+        batch: bool = False,
+        pull_up: bool = False,
+    ) -> None:
+        for gauss, range_bits, sensitivity in _LIS3MDL_RANGES:
+            if gauss == magnetic_range:
+                break
+        else:
+            raise AttributeError("magnetic_range must be 4, 8, 12 or 16")
+        self.sensor = sensor
+        self._scale = _GAUSS_TO_UT / sensitivity
+        self._buf = bytearray(6)
+        configuration = bytearray(_LIS3MDL_CONFIGURATION)
+        configuration[1] |= range_bits
+        for offset, value in enumerate(configuration):
+            sensor.sensor_hub_write(address, _LIS3MDL_CTRL_REG1 + offset, value, pull_up)
+        sensor.configure_sensor_hub_read(
+            0, address, _LIS3MDL_OUT_X_L | _LIS3MDL_AUTO_INCREMENT, 6, batch
+        )
+        sensor.start_sensor_hub(1, pull_up=pull_up)
+
+    def convert(self, raw: Tuple[int, int, int]) -> Tuple[float, float, float]:
+        """Scale raw magnetometer data, such as the data of the ``FIFOTag.SENSOR_HUB_SLAVE0``
+        words returned by `adafruit_lsm6ds.LSM6DS.read_fifo`, to microteslas"""
+        scale = self._scale
+        return (raw[0] * scale, raw[1] * scale, raw[2] * scale)
+
+    @property
+    def magnetic(self) -> Tuple[float, float, float]:
+        """The magnetic field from the last sensor hub cycle, in microteslas.
+
+        The outputs are in the sensor hub register bank, so each read takes 3 transactions:
+        selecting the bank, reading SENSOR_HUB_1..6 and selecting the user bank again. That is
+        more than reading a LIS3MDL on the host's bus directly. To save bus traffic, create
+        the LIS3MDL with ``batch=True`` and use `read_fifo`, which reads the magnetometer
+        together with the accelerometer and gyro in the FIFO bursts"""
+        self.sensor.read_sensor_hub_into(self._buf)
+        return self.convert(struct.unpack("<hhh", self._buf))
+
+    def read_all(
+        self,
+    ) -> Tuple[Tuple[float, float, float], Tuple[float, float, float], Tuple[float, float, float]]:
+        """Read the acceleration, gyro and magnetic field. The accelerometer and gyro are read
+        in one burst with `adafruit_lsm6ds.LSM6DS.read_all` and the magnetic field in a second
+        one, so a new sample may arrive between the two bursts and the magnetic field may be
+        one sensor hub cycle newer. This takes 4 transactions, 1 for
+        `adafruit_lsm6ds.LSM6DS.read_all` and 3 for `magnetic`. Use `read_fifo` with
+        ``batch=True`` when the data must be aligned or bus traffic matters.
+
+        :return: ``(acceleration, gyro, magnetic)``, in m/s^2, rad/s and microteslas
+        """
+        acceleration, gyro, _, _ = self.sensor.read_all()
+        return acceleration, gyro, self.magnetic
+
+    def read_fifo(self, max_words: Optional[int] = None) -> Iterator[Tuple[int, object]]:
+        """Read the FIFO with `adafruit_lsm6ds.LSM6DS.read_fifo`, scaling the
+        ``FIFOTag.SENSOR_HUB_SLAVE0`` words to microteslas. The accelerometer, gyro and
+        magnetometer words are read together, in bursts of up to 32 words.
+
+        :param int max_words: The maximum number of words to read. Defaults to all available
+        """
+        for tag, data in self.sensor.read_fifo(max_words):
+            if tag == FIFOTag.SENSOR_HUB_SLAVE0:
+                yield tag, self.convert(data)
+            else:
+                yield tag, data
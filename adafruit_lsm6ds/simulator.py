@@ -0,0 +1,1048 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.simulator`
+================================================================================
+
+A simulated I2C bus and LSM6DS device, so the drivers can be run, tested and benchmarked
+on a computer with no sensor attached
+
+The device models the register map that the drivers use: WHO_AM_I for the simulated
+class, register auto-increment, the self-clearing software reset, the embedded function
+and sensor hub banks selected with FUNC_CFG_ACCESS, the output and status registers, the
+timestamp counter, the user offset registers, the INT1 and INT2 data ready and FIFO
+signals, the pedometer step counter, the event sources, the sleep state of the
+activity/inactivity detection, the sensor hub reading and writing devices attached with
+``add_auxiliary_device`` and, for the parts that have one, the tagged FIFO and its
+compression. New samples are produced at the configured data rates from the time returned
+by ``clock``.
+
+.. code-block:: python
+
+    from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+    from adafruit_lsm6ds.simulator import SimulatedI2C, SimulatedLSM6DS
+
+    device = SimulatedLSM6DS(LSM6DSOX)
+    i2c = SimulatedI2C(device)
+    sensor = LSM6DSOX(i2c)
+    print(sensor.acceleration)
+    print(i2c.transactions, i2c.bus_time)
+
+"""
+
+import struct
+from collections import deque
+from math import degrees
+from time import monotonic
+
+from . import LSM6DS, FIFOTag, Rate
+
+try:
+    from typing import Callable, Iterator, Optional, Sequence, Tuple, Type, Union
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+_FUNC_CFG_ACCESS = 0x01
+_FUNC_CFG_EMBEDDED = 0x80
+_FUNC_CFG_SENSOR_HUB = 0x40
+_FIFO_CTRL1 = 0x07
+_FIFO_CTRL2 = 0x08
+_FIFO_CTRL3 = 0x09
+_FIFO_CTRL4 = 0x0A
+_INT1_CTRL = 0x0D
+_INT2_CTRL = 0x0E
+_WHO_AM_I = 0x0F
+_CTRL1_XL = 0x10
+_CTRL2_G = 0x11
+_CTRL3_C = 0x12
+_CTRL6_C = 0x15
+_CTRL7_G = 0x16
+_CTRL10_C = 0x19
+_ALL_INT_SRC = 0x1A
+_WAKE_UP_SRC = 0x1B
+_TAP_SRC = 0x1C
+_D6D_SRC = 0x1D
+_STATUS_REG = 0x1E
+_OUT_TEMP_L = 0x20
+_OUTX_L_G = 0x22
+_OUTX_L_A = 0x28
+_OUTZ_H_A = 0x2D
+_EMB_FUNC_STATUS_MAINPAGE = 0x35
+_MLC_STATUS = 0x38
+_STATUS_MASTER_MAINPAGE = 0x39
+_FIFO_STATUS1 = 0x3A
+_FIFO_STATUS2 = 0x3B
+_TIMESTAMP0 = 0x40
+_TIMESTAMP2 = 0x42
+_STEP_COUNTER = 0x4B
+_TAP_CFG2 = 0x58
+_MD1_CFG = 0x5E
+_MD2_CFG = 0x5F
+_X_OFS_USR = 0x73
+_FIFO_DATA_OUT_TAG = 0x78
+_FIFO_DATA_OUT_END = 0x7E
+
+# embedded function bank
+_PAGE_SEL = 0x02
+_PAGE_ADDRESS = 0x08
+_PAGE_VALUE = 0x09
+_EMB_FUNC_EN_B = 0x05
+_EMB_FUNC_INT1 = 0x0A
+_MLC_INT1 = 0x0D
+_EMB_FUNC_INT2 = 0x0E
+_MLC_INT2 = 0x11
+_EMB_MLC_STATUS = 0x15
+_PAGE_RW = 0x17
+_EMB_FUNC_FIFO_CFG = 0x44
+_EMB_STEP_COUNTER = 0x62
+_EMB_FUNC_SRC = 0x64
+_MLC0_SRC = 0x70
+# sensor hub bank
+_SENSOR_HUB_1 = 0x02
+_MASTER_CONFIG = 0x14
+_SLV0_ADD = 0x15
+_SLV0_CONFIG = 0x17
+_DATAWRITE_SLV0 = 0x21
+_STATUS_MASTER = 0x22
+
+_CTRL3_C_RESET_VALUE = 0x04  # IF_INC
+_CTRL3_C_SW_RESET = 0x01
+_CTRL3_C_IF_INC = 0x04
+_CTRL6_C_USR_OFF_W = 0x08
+_CTRL7_G_USR_OFF_ON_OUT = 0x02
+_CTRL10_C_PEDO_RST_STEP = 0x02
+_CTRL10_C_TIMESTAMP_EN = 0x20
+_INT1_CTRL_STEP_DETECTOR = 0x80
+_EMB_FUNC_INT_STEP_DETECTOR = 0x08
+_EMB_FUNC_FIFO_CFG_PEDO = 0x40
+_EMB_FUNC_SRC_PEDO_RST_STEP = 0x80
+# (Event, MDx_CFG routing bit, source register, bits set in it) of the basic events
+_BASIC_EVENTS = (
+    (0x0001, 0x10, _WAKE_UP_SRC, 0x20),
+    (0x0002, 0x20, _WAKE_UP_SRC, 0x08),
+    (0x0004, 0x40, _TAP_SRC, 0x60),
+    (0x0008, 0x08, _TAP_SRC, 0x50),
+    (0x0010, 0x04, _D6D_SRC, 0x40),
+    (0x0020, 0x80, _WAKE_UP_SRC, 0x40),
+)
+_MD_CFG_INT_EMB_FUNC = 0x02
+_PAGE_RW_READ = 0x20
+_PAGE_RW_WRITE = 0x40
+_MASTER_CONFIG_MASTER_ON = 0x04
+_MASTER_CONFIG_WRITE_ONCE = 0x40
+_SLV_ADD_READ = 0x01
+_SLV_CONFIG_BATCH = 0x08
+_STATUS_MASTER_SENS_HUB_ENDOP = 0x01
+_STATUS_MASTER_SLAVE0_NACK = 0x08
+_STATUS_MASTER_WR_ONCE_DONE = 0x80
+_SENSOR_HUB_RATES = (104.0, 52.0, 26.0, 12.5)
+_SENSOR_HUB_OUTPUTS = 18
+_FIFO_CTRL2_UNCOPTR_RATE = (0, 8, 16, 32)
+_FIFO_CTRL2_FIFO_COMPR_RT_EN = 0x40
+_EMB_FUNC_EN_B_FIFO_COMPR_EN = 0x08
+# the tags of the NC_T_2, NC_T_1, 2xC and 3xC words follow, for each FIFO stream
+_COMPRESSED_TAGS = {"fifo_accel": (FIFOTag.ACCEL, 0x06), "fifo_gyro": (FIFOTag.GYRO, 0x0A)}
+_STATUS_XLDA = 0x01
+_STATUS_GDA = 0x02
+_STATUS_TDA = 0x04
+_FIFO_STATUS2_FULL = 0x20
+_FIFO_STATUS2_OVR = 0x40
+_FIFO_STATUS2_WTM = 0x80
+_TIMESTAMP_RESET = 0xAA
+
+_READ_ONLY = frozenset(
+    (_WHO_AM_I, _MLC_STATUS, _FIFO_STATUS1, _FIFO_STATUS2, _TIMESTAMP0, 0x41, 0x43)
+    + tuple(range(0x1A, 0x2E))
+    + tuple(range(_FIFO_DATA_OUT_TAG, _FIFO_DATA_OUT_END + 1))
+)
+_FIFO_DEPTH = 512  # words
+_TEMPERATURE_BATCH_RATES = (0, 1.6, 12.5, 52.0)
+_TIMESTAMP_DECIMATION = (0, 1, 8, 32)
+_TIMESTAMP_FREQUENCY = 40000
+_STANDARD_GRAVITY = 9.80665
+_USER_OFFSET_WEIGHT_FINE = 1000 / 1024
+_USER_OFFSET_WEIGHT_COARSE = 1000 / 64
+_PEDOMETER_RATE = 26.0  # Hz, the step detector pulses last one period
+_INACTIVE_ACCEL_RATE = 12.5  # Hz
+_WAKE_UP_SRC_WU_IA = 0x08
+_WAKE_UP_SRC_SLEEP_STATE = 0x10
+_WAKE_UP_SRC_SLEEP_CHANGE_IA = 0x40
+_ALL_INT_SRC_SLEEP_CHANGE_IA = 0x20
+
+
+def _stationary(_: float) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+    return (0.0, 0.0, _STANDARD_GRAVITY), (0.0, 0.0, 0.0)
+
+
+def _to_raw(value: float) -> int:
+    return max(-32768, min(32767, round(value)))
+
+
+class _SimulatedBus:
+    """Locking and the transaction, byte and time counters shared by the simulated buses"""
+
+    def __init__(self, frequency: int) -> None:
+        self.frequency = frequency
+        self.transactions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.bus_time = 0.0
+        self._locked = False
+
+    def reset_stats(self) -> None:
+        """Set the transaction, byte and time counters back to zero"""
+        self.transactions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.bus_time = 0.0
+
+    def __enter__(self) -> "_SimulatedBus":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.deinit()
+        return False
+
+    def deinit(self) -> None:
+        """Release the bus. Does nothing for the simulated bus"""
+
+    def try_lock(self) -> bool:
+        """Lock the bus, returning `True` if the lock was taken"""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Release the lock taken by `try_lock`"""
+        self._locked = False
+
+
+class SimulatedI2C(_SimulatedBus):
+    """Stands in for a ``busio.I2C`` bus with `SimulatedLSM6DS` devices attached.
+
+    Besides the bus methods used by ``adafruit_bus_device``, it counts the transactions and
+    bytes sent over the bus, and the time they would take at ``frequency``.
+
+    :param devices: The devices on the bus
+    :param int frequency: The bus clock in Hz, used for ``bus_time``. Defaults to 400 kHz
+    """
+
+    def __init__(self, *devices: "SimulatedLSM6DS", frequency: int = 400000) -> None:
+        super().__init__(frequency)
+        self.devices = {}
+        for device in devices:
+            self.add_device(device)
+
+    def add_device(self, device: "SimulatedLSM6DS") -> None:
+        """Attach ``device`` to the bus at its ``address``"""
+        if device.address in self.devices:
+            raise ValueError("Address 0x%02X is already in use" % device.address)
+        self.devices[device.address] = device
+
+    def scan(self) -> list:
+        """The addresses of the attached devices"""
+        return sorted(self.devices)
+
+    def _device(self, address: int) -> "SimulatedLSM6DS":
+        try:
+            return self.devices[address]
+        except KeyError:
+            raise OSError(19, "No such device") from None
+
+    def _count(self, written: int, read: int, starts: int = 1) -> None:
+        self.transactions += 1
+        self.bytes_written += written
+        self.bytes_read += read
+        # each byte and its acknowledge is 9 clocks, plus an address byte and start
+        # condition per start and one stop condition
+        bits = 9 * (written + read) + 10 * starts + 1
+        self.bus_time += bits / self.frequency
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Write ``buffer[start:end]`` to the device at ``address``"""
+        device = self._device(address)
+        if end is None:
+            end = len(buffer)
+        self._count(end - start, 0)
+        device.write(buffer[start:end])
+
+    def readfrom_into(
+        self, address: int, buffer: WriteableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Read into ``buffer[start:end]`` from the device at ``address``"""
+        device = self._device(address)
+        if end is None:
+            end = len(buffer)
+        self._count(0, end - start)
+        buffer[start:end] = device.read(end - start)
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write ``out_buffer[out_start:out_end]`` then read into
+        ``in_buffer[in_start:in_end]`` with a repeated start"""
+        device = self._device(address)
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        self._count(out_end - out_start, in_end - in_start, starts=2)
+        device.write(out_buffer[out_start:out_end])
+        in_buffer[in_start:in_end] = device.read(in_end - in_start)
+
+
+class SimulatedSPI(_SimulatedBus):
+    """Stands in for a ``busio.SPI`` bus with one `SimulatedLSM6DS` attached, selected by
+    `chip_select`. Pass both to the driver to use its SPI transport:
+
+    .. code-block:: python
+
+        spi = SimulatedSPI(SimulatedLSM6DS(LSM6DSOX))
+        sensor = LSM6DSOX(spi, spi_cs=spi.chip_select)
+
+    Each period with chip select asserted counts as one transaction.
+
+    :param device: The device on the bus
+    :param int frequency: The bus clock in Hz, used for ``bus_time``. Defaults to 10 MHz
+    """
+
+    def __init__(self, device: "SimulatedLSM6DS", frequency: int = 10000000) -> None:
+        super().__init__(frequency)
+        self.device = device
+        self.chip_select = _ChipSelect(self)
+        self.baudrate = None
+        self._selected = False
+        self._addressed = False
+        self._reading = False
+        self._written = 0
+        self._read = 0
+
+    def configure(
+        self, *, baudrate: int = 100000, polarity: int = 0, phase: int = 0, bits: int = 8
+    ) -> None:
+        """Set the bus settings. Only the sensor's modes 0 and 3 are allowed"""
+        if polarity != phase or bits != 8:
+            raise ValueError("The LSM6DS uses SPI mode 0 or 3 with 8 bit words")
+        self.baudrate = baudrate
+
+    def _select(self, selected: bool) -> None:
+        if selected and not self._selected:
+            self._addressed = False
+            self._written = 0
+            self._read = 0
+        elif self._selected and not selected:
+            self.transactions += 1
+            self.bytes_written += self._written
+            self.bytes_read += self._read
+            self.bus_time += 8 * (self._written + self._read) / self.frequency
+        self._selected = selected
+
+    def write(self, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Clock out ``buffer[start:end]``. The first byte after chip select is asserted is
+        the register address, with the top bit set for a read"""
+        if end is None:
+            end = len(buffer)
+        if not self._selected or start >= end:
+            return
+        self._written += end - start
+        if not self._addressed:
+            self._addressed = True
+            address = buffer[start]
+            self._reading = bool(address & 0x80)
+            self.device.write(bytes((address & 0x7F,)))
+            start += 1
+        if start < end and not self._reading:
+            # continue the write at the register after the last one written
+            self.device.write_values(buffer[start:end])
+
+    def readinto(
+        self,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        write_value: int = 0,
+    ) -> None:
+        """Clock in ``buffer[start:end]`` from the addressed registers"""
+        if end is None:
+            end = len(buffer)
+        if not self._selected:
+            for i in range(start, end):
+                buffer[i] = 0xFF
+            return
+        self._read += end - start
+        buffer[start:end] = self.device.read(end - start)
+
+
+class _ChipSelect:
+    """The chip select pin of a `SimulatedSPI` bus, driven like a ``DigitalInOut``"""
+
+    def __init__(self, bus: SimulatedSPI) -> None:
+        self._bus = bus
+        self._value = True
+
+    def switch_to_output(self, value: bool = False, **kwargs) -> None:
+        """Make the pin an output with the given ``value``"""
+        self.value = value
+
+    @property
+    def value(self) -> bool:
+        """The pin level. The sensor is selected while it is low"""
+        return self._value
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        self._value = bool(value)
+        self._bus._select(not self._value)
+
+
+class SimulatedPin:
+    """An INT1 or INT2 pin of a `SimulatedLSM6DS`, which can be passed to
+    `adafruit_lsm6ds.LSM6DS.wait_for_interrupt` like a ``digitalio.DigitalInOut``"""
+
+    def __init__(self, device: "SimulatedLSM6DS", int2: bool) -> None:
+        self._device = device
+        self._int2 = int2
+
+    @property
+    def value(self) -> bool:
+        """`True` while one of the signals routed to the pin is active"""
+        return self._device.interrupt_active(self._int2)
+
+
+class SimulatedLSM6DS:
+    """A simulated LSM6DS family sensor.
+
+    The samples can come from a waveform or from recorded data. A waveform is a function
+    of the time in seconds returning an ``(acceleration, gyro)`` or
+    ``(acceleration, gyro, temperature)`` tuple, in m / s ^ 2, radians / second and
+    Celsius. Recorded data is a sequence of such tuples, which is replayed in a loop at the
+    accelerometer data rate. By default the sensor lies still and flat.
+
+    It can be attached to a `SimulatedI2C` or a `SimulatedSPI` bus. The FIFO triggered modes
+    behave like their initial mode, since there are no trigger events, and the FIFO holds
+    512 words.
+
+    :param sensor_class: The driver class of the simulated part, such as
+        `adafruit_lsm6ds.lsm6dsox.LSM6DSOX`. It sets WHO_AM_I, the ranges and the features
+    :param int address: The I2C address. Defaults to :const:`0x6A`
+    :param samples: A waveform function or a sequence of recorded samples
+    :param clock: A function returning the current time in seconds. Pass a function
+        returning a controlled time for repeatable results. Defaults to `time.monotonic`
+    """
+
+    def __init__(
+        self,
+        sensor_class: Type[LSM6DS],
+        address: int = 0x6A,
+        samples: Optional[Union[Callable[[float], Tuple], Sequence[Tuple]]] = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if sensor_class.CHIP_ID is None:
+            raise ValueError("sensor_class must be a subclass of LSM6DS")
+        self.sensor_class = sensor_class
+        self.address = address
+        self.clock = clock
+        self._samples = _stationary if samples is None else samples
+        self._tagged_fifo = sensor_class._supports_tagged_fifo
+        self.registers = bytearray(0x80)
+        """The user bank registers"""
+        self.embedded_registers = bytearray(0x80)
+        """The embedded function bank registers"""
+        self.sensor_hub_registers = bytearray(0x80)
+        """The sensor hub bank registers"""
+        self.auxiliary_devices = {}
+        """The devices on the sensor hub's auxiliary bus, as a dictionary of I2C addresses to
+        register maps. See `add_auxiliary_device`"""
+        self.pages = {}
+        """The embedded function advanced pages, as a dictionary of ``(page, address)`` to
+        byte values written through PAGE_VALUE"""
+        self.fifo = deque((), _FIFO_DEPTH)
+        """The 7-byte words in the FIFO, oldest first"""
+        self.int1 = SimulatedPin(self, False)
+        self.int2 = SimulatedPin(self, True)
+        self._pointer = 0
+        self._start = clock()
+        self._streams = {}
+        self._streams_start = 0.0
+        self._timestamp_origin = None
+        self._sample_time = None
+        self._sample = None
+        self._step_time = None
+        self._clear_after_read = set()
+        self._sleeping = False
+        self._compression = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Return the user bank registers to their power-on values and empty the FIFO, as a
+        software reset does"""
+        registers = self.registers
+        for i in range(len(registers)):
+            registers[i] = 0
+        registers[_WHO_AM_I] = self.sensor_class.CHIP_ID
+        registers[_CTRL3_C] = _CTRL3_C_RESET_VALUE
+        self.fifo.clear()
+        self._compression = {}
+        self._streams = {}
+        self._streams_start = self.time
+        self._timestamp_origin = None
+        self._step_time = None
+        self._sleeping = False
+
+    @property
+    def time(self) -> float:
+        """Seconds since the device was created, according to ``clock``"""
+        return self.clock() - self._start
+
+    def set_mlc_output(self, index: int, value: int) -> None:
+        """Set the output of machine learning core decision tree ``index`` and flag it in
+        MLC_STATUS, as when the tree detects a new class"""
+        self.embedded_registers[_MLC0_SRC + index] = value
+        self.registers[_MLC_STATUS] |= 1 << index
+
+    def add_auxiliary_device(self, address: int) -> bytearray:
+        """Attach a device to the sensor hub's auxiliary bus and return its 128 registers,
+        which the sensor hub reads and writes. Set its output registers to simulate its
+        measurements. Register addresses wrap at 0x80, so the auto-increment bit that
+        devices such as the LIS3MDL take in the register address is ignored
+
+        :param int address: The 7-bit I2C address of the device
+        """
+        registers = bytearray(0x80)
+        self.auxiliary_devices[address] = registers
+        return registers
+
+    def add_steps(self, count: int = 1) -> None:
+        """Count ``count`` steps at the current time, as the pedometer does when it detects
+        them: the step counter increases, the step detector signal pulses and, when the step
+        counter is batched, one ``FIFOTag.STEP_COUNTER`` word per step is added to the FIFO"""
+        self._update()
+        now = self.time
+        if self.sensor_class._supports_embedded_functions:
+            bank, register = self.embedded_registers, _EMB_STEP_COUNTER
+        else:
+            bank, register = self.registers, _STEP_COUNTER
+        steps = struct.unpack_from("<H", bank, register)[0]
+        batch = (
+            self._tagged_fifo
+            and self.registers[_FIFO_CTRL4] & 0x07
+            and self.embedded_registers[_EMB_FUNC_FIFO_CFG] & _EMB_FUNC_FIFO_CFG_PEDO
+        )
+        for _ in range(count):
+            steps = (steps + 1) & 0xFFFF
+            if batch:
+                word = struct.pack("<BHI", FIFOTag.STEP_COUNTER << 3, steps, self._timestamp(now))
+                self.add_fifo_word(word)
+        struct.pack_into("<H", bank, register, steps)
+        self._step_time = now
+        if self.sensor_class._supports_embedded_functions:
+            self.registers[_EMB_FUNC_STATUS_MAINPAGE] |= _EMB_FUNC_INT_STEP_DETECTOR
+
+    def add_event(self, events: int, source: int = 0) -> None:
+        """Report ``events``, a combination of `adafruit_lsm6ds.Event` values, as when the
+        event detectors fire. The basic events are flagged in ALL_INT_SRC and their source
+        registers, the others in EMB_FUNC_STATUS_MAINPAGE, until ALL_INT_SRC, or
+        EMB_FUNC_STATUS_MAINPAGE, is read.
+
+        :param int events: The events to report
+        :param int source: Extra bits to set in the source registers, such as the axis and
+            sign of a tap in TAP_SRC or the sides facing up in D6D_SRC
+        """
+        registers = self.registers
+        for event, _, register, bits in _BASIC_EVENTS:
+            if events & event:
+                registers[_ALL_INT_SRC] |= event
+                registers[register] |= bits | source
+        registers[_EMB_FUNC_STATUS_MAINPAGE] |= events >> 8 & 0xFF
+
+    def set_moving(self, moving: bool) -> None:
+        """Start or stop moving. When inactivity detection is enabled in TAP_CFG2, stopping
+        puts the sensor to sleep, as when the sleep duration passes without a wake-up, and
+        moving wakes it up. Each change flags ``Event.SLEEP_CHANGE`` and switches between
+        the configured data rates and the inactive ones, 12.5 Hz for the accelerometer and,
+        depending on the mode, none for the gyro"""
+        registers = self.registers
+        sleeping = not moving and bool(registers[_TAP_CFG2] & 0x60)
+        if sleeping == self._sleeping:
+            return
+        # the samples due so far are produced at the old data rates
+        self._update()
+        self._sleeping = sleeping
+        self._streams = {}
+        self._streams_start = self.time
+        registers[_ALL_INT_SRC] |= _ALL_INT_SRC_SLEEP_CHANGE_IA
+        registers[_WAKE_UP_SRC] |= _WAKE_UP_SRC_SLEEP_CHANGE_IA
+        if not sleeping:
+            registers[_ALL_INT_SRC] |= 0x02
+            registers[_WAKE_UP_SRC] |= _WAKE_UP_SRC_WU_IA
+
+    def _data_rates(self) -> Tuple[float, float]:
+        """The accelerometer and gyro data rates in Hz, following the sleep state"""
+        registers = self.registers
+        accel_rate = self._rate(registers[_CTRL1_XL] >> 4)
+        gyro_rate = self._rate(registers[_CTRL2_G] >> 4)
+        if self._sleeping:
+            accel_rate = min(accel_rate, _INACTIVE_ACCEL_RATE)
+            if registers[_TAP_CFG2] & 0x60 != 0x20:
+                gyro_rate = 0
+        return accel_rate, gyro_rate
+
+    def _step_detected(self) -> bool:
+        return self._step_time is not None and self.time - self._step_time < 1 / _PEDOMETER_RATE
+
+    def interrupt_active(self, int2: bool = False) -> bool:
+        """Whether one of the signals routed to INT1, or INT2, is active"""
+        self._update()
+        registers = self.registers
+        routing = registers[_INT2_CTRL if int2 else _INT1_CTRL]
+        status = registers[_STATUS_REG]
+        fifo_status = registers[_FIFO_STATUS2]
+        if (
+            routing & 0x01
+            and status & _STATUS_XLDA
+            or routing & 0x02
+            and status & _STATUS_GDA
+            or routing & 0x08
+            and fifo_status & _FIFO_STATUS2_WTM
+            or routing & 0x10
+            and fifo_status & _FIFO_STATUS2_OVR
+            or routing & 0x20
+            and fifo_status & _FIFO_STATUS2_FULL
+        ):
+            return True
+        if not self.sensor_class._supports_embedded_functions:
+            return not int2 and bool(routing & _INT1_CTRL_STEP_DETECTOR) and self._step_detected()
+        md_cfg = registers[_MD2_CFG if int2 else _MD1_CFG]
+        for event, bit, _, _ in _BASIC_EVENTS:
+            if md_cfg & bit and registers[_ALL_INT_SRC] & event:
+                return True
+        return bool(md_cfg & _MD_CFG_INT_EMB_FUNC) and self._embedded_interrupt_active(int2)
+
+    def _embedded_interrupt_active(self, int2: bool) -> bool:
+        registers = self.registers
+        embedded = self.embedded_registers
+        if embedded[_MLC_INT2 if int2 else _MLC_INT1] & registers[_MLC_STATUS]:
+            return True
+        routing = embedded[_EMB_FUNC_INT2 if int2 else _EMB_FUNC_INT1]
+        if routing & _EMB_FUNC_INT_STEP_DETECTOR and self._step_detected():
+            return True
+        # tilt and significant motion
+        return bool(routing & registers[_EMB_FUNC_STATUS_MAINPAGE] & 0x30)
+
+    def write(self, data: ReadableBuffer) -> None:
+        """Handle an I2C write: a register address optionally followed by values"""
+        if not data:
+            return
+        self._pointer = data[0]
+        self.write_values(data[1:])
+
+    def write_values(self, values: ReadableBuffer) -> None:
+        """Write ``values`` starting at the current register address"""
+        self._update()
+        for value in values:
+            self._write_register(self._pointer, value)
+            self._advance()
+
+    def read(self, count: int) -> bytearray:
+        """Handle an I2C read of ``count`` bytes from the current register address"""
+        self._update()
+        data = bytearray(count)
+        for i in range(count):
+            data[i] = self._read_register(self._pointer)
+            self._advance()
+        # latched event sources are cleared once the whole burst has been read
+        for register in self._clear_after_read:
+            self.registers[register] = 0
+        self._clear_after_read.clear()
+        return data
+
+    def _advance(self) -> None:
+        if not self.registers[_CTRL3_C] & _CTRL3_C_IF_INC:
+            return
+        if self._pointer == _FIFO_DATA_OUT_END and self._bank() is self.registers:
+            # FIFO reads roll over so that words can be read in one burst
+            self._pointer = _FIFO_DATA_OUT_TAG
+        else:
+            self._pointer = (self._pointer + 1) & 0x7F
+
+    def _bank(self) -> bytearray:
+        access = self.registers[_FUNC_CFG_ACCESS]
+        if access & _FUNC_CFG_EMBEDDED:
+            return self.embedded_registers
+        if access & _FUNC_CFG_SENSOR_HUB:
+            return self.sensor_hub_registers
+        return self.registers
+
+    def _write_register(self, register: int, value: int) -> None:
+        bank = self.registers if register == _FUNC_CFG_ACCESS else self._bank()
+        if bank is self.embedded_registers:
+            self._write_embedded(register, value)
+            return
+        if bank is not self.registers:
+            bank[register] = value
+            if register == _MASTER_CONFIG:
+                # the sensor hub restarts at the next accelerometer sample
+                bank[_STATUS_MASTER] = 0
+                self.registers[_STATUS_MASTER_MAINPAGE] = 0
+                self._streams["sensor_hub"] = int(self.time * self._sensor_hub_rate())
+            return
+        if register == _TIMESTAMP2:
+            if value == _TIMESTAMP_RESET:
+                self._timestamp_origin = self.time
+            return
+        if (
+            register == _CTRL10_C
+            and value & _CTRL10_C_PEDO_RST_STEP
+            and not self.sensor_class._supports_embedded_functions
+        ):
+            self.registers[_STEP_COUNTER] = 0
+            self.registers[_STEP_COUNTER + 1] = 0
+        if register in _READ_ONLY:
+            return
+        if register == _CTRL3_C and value & _CTRL3_C_SW_RESET:
+            # the reset completes before the next transaction, clearing the bit
+            self.reset()
+            return
+        previous = self.registers[register]
+        self.registers[register] = value
+        if register == _CTRL10_C and value & _CTRL10_C_TIMESTAMP_EN:
+            if not previous & _CTRL10_C_TIMESTAMP_EN:
+                self._timestamp_origin = self.time
+        elif register in {_CTRL1_XL, _CTRL2_G, _FIFO_CTRL3, _FIFO_CTRL4}:
+            # restart the sample streams at the new rates
+            self._streams = {}
+            self._streams_start = self.time
+            if register == _FIFO_CTRL4 and not value & 0x07:
+                self.fifo.clear()
+                self._compression = {}
+                self._update_fifo_status()
+
+    def _write_embedded(self, register: int, value: int) -> None:
+        bank = self.embedded_registers
+        if register == _PAGE_VALUE and bank[_PAGE_RW] & _PAGE_RW_WRITE:
+            page = bank[_PAGE_SEL] >> 4
+            self.pages[(page, bank[_PAGE_ADDRESS])] = value
+            bank[_PAGE_ADDRESS] = (bank[_PAGE_ADDRESS] + 1) & 0xFF
+            return
+        if register == _EMB_FUNC_SRC and value & _EMB_FUNC_SRC_PEDO_RST_STEP:
+            bank[_EMB_STEP_COUNTER] = 0
+            bank[_EMB_STEP_COUNTER + 1] = 0
+            return
+        bank[register] = value
+
+    def _read_register(self, register: int) -> int:
+        bank = self.registers if register == _FUNC_CFG_ACCESS else self._bank()
+        if bank is self.embedded_registers:
+            if register == _PAGE_VALUE and bank[_PAGE_RW] & _PAGE_RW_READ:
+                page = bank[_PAGE_SEL] >> 4
+                value = self.pages.get((page, bank[_PAGE_ADDRESS]), 0)
+                bank[_PAGE_ADDRESS] = (bank[_PAGE_ADDRESS] + 1) & 0xFF
+                return value
+            if register == _EMB_MLC_STATUS:
+                # reading the embedded copy clears the latched status
+                value = self.registers[_MLC_STATUS]
+                self.registers[_MLC_STATUS] = 0
+                return value
+            if _MLC0_SRC <= register < _MLC0_SRC + 8:
+                self.registers[_MLC_STATUS] &= ~(1 << (register - _MLC0_SRC))
+            return bank[register]
+        if bank is not self.registers:
+            return bank[register]
+        registers = self.registers
+        if register == _FIFO_DATA_OUT_TAG and self._tagged_fifo:
+            word = self.fifo.popleft() if self.fifo else bytes(7)
+            registers[_FIFO_DATA_OUT_TAG : _FIFO_DATA_OUT_END + 1] = word
+            self._update_fifo_status()
+        elif _OUTX_L_A <= register <= _OUTZ_H_A:
+            registers[_STATUS_REG] &= ~_STATUS_XLDA
+        elif _OUTX_L_G <= register < _OUTX_L_A:
+            registers[_STATUS_REG] &= ~_STATUS_GDA
+        elif _OUT_TEMP_L <= register < _OUTX_L_G:
+            registers[_STATUS_REG] &= ~_STATUS_TDA
+        elif register == _WAKE_UP_SRC and self._sleeping:
+            # the sleep state is not latched
+            return registers[register] | _WAKE_UP_SRC_SLEEP_STATE
+        elif register == _ALL_INT_SRC:
+            self._clear_after_read.update((_ALL_INT_SRC, _WAKE_UP_SRC, _TAP_SRC, _D6D_SRC))
+        elif register == _EMB_FUNC_STATUS_MAINPAGE:
+            self._clear_after_read.add(_EMB_FUNC_STATUS_MAINPAGE)
+        return registers[register]
+
+    def _sample_at(self, when: float) -> Tuple:
+        """The waveform or recorded sample at ``when`` seconds"""
+        if when == self._sample_time:
+            return self._sample
+        samples = self._samples
+        if callable(samples):
+            sample = samples(when)
+        else:
+            # recorded data is replayed at the accelerometer rate, or the gyro rate when
+            # the accelerometer is off
+            rate = self._rate(self.registers[_CTRL1_XL] >> 4) or self._rate(
+                self.registers[_CTRL2_G] >> 4
+            )
+            sample = samples[round(when * rate) % len(samples)]
+        self._sample_time = when
+        self._sample = sample
+        return sample
+
+    @staticmethod
+    def _rate(odr: int) -> float:
+        return Rate.string.get(odr, 0) if odr else 0
+
+    def _accel_raw(self, acceleration: Tuple[float, float, float]) -> Tuple[int, int, int]:
+        registers = self.registers
+        fs = (registers[_CTRL1_XL] >> 2) & 0x03
+        lsb = next(lsb for _, value, _, lsb in self.sensor_class._ACCEL_RANGES if value == fs)
+        milli_g = [value / _STANDARD_GRAVITY * 1000 for value in acceleration]
+        if self.sensor_class._supports_user_offset and (
+            registers[_CTRL7_G] & _CTRL7_G_USR_OFF_ON_OUT or not self._tagged_fifo
+        ):
+            coarse = registers[_CTRL6_C] & _CTRL6_C_USR_OFF_W
+            weight = _USER_OFFSET_WEIGHT_COARSE if coarse else _USER_OFFSET_WEIGHT_FINE
+            offsets = struct.unpack_from("<bbb", registers, _X_OFS_USR)
+            milli_g = [value - offset * weight for value, offset in zip(milli_g, offsets)]
+        return tuple(_to_raw(value / lsb) for value in milli_g)
+
+    def _gyro_raw(self, gyro: Tuple[float, float, float]) -> Tuple[int, int, int]:
+        ctrl2 = self.registers[_CTRL2_G]
+        ranges = self.sensor_class._GYRO_RANGES
+        if ctrl2 & 0x01 and any(value == 4000 for _, value, _, _ in ranges):
+            fs = 4000
+        elif ctrl2 & 0x02:
+            fs = 125
+        else:
+            fs = (ctrl2 >> 2) & 0x03
+        lsb = next(lsb for _, value, _, lsb in ranges if value == fs)
+        return tuple(_to_raw(degrees(value) * 1000 / lsb) for value in gyro)
+
+    def _timestamp(self, now: float) -> int:
+        if self._timestamp_origin is None:
+            return 0
+        return int((now - self._timestamp_origin) * _TIMESTAMP_FREQUENCY) & 0xFFFFFFFF
+
+    def _new_indices(self, name: str, rate: float, now: float) -> range:
+        """The sample indices of stream ``name`` produced since the last update"""
+        if not rate:
+            self._streams[name] = None
+            return range(0)
+        index = int(now * rate)
+        last = self._streams.get(name)
+        if last is None:
+            last = int(self._streams_start * rate)
+        self._streams[name] = index
+        if index <= last:
+            return range(0)
+        return range(last + 1, index + 1)
+
+    def _update(self) -> None:
+        """Produce the samples that are due at the current time"""
+        now = self.time
+        registers = self.registers
+        accel_rate, gyro_rate = self._data_rates()
+        accel = self._new_indices("accel", accel_rate, now)
+        if accel:
+            raw = self._accel_raw(self._sample_at(accel[-1] / accel_rate)[0])
+            struct.pack_into("<hhh", registers, _OUTX_L_A, *raw)
+            registers[_STATUS_REG] |= _STATUS_XLDA
+        gyro = self._new_indices("gyro", gyro_rate, now)
+        if gyro:
+            sample = self._sample_at(gyro[-1] / gyro_rate)
+            struct.pack_into("<hhh", registers, _OUTX_L_G, *self._gyro_raw(sample[1]))
+            temperature = sample[2] if len(sample) > 2 else 25.0
+            struct.pack_into("<h", registers, _OUT_TEMP_L, _to_raw((temperature - 25) * 256))
+            registers[_STATUS_REG] |= _STATUS_GDA | _STATUS_TDA
+        if registers[_CTRL10_C] & _CTRL10_C_TIMESTAMP_EN:
+            struct.pack_into("<I", registers, _TIMESTAMP0, self._timestamp(now))
+        if self.sensor_hub_registers[_MASTER_CONFIG] & _MASTER_CONFIG_MASTER_ON:
+            self._run_sensor_hub(now)
+        if self._tagged_fifo and registers[_FIFO_CTRL4] & 0x07:
+            self._batch(now, accel_rate, gyro_rate)
+
+    def _sensor_hub_rate(self) -> float:
+        """The sensor hub rate, which is capped at the accelerometer data rate"""
+        shub = self.sensor_hub_registers
+        if not shub[_MASTER_CONFIG] & _MASTER_CONFIG_MASTER_ON:
+            return 0
+        return min(_SENSOR_HUB_RATES[shub[_SLV0_CONFIG] >> 6], self._data_rates()[0])
+
+    def _sensor_hub_slaves(self) -> Iterator[Tuple[int, int, int, int]]:
+        """``(slave, address, register, config)`` of the running sensor hub slaves"""
+        shub = self.sensor_hub_registers
+        for slave in range((shub[_MASTER_CONFIG] & 0x03) + 1):
+            offset = _SLV0_ADD + 3 * slave
+            yield (slave,) + tuple(shub[offset : offset + 3])
+
+    def _run_sensor_hub(self, now: float) -> None:
+        """Run a sensor hub cycle if one is due: slave 0 writes, or each slave reads its
+        registers into the SENSOR_HUB outputs, one slave after the other"""
+        if not self._new_indices("sensor_hub", self._sensor_hub_rate(), now):
+            return
+        shub = self.sensor_hub_registers
+        status = shub[_STATUS_MASTER] & _STATUS_MASTER_WR_ONCE_DONE | _STATUS_MASTER_SENS_HUB_ENDOP
+        output = _SENSOR_HUB_1
+        for slave, address, register, config in self._sensor_hub_slaves():
+            device = self.auxiliary_devices.get(address >> 1)
+            if device is None:
+                status |= _STATUS_MASTER_SLAVE0_NACK << slave
+            elif address & _SLV_ADD_READ:
+                count = min(config & 0x07, _SENSOR_HUB_1 + _SENSOR_HUB_OUTPUTS - output)
+                for i in range(count):
+                    shub[output + i] = device[(register + i) & 0x7F]
+                output += count
+            elif not (
+                shub[_MASTER_CONFIG] & _MASTER_CONFIG_WRITE_ONCE
+                and status & _STATUS_MASTER_WR_ONCE_DONE
+            ):
+                device[register & 0x7F] = shub[_DATAWRITE_SLV0]
+                status |= _STATUS_MASTER_WR_ONCE_DONE
+        shub[_STATUS_MASTER] = status
+        self.registers[_STATUS_MASTER_MAINPAGE] = status
+
+    def _batch(self, now: float, accel_rate: float, gyro_rate: float) -> None:
+        """Add the words batched since the last update to the FIFO, in time order"""
+        registers = self.registers
+        accel_bdr = min(self._rate(registers[_FIFO_CTRL3] & 0x0F), accel_rate)
+        gyro_bdr = min(self._rate(registers[_FIFO_CTRL3] >> 4), gyro_rate)
+        temperature_bdr = _TEMPERATURE_BATCH_RATES[(registers[_FIFO_CTRL4] >> 4) & 0x03]
+        decimation = _TIMESTAMP_DECIMATION[registers[_FIFO_CTRL4] >> 6]
+        fastest = max(accel_bdr, gyro_bdr)
+        timestamp_bdr = fastest / decimation if decimation and fastest else 0
+        sensor_hub_bdr = 0
+        if any(config & _SLV_CONFIG_BATCH for _, _, _, config in self._sensor_hub_slaves()):
+            sensor_hub_bdr = self._sensor_hub_rate()
+        words = []
+        for order, (name, rate) in enumerate(
+            (
+                ("timestamp", timestamp_bdr),
+                ("fifo_accel", accel_bdr),
+                ("fifo_gyro", gyro_bdr),
+                ("fifo_temperature", temperature_bdr),
+                ("fifo_sensor_hub", sensor_hub_bdr),
+            )
+        ):
+            indices = self._new_indices(name, rate, now)
+            # older words would be overwritten anyway
+            for index in indices[-_FIFO_DEPTH:]:
+                words.append((index / rate, order, name))
+        words.sort()
+        for when, _, name in words:
+            self._push(name, when)
+        self._update_fifo_status()
+
+    def _push(self, name: str, when: float) -> None:
+        if name == "fifo_sensor_hub":
+            self._push_sensor_hub()
+            return
+        if name == "timestamp":
+            word = struct.pack("<BIxx", FIFOTag.TIMESTAMP << 3, self._timestamp(when))
+        else:
+            sample = self._sample_at(when)
+            if name in _COMPRESSED_TAGS:
+                if name == "fifo_accel":
+                    raw = self._accel_raw(sample[0])
+                else:
+                    raw = self._gyro_raw(sample[1])
+                if (
+                    self.registers[_FIFO_CTRL2] & _FIFO_CTRL2_FIFO_COMPR_RT_EN
+                    and self.embedded_registers[_EMB_FUNC_EN_B] & _EMB_FUNC_EN_B_FIFO_COMPR_EN
+                ):
+                    self._compress(name, raw)
+                    return
+                word = struct.pack("<Bhhh", _COMPRESSED_TAGS[name][0] << 3, *raw)
+            else:
+                temperature = sample[2] if len(sample) > 2 else 25.0
+                raw = _to_raw((temperature - 25) * 256)
+                word = struct.pack("<Bhxxxx", FIFOTag.TEMPERATURE << 3, raw)
+        self.add_fifo_word(word)
+
+    def _compress(self, name: str, raw: Tuple[int, int, int]) -> None:
+        """Batch the samples of a FIFO stream three at a time, as one 3xC word when they all
+        differ from the previous sample by 5 bits or less, as a 2xC word and an NC word when
+        the first two differ by 8 bits or less and as NC_T_2, NC_T_1 and NC words otherwise,
+        or when UNCOPTR_RATE forces an uncompressed sample"""
+        pending, previous, since_uncompressed = self._compression.get(name, ((), None, 0))
+        pending += (raw,)
+        if len(pending) < 3:
+            self._compression[name] = (pending, previous, since_uncompressed)
+            return
+        nc_tag, tag = _COMPRESSED_TAGS[name]
+        forced = _FIFO_CTRL2_UNCOPTR_RATE[(self.registers[_FIFO_CTRL2] >> 1) & 0x03]
+        since_uncompressed += 3
+        diffs = []
+        if previous is not None and not (forced and since_uncompressed >= forced):
+            for before, after in zip((previous,) + pending, pending):
+                diffs.extend(value - base for base, value in zip(before, after))
+        if diffs and all(-16 <= diff <= 15 for diff in diffs):
+            packed = [
+                diffs[i] & 0x1F | (diffs[i + 1] & 0x1F) << 5 | (diffs[i + 2] & 0x1F) << 10
+                for i in range(0, 9, 3)
+            ]
+            self.add_fifo_word(struct.pack("<BHHH", (tag + 3) << 3, *packed))
+        elif diffs and all(-128 <= diff <= 127 for diff in diffs[:6]):
+            self.add_fifo_word(struct.pack("<Bbbbbbb", (tag + 2) << 3, *diffs[:6]))
+            self.add_fifo_word(struct.pack("<Bhhh", nc_tag << 3, *pending[2]))
+        else:
+            self.add_fifo_word(struct.pack("<Bhhh", tag << 3, *pending[0]))
+            self.add_fifo_word(struct.pack("<Bhhh", (tag + 1) << 3, *pending[1]))
+            self.add_fifo_word(struct.pack("<Bhhh", nc_tag << 3, *pending[2]))
+            since_uncompressed = 0
+        self._compression[name] = ((), pending[2], since_uncompressed)
+
+    def _push_sensor_hub(self) -> None:
+        """Batch the data of the sensor hub slaves that have BATCH_EXT_SENS_x_EN set"""
+        for slave, address, register, config in self._sensor_hub_slaves():
+            device = self.auxiliary_devices.get(address >> 1)
+            if device is None or not address & _SLV_ADD_READ or not config & _SLV_CONFIG_BATCH:
+                continue
+            word = bytearray(7)
+            word[0] = (FIFOTag.SENSOR_HUB_SLAVE0 + slave) << 3
+            for i in range(min(config & 0x07, 6)):
+                word[1 + i] = device[(register + i) & 0x7F]
+            self.add_fifo_word(word)
+
+    def add_fifo_word(self, word: ReadableBuffer) -> None:
+        """Add a 7-byte word to the FIFO, following the FIFO mode when it is full"""
+        registers = self.registers
+        depth = _FIFO_DEPTH
+        if registers[_FIFO_CTRL2] & 0x80:  # STOP_ON_WTM
+            depth = min(depth, self._watermark() or depth)
+        if len(self.fifo) >= depth:
+            registers[_FIFO_STATUS2] |= _FIFO_STATUS2_OVR
+            if registers[_FIFO_CTRL4] & 0x07 == 1:  # FIFO mode stops when full
+                return
+            self.fifo.popleft()
+        self.fifo.append(bytes(word))
+        self._update_fifo_status()
+
+    def _watermark(self) -> int:
+        return (self.registers[_FIFO_CTRL1] | self.registers[_FIFO_CTRL2] << 8) & 0x1FF
+
+    def _update_fifo_status(self) -> None:
+        registers = self.registers
+        count = len(self.fifo)
+        status = count >> 8 | registers[_FIFO_STATUS2] & _FIFO_STATUS2_OVR
+        if not count:
+            status = 0
+        watermark = self._watermark()
+        if watermark and count >= watermark:
+            status |= _FIFO_STATUS2_WTM
+        if count >= _FIFO_DEPTH:
+            status |= _FIFO_STATUS2_FULL
+        registers[_FIFO_STATUS1] = count & 0xFF
+        registers[_FIFO_STATUS2] = status
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_lsm6ds.ucf`
+================================================================================
+
+Reads machine learning core configurations in ST's UCF text format, and compiles them into
+a compact binary format that loads faster and with less memory on CircuitPython
+
+The UCF text format has one ``Ac <register> <value>`` line per register write, in hex, and
+``WAIT <milliseconds>`` lines. Writes to consecutive registers are coalesced into a single
+auto-increment write, except across FUNC_CFG_ACCESS, which switches the register bank, and
+for PAGE_SEL, PAGE_ADDRESS and PAGE_VALUE in the embedded functions bank, which each have
+side effects on the page that is accessed and are always written on their own.
+
+A compiled file starts with the bytes ``UCF\\x01`` followed by records:
+
+* ``count``, ``register``, then ``count`` values to write starting at ``register``, with
+  ``count`` from 1 to 255
+* ``0``, then the wait time in milliseconds as a little-endian 16-bit value
+
+Compile a file on a computer, then copy the result to the board and pass it to
+`adafruit_lsm6ds.LSM6DS.load_mlc` in place of the UCF file:
+
+.. code-block:: shell
+
+    python -m adafruit_lsm6ds.ucf lsm6dsox_vibration_monitoring.ucf vibration.bin
+
+"""
+
+from micropython import const
+
+try:
+    from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+MAGIC = b"UCF\x01"
+"""The first bytes of a compiled UCF file"""
+
+_FUNC_CFG_ACCESS = const(0x01)
+_EMBEDDED_FUNC_ACCESS = const(0x80)
+# PAGE_SEL, PAGE_ADDRESS and PAGE_VALUE in the embedded functions bank
+_PAGE_REGISTERS = (0x02, 0x08, 0x09)
+_MAX_RUN = const(255)
+_WAIT = const(0)
+
+
+def _parse_text(lines: Iterable[str], buf: bytearray) -> Iterator[Tuple[Optional[bytearray], int]]:
+    end = 0
+    embedded = False
+    for line in lines:
+        if line.startswith("Ac"):
+            fields = line.split()
+            register = int(fields[1], 16)
+            value = int(fields[2], 16)
+            last = buf[0] + end - 2
+            paged = embedded and (register in _PAGE_REGISTERS or last in _PAGE_REGISTERS)
+            if register == _FUNC_CFG_ACCESS:
+                embedded = bool(value & _EMBEDDED_FUNC_ACCESS)
+            if (
+                end
+                and register == last + 1
+                and last != _FUNC_CFG_ACCESS
+                and not paged
+                and end <= _MAX_RUN
+            ):
+                buf[end] = value
+                end += 1
+                continue
+            if end:
+                yield buf, end
+            buf[0] = register
+            buf[1] = value
+            end = 2
+        elif line.startswith("WAIT"):
+            if end:
+                yield buf, end
+                end = 0
+            yield None, int(line.split()[1])
+    if end:
+        yield buf, end
+
+
+def _parse_compiled(
+    data: ReadableBuffer, buf: bytearray
+) -> Iterator[Tuple[Optional[bytearray], int]]:
+    offset = len(MAGIC)
+    while offset < len(data):
+        count = data[offset]
+        if count == _WAIT:
+            if offset + 3 > len(data):
+                raise ValueError("Truncated compiled UCF")
+            yield None, data[offset + 1] | data[offset + 2] << 8
+            offset += 3
+            continue
+        end = offset + 2 + count
+        if end > len(data):
+            raise ValueError("Truncated compiled UCF")
+        buf[0 : count + 1] = data[offset + 1 : end]
+        yield buf, count + 1
+        offset = end
+
+
+def _stream_compiled(file: BinaryIO, buf: bytearray) -> Iterator[Tuple[Optional[bytearray], int]]:
+    header = bytearray(2)
+    view = memoryview(buf)
+    while True:
+        read = file.readinto(header)
+        if not read:
+            return
+        if read != 2:
+            raise ValueError("Truncated compiled UCF")
+        count = header[0]
+        if count == _WAIT:
+            high = file.read(1)
+            if not high:
+                raise ValueError("Truncated compiled UCF")
+            yield None, header[1] | high[0] << 8
+            continue
+        buf[0] = header[1]
+        if file.readinto(view[1 : count + 1]) != count:
+            raise ValueError("Truncated compiled UCF")
+        yield buf, count + 1
+
+
+def ucf_commands(
+    source: Union[str, ReadableBuffer, Iterable[str]],
+) -> Iterator[Tuple[Optional[bytearray], int]]:
+    """Read the commands of a UCF text file or a compiled UCF file.
+
+    Yields ``(buffer, end)`` for each write, where ``buffer[0]`` is the first register and
+    ``buffer[1:end]`` are the values to write, ready to be passed to ``I2CDevice.write``. The
+    buffer is reused, so it must be used before the next command is read. Yields
+    ``(None, milliseconds)`` for each wait.
+
+    :param source: The path of a text or compiled UCF file, compiled UCF data as bytes, or
+        the lines of a UCF text file
+    """
+    buf = bytearray(_MAX_RUN + 1)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        if bytes(source[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a compiled UCF")
+        yield from _parse_compiled(source, buf)
+    elif isinstance(source, str):
+        with open(source, "rb") as file:
+            if file.read(len(MAGIC)) == MAGIC:
+                yield from _stream_compiled(file, buf)
+                return
+        with open(source) as file:
+            yield from _parse_text(file, buf)
+    else:
+        yield from _parse_text(source, buf)
+
+
+def compile_ucf(source: Union[str, Iterable[str]], destination: Optional[str] = None) -> bytes:
+    """Compile a UCF text file into the binary format described above.
+
+    :param source: The path of the UCF text file, or its lines
+    :param str destination: The path to write the compiled file to. Optional
+    :return: The compiled data
+    """
+    compiled = bytearray(MAGIC)
+    for buf, end in ucf_commands(source):
+        if buf is None:
+            # split waits that do not fit in 16 bits
+            remaining = end
+            while remaining > 0:
+                wait = min(remaining, 0xFFFF)
+                compiled.extend((_WAIT, wait & 0xFF, wait >> 8))
+                remaining -= wait
+        else:
+            compiled.append(end - 1)
+            compiled.extend(buf[:end])
+    if destination is not None:
+        with open(destination, "wb") as file:
+            file.write(compiled)
+    return bytes(compiled)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        print("Usage: python -m adafruit_lsm6ds.ucf input.ucf output.bin")
+        sys.exit(1)
+    compile_ucf(sys.argv[1], sys.argv[2])
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example measures the accelerometer and gyro bias once, with the board
+lying still and flat, and saves it so later runs can restore it instead.
+On CircuitPython the filesystem must be writable from code to save the file."""
+
+import time
+
+import board
+
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+
+# from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32 as LSM6DS
+# from adafruit_lsm6ds.ism330dhcx import ISM330DHCX as LSM6DS
+
+CALIBRATION_FILE = "/lsm6ds_calibration.bin"
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = LSM6DS(i2c)
+
+try:
+    with open(CALIBRATION_FILE, "rb") as calibration_file:
+        sensor.calibration = calibration_file.read()
+    print("Restored the saved calibration")
+except OSError:
+    print("Calibrating, keep the board still and flat...")
+    calibration = sensor.calibrate()
+    try:
+        with open(CALIBRATION_FILE, "wb") as calibration_file:
+            calibration_file.write(calibration)
+    except OSError:
+        print("Could not save the calibration")
+
+while True:
+    accel_x, accel_y, accel_z = sensor.acceleration
+    gyro_x, gyro_y, gyro_z = sensor.gyro
+    print(f"Acceleration: X:{accel_x:.2f}, Y: {accel_y:.2f}, Z: {accel_z:.2f} m/s^2")
+    print(f"Gyro X:{gyro_x:.2f}, Y: {gyro_y:.2f}, Z: {gyro_z:.2f} radians/s")
+    print("")
+    time.sleep(0.5)
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example lets the sensor detect taps and free-falls itself and only
+reads it when the INT1 pin shows that one of them has happened."""
+
+import board
+import digitalio
+
+from adafruit_lsm6ds import Event, Rate
+from adafruit_lsm6ds.events import EventDispatcher
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+
+# from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32 as LSM6DS
+# from adafruit_lsm6ds.ism330dhcx import ISM330DHCX as LSM6DS
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = LSM6DS(i2c)
+
+# connect the sensor's INT1 pin to D5
+int1 = digitalio.DigitalInOut(board.D5)
+int1.direction = digitalio.Direction.INPUT
+
+# the tap detector needs a data rate of at least 417 Hz
+sensor.accelerometer_data_rate = Rate.RATE_416_HZ
+sensor.gyro_data_rate = Rate.RATE_SHUTDOWN
+sensor.configure_tap(double_tap=True)
+sensor.configure_free_fall()
+# keep INT1 asserted until the events are read, so polling its level cannot miss them
+sensor.latch_events = True
+sensor.route_events(int1=Event.SINGLE_TAP | Event.DOUBLE_TAP | Event.FREE_FALL)
+
+
+def tapped(event, source):
+    axis = "x" if source & 0x04 else "y" if source & 0x02 else "z"
+    print(f"{Event.string[event]} on the {axis} axis")
+
+
+def dropped(event, source):
+    print("Free-fall!")
+
+
+events = EventDispatcher(sensor)
+events.add_callback(Event.SINGLE_TAP | Event.DOUBLE_TAP, tapped)
+events.add_callback(Event.FREE_FALL, dropped)
+
+while True:
+    events.poll_on_interrupt(int1)
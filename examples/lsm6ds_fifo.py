@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example batches high rate accelerometer and gyro samples into the
+hardware FIFO and drains them in bursts, so no samples are lost even when
+the loop is too slow to keep up with the data rate."""
+
+import time
+
+import board
+
+from adafruit_lsm6ds import FIFOMode, FIFOTag, Rate
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+
+# from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32 as LSM6DS
+# from adafruit_lsm6ds.ism330dhcx import ISM330DHCX as LSM6DS
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = LSM6DS(i2c)
+
+sensor.accelerometer_data_rate = Rate.RATE_833_HZ
+sensor.gyro_data_rate = Rate.RATE_833_HZ
+sensor.fifo_accel_batch_rate = Rate.RATE_833_HZ
+sensor.fifo_gyro_batch_rate = Rate.RATE_833_HZ
+sensor.fifo_mode = FIFOMode.CONTINUOUS
+
+while True:
+    time.sleep(0.1)
+    accel_samples = 0
+    gyro_samples = 0
+    for tag, data in sensor.read_fifo():
+        if tag == FIFOTag.ACCEL:
+            accel_samples += 1
+            accel_x, accel_y, accel_z = data
+            print(f"Acceleration: X:{accel_x:.2f}, Y: {accel_y:.2f}, Z: {accel_z:.2f} m/s^2")
+        elif tag == FIFOTag.GYRO:
+            gyro_samples += 1
+            gyro_x, gyro_y, gyro_z = data
+            print(f"Gyro X:{gyro_x:.2f}, Y: {gyro_y:.2f}, Z: {gyro_z:.2f} radians/s")
+    print(f"Read {accel_samples} accel and {gyro_samples} gyro samples")
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example routes the FIFO watermark to the INT1 pin and only talks to
+the sensor when the pin shows that enough samples have been batched."""
+
+import board
+import digitalio
+
+from adafruit_lsm6ds import FIFOMode, FIFOTag, InterruptSource, Rate
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+
+# from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32 as LSM6DS
+# from adafruit_lsm6ds.ism330dhcx import ISM330DHCX as LSM6DS
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = LSM6DS(i2c)
+
+# connect the sensor's INT1 pin to D5
+int1 = digitalio.DigitalInOut(board.D5)
+int1.direction = digitalio.Direction.INPUT
+
+sensor.accelerometer_data_rate = Rate.RATE_416_HZ
+sensor.fifo_accel_batch_rate = Rate.RATE_416_HZ
+sensor.fifo_watermark = 128
+sensor.int1_sources = InterruptSource.FIFO_WATERMARK
+sensor.fifo_mode = FIFOMode.CONTINUOUS
+
+while True:
+    samples = 0
+    for tag, data in sensor.read_fifo_on_interrupt(int1):
+        if tag == FIFOTag.ACCEL:
+            samples += 1
+    print(f"Read {samples} accelerometer samples")
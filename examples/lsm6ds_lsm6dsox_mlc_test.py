@@ -3,12 +3,13 @@
 # SPDX-License-Identifier: MIT
 # LSM6DSOX IMU MLC (Machine Learning Core) Example.
 # Download the raw UCF file, copy to storage and reset.
+# For faster loading, compile it first with
+# python -m adafruit_lsm6ds.ucf lsm6dsox_vibration_monitoring.ucf lsm6dsox_vibration_monitoring.bin
+# and use the .bin file as UCF_FILE instead.
 
 # NOTE: The pre-trained models (UCF files) for the examples can be found here:
 # https://github.com/STMicroelectronics/STMems_Machine_Learning_Core/tree/master/application_examples/lsm6dsox
 
-import time
-
 import board
 
 from adafruit_lsm6ds import AccelRange, GyroRange, Rate
@@ -52,10 +53,8 @@ lsm.gyro_data_rate = Rate.RATE_26_HZ
 print("MLC configured...")
 
 while True:
-    buf = lsm.read_mlc_output()
-    if buf is not None:
-        print(UCF_LABELS[buf[0]])
-        # delay to allow interrupt flag to clear
-        # interrupt stays high for one sample interval
-        # (38.4 ms @ 26 Hz ot 19.2 ms @ 52Hz)
-        time.sleep(0.05)
+    # only reads the results when the first decision tree has a new output, and reports
+    # changes, so there is no need to wait for the interrupt flag to clear
+    for timestamp, tree, value in lsm.read_mlc_changes():
+        if tree == 0:
+            print(f"{timestamp:.2f}: {UCF_LABELS[value]}")
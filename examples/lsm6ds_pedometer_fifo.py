@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example batches the step counter in the FIFO with the time of each
+step, so the host can sleep for a minute at a time instead of polling, and
+keeps a step total that does not wrap at 65535."""
+
+import time
+
+import board
+
+from adafruit_lsm6ds import FIFOMode, Rate
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+from adafruit_lsm6ds.pedometer import StepCounter
+
+# from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32 as LSM6DS
+# from adafruit_lsm6ds.ism330dhcx import ISM330DHCX as LSM6DS
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = LSM6DS(i2c)
+
+# the pedometer runs from the accelerometer at 26 Hz or more
+sensor.accelerometer_data_rate = Rate.RATE_26_HZ
+sensor.gyro_data_rate = Rate.RATE_SHUTDOWN
+sensor.pedometer_enable = True
+
+# store a timestamped step counter word in the FIFO at each step, and nothing else
+sensor.timestamp_enabled = True
+sensor.fifo_accel_batch_rate = Rate.RATE_SHUTDOWN
+sensor.fifo_pedometer = True
+sensor.fifo_mode = FIFOMode.CONTINUOUS
+
+steps = StepCounter()
+while True:
+    time.sleep(60)
+    for timestamp, total in steps.read_fifo_words(sensor.read_fifo()):
+        print(f"{timestamp:.2f} s: {total} steps")
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example runs the sensor at 416 Hz only while it is moving. After
+five seconds without motion the sensor drops to 12.5 Hz with the gyro
+asleep, and the host waits on the INT1 pin until it moves again."""
+
+import board
+import digitalio
+
+from adafruit_lsm6ds import Event, Rate
+from adafruit_lsm6ds.governor import RateGovernor
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+
+# from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32 as LSM6DS
+# from adafruit_lsm6ds.ism330dhcx import ISM330DHCX as LSM6DS
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = LSM6DS(i2c)
+
+# connect the sensor's INT1 pin to D5
+int1 = digitalio.DigitalInOut(board.D5)
+int1.direction = digitalio.Direction.INPUT
+
+governor = RateGovernor(sensor, Rate.RATE_416_HZ, inactivity_time=5)
+sensor.route_events(int1=Event.SLEEP_CHANGE)
+
+while True:
+    if not governor.active:
+        print("Idle, waiting for motion")
+    governor.wait_for_activity(int1)
+    acceleration, gyro, _, _ = sensor.read_all()
+    print(f"Acceleration: {acceleration} Gyro: {gyro}")
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example lets the sensor hub of the LSM6DS read a LIS3MDL magnetometer
+wired to its auxiliary bus, the SDx and SCx pins, so the magnetometer data are
+sampled with the accelerometer and gyro and batched in the FIFO with them."""
+
+import time
+
+import board
+
+from adafruit_lsm6ds import FIFOMode, FIFOTag, Rate
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+from adafruit_lsm6ds.sensor_hub import LIS3MDL
+
+# from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32 as LSM6DS
+# from adafruit_lsm6ds.ism330dhcx import ISM330DHCX as LSM6DS
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = LSM6DS(i2c)
+
+# the accelerometer paces the sensor hub, so it must be running
+sensor.accelerometer_data_rate = Rate.RATE_104_HZ
+sensor.gyro_data_rate = Rate.RATE_104_HZ
+magnetometer = LIS3MDL(sensor, batch=True)
+
+acceleration, gyro, magnetic = magnetometer.read_all()
+print("Acceleration: X:{:.2f}, Y: {:.2f}, Z: {:.2f} m/s^2".format(*acceleration))
+print("Magnetic: X:{:.2f}, Y: {:.2f}, Z: {:.2f} uT".format(*magnetic))
+
+sensor.fifo_accel_batch_rate = Rate.RATE_104_HZ
+sensor.fifo_gyro_batch_rate = Rate.RATE_104_HZ
+sensor.fifo_mode = FIFOMode.CONTINUOUS
+
+while True:
+    time.sleep(0.5)
+    # the words come in time order: each sample's accelerometer, gyro and
+    # magnetometer words follow each other
+    for tag, data in magnetometer.read_fifo():
+        if tag == FIFOTag.SENSOR_HUB_SLAVE0:
+            print(f"Magnetic: X:{data[0]:.2f}, Y: {data[1]:.2f}, Z: {data[2]:.2f} uT")
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example runs the driver against a simulated sensor, with no hardware,
+and compares the bus transactions and bus time of several ways of reading
+samples. It runs on a computer with Blinka or plain CPython."""
+
+import math
+import time
+
+from adafruit_lsm6ds import Event, FIFOMode, InterruptSource, Rate
+from adafruit_lsm6ds.governor import RateGovernor
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX as LSM6DS
+from adafruit_lsm6ds.simulator import SimulatedI2C, SimulatedLSM6DS
+
+SAMPLES = 1000
+
+
+class Clock:
+    """Simulated time, so the results do not depend on the speed of the computer"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+clock = Clock()
+device = SimulatedLSM6DS(LSM6DS, clock=clock)
+i2c = SimulatedI2C(device)
+sensor = LSM6DS(i2c)
+sensor.accelerometer_data_rate = Rate.RATE_833_HZ
+sensor.gyro_data_rate = Rate.RATE_833_HZ
+
+
+def benchmark(name, read, every=1):
+    """Call read after every ``every`` samples and print the average cost per sample"""
+    i2c.reset_stats()
+    start = time.monotonic()
+    for sample in range(1, SAMPLES + 1):
+        clock.now += 1 / 833
+        if not sample % every:
+            read()
+    elapsed = time.monotonic() - start
+    print(
+        f"{name}: {i2c.transactions / SAMPLES:.1f} transactions, "
+        f"{(i2c.bytes_read + i2c.bytes_written) / SAMPLES:.1f} bytes and "
+        f"{i2c.bus_time / SAMPLES * 1e6:.0f} us of bus time per sample, "
+        f"{elapsed / SAMPLES * 1e6:.0f} us of host time per sample"
+    )
+
+
+benchmark(
+    "acceleration, gyro and temperature",
+    lambda: (sensor.acceleration, sensor.gyro, sensor.temperature),
+)
+benchmark("read_all", sensor.read_all)
+
+sensor.fifo_accel_batch_rate = Rate.RATE_833_HZ
+sensor.fifo_gyro_batch_rate = Rate.RATE_833_HZ
+sensor.fifo_mode = FIFOMode.CONTINUOUS
+drained = []
+benchmark("read_fifo every 25 samples", lambda: drained.extend(sensor.read_fifo()), every=25)
+print(f"read {len(drained)} FIFO words")
+
+
+def drain_on_watermark(name, governor=None, seconds=60):
+    """Drain the FIFO whenever INT1 shows the watermark, while the sensor moves for half a
+    second out of every ten"""
+    i2c.reset_stats()
+    wakeups = 0
+    words = 0
+    for tick in range(seconds * 100):
+        clock.now += 0.01
+        device.set_moving(tick % 1000 < 50)
+        if governor is not None and sensor.wait_for_interrupt(device.int2, 0):
+            governor.update()
+        if sensor.wait_for_interrupt(device.int1, 0):
+            wakeups += 1
+            words += sum(1 for _ in sensor.read_fifo())
+    print(
+        f"{name}: {wakeups} host wakeups, {words} FIFO words, {i2c.transactions} "
+        f"transactions and {i2c.bus_time * 1000:.0f} ms of bus time in {seconds} s"
+    )
+
+
+sensor.configure(accel_rate=Rate.RATE_416_HZ, gyro_rate=Rate.RATE_416_HZ)
+sensor.fifo_accel_batch_rate = Rate.RATE_416_HZ
+sensor.fifo_gyro_batch_rate = Rate.RATE_416_HZ
+sensor.fifo_watermark = 64
+sensor.int1_sources = InterruptSource.FIFO_WATERMARK
+sensor.fifo_mode = FIFOMode.BYPASS
+sensor.fifo_mode = FIFOMode.CONTINUOUS
+drain_on_watermark("fixed 416 Hz")
+
+governor = RateGovernor(sensor, Rate.RATE_416_HZ, inactivity_time=1)
+sensor.route_events(int2=Event.SLEEP_CHANGE)
+sensor.fifo_mode = FIFOMode.BYPASS
+sensor.fifo_mode = FIFOMode.CONTINUOUS
+drain_on_watermark("governed 416 Hz / 12.5 Hz", governor)
+print(f"{governor.transitions} changes between active and idle")
+
+
+def swaying(t):
+    """A hand-held sensor swaying at 2 Hz with a little 60 Hz vibration"""
+    sway = 0.5 * math.sin(2 * math.pi * 2 * t)
+    vibration = 0.05 * math.sin(2 * math.pi * 60 * t)
+    return ((sway + vibration, 0.0, 9.8), (0.0, sway, 0.0))
+
+
+def drain_at_6_66_khz(name, compression, seconds=1):
+    """Drain 6.66 kHz accelerometer and gyro samples every 10 ms on a 1 MHz bus"""
+    fast_device = SimulatedLSM6DS(LSM6DS, samples=swaying, clock=clock)
+    fast_i2c = SimulatedI2C(fast_device, frequency=1000000)
+    fast_sensor = LSM6DS(fast_i2c)
+    fast_sensor.configure(accel_rate=Rate.RATE_6_66K_HZ, gyro_rate=Rate.RATE_6_66K_HZ)
+    fast_sensor.fifo_accel_batch_rate = Rate.RATE_6_66K_HZ
+    fast_sensor.fifo_gyro_batch_rate = Rate.RATE_6_66K_HZ
+    fast_sensor.fifo_compression = compression
+    fast_sensor.fifo_mode = FIFOMode.CONTINUOUS
+    fast_i2c.reset_stats()
+    samples = 0
+    for _ in range(seconds * 100):
+        clock.now += 0.01
+        samples += sum(1 for _ in fast_sensor.read_fifo())
+    print(
+        f"{name}: {samples} samples, {fast_i2c.bytes_read / samples:.1f} bytes read per sample "
+        f"and {fast_i2c.bus_time / seconds * 100:.0f}% of the bus time"
+    )
+
+
+drain_at_6_66_khz("uncompressed FIFO at 6.66 kHz", False)
+drain_at_6_66_khz("compressed FIFO at 6.66 kHz", True)
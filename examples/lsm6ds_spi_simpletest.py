@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""This example connects to the sensor over SPI, which is much faster than I2C
+for high data rates and FIFO reads."""
+
+import time
+
+import board
+import digitalio
+
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+
+spi = board.SPI()  # uses board.SCK, board.MOSI and board.MISO
+cs = digitalio.DigitalInOut(board.D5)
+sensor = LSM6DSOX(spi, spi_cs=cs)
+
+while True:
+    accel_x, accel_y, accel_z = sensor.acceleration
+    print(f"Acceleration: X:{accel_x:.2f}, Y: {accel_y:.2f}, Z: {accel_z:.2f} m/s^2")
+    gyro_x, gyro_y, gyro_z = sensor.gyro
+    print(f"Gyro X:{gyro_x:.2f}, Y: {gyro_y:.2f}, Z: {gyro_z:.2f} radians/s")
+    print("")
+    time.sleep(0.5)
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Fixtures running the drivers against the simulated bus and sensor"""
+
+import pytest
+
+import adafruit_lsm6ds
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+from adafruit_lsm6ds.simulator import SimulatedI2C, SimulatedLSM6DS
+
+
+class Clock:
+    """Simulated time, advanced by the tests"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def simulated_time(monkeypatch, clock):
+    """Make the driver's ``sleep`` advance the simulated clock and ``monotonic`` read it"""
+    monkeypatch.setattr(adafruit_lsm6ds, "sleep", clock.advance)
+    monkeypatch.setattr(adafruit_lsm6ds, "monotonic", clock)
+
+
+@pytest.fixture
+def simulated(clock):
+    """Return a function creating a ``(sensor, device, i2c)`` triple on the simulated clock"""
+
+    def make(sensor_class=LSM6DSOX, samples=None, **kwargs):
+        device = SimulatedLSM6DS(sensor_class, samples=samples, clock=clock)
+        i2c = SimulatedI2C(device)
+        return sensor_class(i2c, **kwargs), device, i2c
+
+    return make
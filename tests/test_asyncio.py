@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import struct
+
+import pytest
+
+from adafruit_lsm6ds import AccelRange, GyroRange, Rate
+
+CTRL1_XL = 0x10
+CTRL2_G = 0x11
+X_OFS_USR = 0x73
+
+
+def calibration_blob(accel_bias, gyro_bias):
+    return struct.pack("<Bffffff", 1, *accel_bias, *gyro_bias)
+
+
+@pytest.fixture
+def simulated_sleep(monkeypatch, clock):
+    """Make ``asyncio.sleep`` advance the simulated clock, recording the delays"""
+    delays = []
+
+    async def sleep(seconds):
+        delays.append(seconds)
+        clock.advance(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return delays
+
+
+@pytest.mark.parametrize("cache_registers", (False, True))
+def test_areset(simulated, simulated_sleep, cache_registers):
+    sensor, device, _ = simulated(cache_registers=cache_registers)
+    sensor.calibration = calibration_blob((10.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+    assert device.registers[X_OFS_USR] != 0
+    asyncio.run(sensor.areset())
+    assert device.registers[CTRL1_XL] == 0
+    assert device.registers[X_OFS_USR] == 0
+    assert sensor.calibration == calibration_blob((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+    # a cached sensor reloads its cache, so the next change is written over the reset values
+    sensor.accelerometer_data_rate = Rate.RATE_52_HZ
+    assert device.registers[CTRL1_XL] == Rate.RATE_52_HZ << 4
+
+
+def test_aconfigure(simulated, simulated_sleep):
+    sensor, device, _ = simulated(configure_defaults=False)
+    asyncio.run(
+        sensor.aconfigure(
+            accel_range=AccelRange.RANGE_8G,
+            gyro_range=GyroRange.RANGE_500_DPS,
+            accel_rate=Rate.RATE_208_HZ,
+            gyro_rate=Rate.RATE_208_HZ,
+        )
+    )
+    assert device.registers[CTRL1_XL] == 0x5C
+    assert device.registers[CTRL2_G] == 0x54
+    assert simulated_sleep and simulated_sleep[-1] > 0
+
+
+def test_stream_yields_each_new_sample(simulated, simulated_sleep):
+    # the x acceleration is the sample time, so each sample can be told apart
+    sensor, _, _ = simulated(samples=lambda t: ((t, 0.0, 9.80665), (0.0, 0.0, 0.0)))
+
+    async def take(count):
+        samples = []
+        async for sample in sensor.stream():
+            samples.append(sample)
+            if len(samples) == count:
+                return samples
+
+    samples = asyncio.run(take(10))
+    assert all(sample[3][0] and sample[3][1] for sample in samples)
+    times = [sample[0][0] for sample in samples]
+    # no sample is repeated or skipped at the 104 Hz data rate
+    for before, after in zip(times, times[1:]):
+        assert after - before == pytest.approx(1 / 104, abs=0.002)
+    assert samples[-1][0][2] == pytest.approx(9.80665, abs=0.01)
+    assert max(simulated_sleep) == pytest.approx(1 / 104)
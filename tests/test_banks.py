@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+FUNC_CFG_ACCESS = 0x01
+EMB_FUNC_EN_A = 0x04
+SLV0_ADD = 0x15
+
+
+def test_embedded_bank(simulated):
+    sensor, device, i2c = simulated()
+    i2c.reset_stats()
+    with sensor.embedded_bank() as bank:
+        assert device.registers[FUNC_CFG_ACCESS] == 0x80
+        bank.write(EMB_FUNC_EN_A, (0x18, 0x10))
+        assert bank.read(EMB_FUNC_EN_A, 2) == bytearray((0x18, 0x10))
+    assert device.registers[FUNC_CFG_ACCESS] == 0
+    assert device.embedded_registers[EMB_FUNC_EN_A : EMB_FUNC_EN_A + 2] == bytearray((0x18, 0x10))
+    # one write to select the bank, one per access and one to return to the user bank
+    assert i2c.transactions == 4
+
+
+def test_sensor_hub_bank(simulated):
+    sensor, device, _ = simulated()
+    with sensor.sensor_hub_bank() as bank:
+        assert device.registers[FUNC_CFG_ACCESS] == 0x40
+        bank.write(SLV0_ADD, bytes(range(1, 13)))
+        buf = bytearray(6)
+        bank.readinto(SLV0_ADD + 2, buf, 1, 4)
+    assert device.sensor_hub_registers[SLV0_ADD : SLV0_ADD + 12] == bytes(range(1, 13))
+    assert buf == bytearray((0, 3, 4, 5, 0, 0))
+    assert device.registers[FUNC_CFG_ACCESS] == 0
+
+
+def test_bank_is_left_on_errors(simulated):
+    sensor, device, _ = simulated()
+    with pytest.raises(ValueError), sensor.embedded_bank():
+        raise ValueError()
+    assert device.registers[FUNC_CFG_ACCESS] == 0
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds import AccelRange, GyroRange, Rate
+from adafruit_lsm6ds.lsm6ds33 import LSM6DS33
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+
+CTRL6_C = 0x15
+X_OFS_USR = 0x73
+USR_OFF_W = 0x08
+GRAVITY = 9.80665
+
+pytestmark = pytest.mark.usefixtures("simulated_time")
+
+
+def biased(accel_bias, gyro_bias):
+    def waveform(_):
+        return (
+            (accel_bias[0], accel_bias[1], GRAVITY + accel_bias[2]),
+            gyro_bias,
+        )
+
+    return waveform
+
+
+SMALL_BIAS = biased((0.2, -0.1, 0.05), (0.01, -0.02, 0.005))
+
+
+@pytest.mark.parametrize("sensor_class", (LSM6DSOX, LSM6DS33))
+def test_calibrate_removes_the_bias(sensor_class, simulated, clock):
+    sensor, device, _ = simulated(sensor_class, samples=SMALL_BIAS)
+    assert sensor.acceleration[0] == pytest.approx(0.2, abs=0.01)
+    sensor.calibrate(samples=20)
+    # the offset registers apply from the next sample
+    clock.advance(0.01)
+    assert sensor.acceleration == pytest.approx((0.0, 0.0, GRAVITY), abs=0.01)
+    assert sensor.gyro == pytest.approx((0.0, 0.0, 0.0), abs=0.001)
+    # the sensor removes the accelerometer bias itself where it has offset registers
+    offsets = device.registers[X_OFS_USR : X_OFS_USR + 3]
+    assert any(offsets) == (sensor_class is LSM6DSOX)
+
+
+def test_large_bias_uses_the_coarse_weight(simulated, clock):
+    sensor, device, _ = simulated(samples=biased((2.0, 0.0, 0.0), (0.0, 0.0, 0.0)))
+    sensor.calibrate(samples=20)
+    clock.advance(0.01)
+    assert device.registers[CTRL6_C] & USR_OFF_W
+    assert sensor.acceleration == pytest.approx((0.0, 0.0, GRAVITY), abs=0.1)
+
+
+@pytest.mark.parametrize("sensor_class", (LSM6DSOX, LSM6DS33))
+def test_calibration_survives_range_changes(sensor_class, simulated, clock):
+    sensor, _, _ = simulated(sensor_class, samples=SMALL_BIAS)
+    sensor.calibrate(samples=20)
+    clock.advance(0.01)
+    sensor.configure(accel_range=AccelRange.RANGE_16G, gyro_range=GyroRange.RANGE_2000_DPS)
+    assert sensor.acceleration == pytest.approx((0.0, 0.0, GRAVITY), abs=0.02)
+    assert sensor.gyro == pytest.approx((0.0, 0.0, 0.0), abs=0.002)
+
+
+def test_calibration_blob_round_trip(simulated, clock):
+    sensor, _, _ = simulated(samples=SMALL_BIAS)
+    blob = sensor.calibrate(samples=20)
+    assert blob == sensor.calibration
+    other, _, _ = simulated(samples=SMALL_BIAS)
+    other.calibration = blob
+    clock.advance(0.01)
+    assert other.acceleration == pytest.approx(sensor.acceleration)
+    assert other.gyro == pytest.approx(sensor.gyro)
+    other.clear_calibration()
+    clock.advance(0.01)
+    assert other.acceleration[0] == pytest.approx(0.2, abs=0.01)
+    assert other.gyro[1] == pytest.approx(-0.02, abs=0.001)
+
+
+def test_invalid_calibration_blob(simulated):
+    sensor, _, _ = simulated()
+    with pytest.raises(AttributeError):
+        sensor.calibration = b"\x00" * 25
+    with pytest.raises(AttributeError):
+        sensor.calibration = b"\x01" * 4
+
+
+def test_calibrate_needs_both_sensors(simulated):
+    sensor, _, _ = simulated()
+    sensor.gyro_data_rate = Rate.RATE_SHUTDOWN
+    with pytest.raises(RuntimeError):
+        sensor.calibrate()
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from math import sin
+
+import pytest
+
+from adafruit_lsm6ds import FIFOMode, FIFOTag, Rate
+
+FIFO_CTRL2 = 0x08
+EMB_FUNC_EN_B = 0x05
+FIFO_COMPR_RT_EN = 0x40
+FIFO_COMPR_EN = 0x08
+
+
+def amplitude(scale, speed=1.0):
+    def waveform(t):
+        return (scale * sin(speed * t), 0.5, 9.80665), (0.1 * scale * sin(speed * t), 0.0, 0.2)
+
+    return waveform
+
+
+# differences of at most 5 bits, 8 bits and larger
+WAVEFORMS = (amplitude(0.1), amplitude(5.0), amplitude(5.0, 50.0))
+
+
+def fill_fifos(simulated, clock, waveform, *settings):
+    """Return a ``(sensor, device)`` pair per ``(compression, uncompressed_rate)`` setting,
+    after batching the same samples in each"""
+    sensors = []
+    for compression, uncompressed_rate in settings:
+        sensor, device, _ = simulated(samples=waveform)
+        sensor.fifo_compression = compression
+        sensor.fifo_uncompressed_rate = uncompressed_rate
+        sensor.fifo_accel_batch_rate = Rate.RATE_104_HZ
+        sensor.fifo_gyro_batch_rate = Rate.RATE_104_HZ
+        sensor.fifo_mode = FIFOMode.CONTINUOUS
+        sensors.append((sensor, device))
+    clock.advance(0.3)
+    return sensors
+
+
+def samples(words, tag):
+    return [data for word_tag, data in words if word_tag == tag]
+
+
+def test_compression_registers(simulated):
+    sensor, device = simulated()[:2]
+    assert not sensor.fifo_compression
+    sensor.fifo_compression = True
+    assert sensor.fifo_compression
+    assert device.registers[FIFO_CTRL2] & FIFO_COMPR_RT_EN
+    assert device.embedded_registers[EMB_FUNC_EN_B] & FIFO_COMPR_EN
+    sensor.fifo_uncompressed_rate = 16
+    assert sensor.fifo_uncompressed_rate == 16
+    assert device.registers[FIFO_CTRL2] & 0x06 == 2 << 1
+    with pytest.raises(AttributeError):
+        sensor.fifo_uncompressed_rate = 12
+    sensor.fifo_compression = False
+    assert not device.registers[FIFO_CTRL2] & FIFO_COMPR_RT_EN
+    assert not device.embedded_registers[EMB_FUNC_EN_B] & FIFO_COMPR_EN
+
+
+@pytest.mark.parametrize("waveform", WAVEFORMS)
+def test_read_fifo_decodes_compressed_words(simulated, clock, waveform):
+    (plain, _), (compressed, _) = fill_fifos(simulated, clock, waveform, (False, 0), (True, 0))
+    expected = list(plain.read_fifo())
+    words = list(compressed.read_fifo())
+    for tag in (FIFOTag.ACCEL, FIFOTag.GYRO):
+        # compressed words hold whole groups of three samples
+        decoded = samples(words, tag)
+        assert len(decoded) > 0
+        assert decoded == samples(expected, tag)[: len(decoded)]
+
+
+@pytest.mark.parametrize("waveform", WAVEFORMS)
+def test_read_fifo_arrays_decodes_compressed_words(simulated, clock, waveform):
+    (plain, _), (compressed, _) = fill_fifos(simulated, clock, waveform, (False, 0), (True, 0))
+    words = list(plain.read_fifo())
+    accel, gyro = compressed.read_fifo_arrays()
+    for array, tag in ((accel, FIFOTag.ACCEL), (gyro, FIFOTag.GYRO)):
+        flattened = [value for sample in samples(words, tag) for value in sample]
+        assert len(array) > 0
+        assert list(array) == pytest.approx(flattened[: len(array)], abs=1e-5)
+
+
+def test_compression_needs_fewer_words(simulated, clock):
+    (plain, _), (compressed, _) = fill_fifos(simulated, clock, WAVEFORMS[0], (False, 0), (True, 0))
+    assert compressed.fifo_count * 2.5 < plain.fifo_count
+
+
+def test_forced_uncompressed_samples(simulated, clock):
+    (plain, _), (forced, device) = fill_fifos(simulated, clock, WAVEFORMS[0], (False, 0), (True, 8))
+    # the simulated FIFO is filled when the sensor is next read
+    assert forced.fifo_count > 0
+    tags = [word[0] >> 3 for word in device.fifo]
+    # NC_T_2 accelerometer words start the forced uncompressed samples
+    assert tags.count(0x06) > 1
+    decoded = samples(forced.read_fifo(), FIFOTag.ACCEL)
+    assert decoded == samples(plain.read_fifo(), FIFOTag.ACCEL)[: len(decoded)]
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds import Event
+from adafruit_lsm6ds.events import EventDispatcher
+from adafruit_lsm6ds.lsm6ds33 import LSM6DS33
+
+TAP_CFG0 = 0x56
+TAP_CFG2 = 0x58
+TAP_THS_6D = 0x59
+WAKE_UP_THS = 0x5B
+FREE_FALL = 0x5D
+MD1_CFG = 0x5E
+MD2_CFG = 0x5F
+EMB_FUNC_INT1 = 0x0A
+EMB_FUNC_INT2 = 0x0E
+LIR = 0x01
+INT_CLR_ON_READ = 0x40
+INTERRUPTS_ENABLE = 0x80
+STEP_DETECTOR = 0x08
+TILT = 0x10
+
+
+def test_configure_detectors(simulated):
+    sensor, device, _ = simulated()
+    sensor.configure_tap(threshold=12, double_tap=True, axes="z")
+    registers = device.registers
+    assert registers[TAP_CFG0] & 0x0E == 0x02
+    assert registers[TAP_THS_6D] & 0x1F == 12
+    assert registers[WAKE_UP_THS] & 0x80
+    assert registers[TAP_CFG2] & INTERRUPTS_ENABLE
+    sensor.configure_free_fall(threshold=5, duration=10)
+    assert registers[FREE_FALL] == 10 << 3 | 5
+    # the tap configuration is kept
+    assert registers[TAP_THS_6D] & 0x1F == 12
+    with pytest.raises(AttributeError):
+        sensor.configure_tap(threshold=32)
+    with pytest.raises(AttributeError):
+        sensor.configure_wake_up(duration=4)
+
+
+def test_latching_is_left_to_the_user(simulated):
+    sensor, device, _ = simulated()
+    sensor.configure_tap()
+    assert not device.registers[TAP_CFG0] & (LIR | INT_CLR_ON_READ)
+    assert not sensor.latch_events
+    sensor.latch_events = True
+    assert device.registers[TAP_CFG0] & (LIR | INT_CLR_ON_READ) == LIR | INT_CLR_ON_READ
+    sensor.configure_wake_up()
+    assert sensor.latch_events
+    sensor.latch_events = False
+    assert not device.registers[TAP_CFG0] & (LIR | INT_CLR_ON_READ)
+    assert device.registers[TAP_CFG0] & 0x0E == 0x0E
+
+
+def test_route_events_only_changes_the_given_events(simulated):
+    sensor, device, _ = simulated()
+    sensor.route_step_interrupts(int1=True)
+    sensor.route_events(int1=Event.SINGLE_TAP | Event.TILT, int2=Event.FREE_FALL)
+    sensor.route_events(int2=Event.WAKE_UP)
+    registers = device.registers
+    assert registers[MD1_CFG] & 0xFC == 0x40
+    assert registers[MD2_CFG] & 0xFC == 0x30
+    embedded = device.embedded_registers
+    assert embedded[EMB_FUNC_INT1] == STEP_DETECTOR | TILT
+    # moving an event to the other pin removes it from the first
+    sensor.route_events(int2=Event.SINGLE_TAP | Event.TILT)
+    assert registers[MD1_CFG] & 0xFC == 0
+    assert registers[MD2_CFG] & 0xFC == 0x70
+    assert embedded[EMB_FUNC_INT1] == STEP_DETECTOR
+    assert embedded[EMB_FUNC_INT2] == TILT
+    sensor.unroute_events(Event.TILT | Event.FREE_FALL)
+    assert registers[MD2_CFG] & 0xFC == 0x60
+    assert embedded[EMB_FUNC_INT1] == STEP_DETECTOR
+    assert embedded[EMB_FUNC_INT2] == 0
+    with pytest.raises(AttributeError):
+        sensor.route_events(int1=0x4000)
+
+
+def test_routed_events_assert_the_pins(simulated):
+    sensor, device, _ = simulated()
+    sensor.route_events(int1=Event.DOUBLE_TAP, int2=Event.SIGNIFICANT_MOTION)
+    device.add_event(Event.FREE_FALL)
+    assert not device.int1.value
+    device.add_event(Event.DOUBLE_TAP)
+    assert device.int1.value
+    assert not device.int2.value
+    device.add_event(Event.SIGNIFICANT_MOTION)
+    assert device.int2.value
+    sensor.read_events()
+    assert not device.int1.value
+    assert not device.int2.value
+
+
+def test_read_events(simulated, clock):
+    sensor, device, i2c = simulated()
+    assert sensor.read_events()[0] == 0
+    device.add_event(Event.SINGLE_TAP, 0x04)
+    device.add_event(Event.TILT)
+    i2c.reset_stats()
+    events, sources = sensor.read_events(embedded=False)
+    assert events == Event.SINGLE_TAP
+    assert sources[2] & 0x04
+    assert i2c.transactions == 1
+    assert i2c.bytes_read == 4
+    events, sources = sensor.read_events()
+    assert events == Event.TILT
+    assert sources[4] & TILT
+    clock.advance(0.1)
+    assert sensor.read_events()[0] == 0
+
+
+def test_dispatcher(simulated):
+    sensor, device, i2c = simulated()
+    calls = []
+
+    def tapped(event, source):
+        calls.append(("tap", event, source))
+
+    def tilted(event, source):
+        calls.append(("tilt", event, source))
+
+    events = EventDispatcher(sensor)
+    events.add_callback(Event.SINGLE_TAP | Event.DOUBLE_TAP, tapped)
+    device.add_event(Event.DOUBLE_TAP | Event.WAKE_UP, 0x01)
+    i2c.reset_stats()
+    assert events.poll() == Event.DOUBLE_TAP | Event.WAKE_UP
+    # only the basic sources are read while no callback needs the embedded ones
+    assert i2c.bytes_read == 4
+    assert calls == [("tap", Event.DOUBLE_TAP, 0x51)]
+
+    calls.clear()
+    events.add_callback(Event.TILT, tilted)
+    device.add_event(Event.TILT | Event.SINGLE_TAP)
+    events.poll()
+    assert calls == [("tap", Event.SINGLE_TAP, 0x60), ("tilt", Event.TILT, TILT)]
+
+    calls.clear()
+    events.remove_callback(tapped)
+    device.add_event(Event.TILT | Event.SINGLE_TAP)
+    i2c.reset_stats()
+    events.poll()
+    assert calls == [("tilt", Event.TILT, TILT)]
+    # the embedded status is read on its own, not by bursting through the outputs
+    assert i2c.transactions == 2
+    assert i2c.bytes_read == 5
+
+
+def test_poll_keeps_the_data_ready_flags(simulated, clock):
+    sensor, device, _ = simulated()
+    events = EventDispatcher(sensor)
+    events.add_callback(Event.TILT, lambda event, source: None)
+    clock.advance(0.1)
+    device.add_event(Event.TILT)
+    assert events.poll() == Event.TILT
+    assert sensor.read_all()[3] == (True, True, True)
+
+
+def test_poll_on_interrupt(simulated, simulated_time):
+    sensor, device, _ = simulated()
+    calls = []
+    events = EventDispatcher(sensor)
+    events.add_callback(Event.FREE_FALL, lambda event, source: calls.append(event))
+    sensor.route_events(int1=Event.FREE_FALL)
+    assert events.poll_on_interrupt(device.int1, timeout=0.01) == 0
+    device.add_event(Event.FREE_FALL)
+    assert events.poll_on_interrupt(device.int1, timeout=0.01) == Event.FREE_FALL
+    assert calls == [Event.FREE_FALL]
+
+
+def test_events_need_embedded_functions(simulated):
+    sensor, _, _ = simulated(LSM6DS33)
+    with pytest.raises(RuntimeError):
+        sensor.configure_tap()
+    with pytest.raises(RuntimeError):
+        sensor.route_events(int1=Event.SINGLE_TAP)
+    with pytest.raises(RuntimeError):
+        sensor.read_events()
+    with pytest.raises(RuntimeError):
+        sensor.latch_events = True
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from math import cos, sin
+
+import pytest
+
+from adafruit_lsm6ds import FIFOMode, FIFOTag, Rate
+
+
+def waveform(t):
+    return (sin(t), cos(t), 9.80665), (0.1 * t, 0.0, -0.2)
+
+
+def fill_fifo(simulated, clock, seconds=0.2, **kwargs):
+    sensor, device, i2c = simulated(samples=waveform, **kwargs)
+    sensor.fifo_accel_batch_rate = Rate.RATE_104_HZ
+    sensor.fifo_gyro_batch_rate = Rate.RATE_104_HZ
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    clock.advance(seconds)
+    return sensor, device, i2c
+
+
+def flatten(samples):
+    return [value for sample in samples for value in sample]
+
+
+def test_read_fifo(simulated, clock):
+    sensor, _, _ = fill_fifo(simulated, clock)
+    words = list(sensor.read_fifo())
+    accel = [data for tag, data in words if tag == FIFOTag.ACCEL]
+    gyro = [data for tag, data in words if tag == FIFOTag.GYRO]
+    assert len(accel) == len(gyro) == pytest.approx(0.2 * 104, abs=1)
+    assert accel[-1] == pytest.approx(waveform(0.2)[0], abs=0.01)
+    assert gyro[-1] == pytest.approx(waveform(0.2)[1], abs=0.01)
+    assert sensor.fifo_count == 0
+
+
+def test_read_fifo_arrays_match_read_fifo(simulated, clock):
+    sensor, _, _ = fill_fifo(simulated, clock)
+    words = list(sensor.read_fifo())
+    other, _, _ = fill_fifo(simulated, clock)
+    accel, gyro = other.read_fifo_arrays()
+    assert list(accel) == pytest.approx(
+        flatten(data for tag, data in words if tag == FIFOTag.ACCEL), abs=1e-5
+    )
+    assert list(gyro) == pytest.approx(
+        flatten(data for tag, data in words if tag == FIFOTag.GYRO), abs=1e-5
+    )
+    assert other.fifo_count == 0
+
+
+def test_read_fifo_arrays_discards_other_tags(simulated, clock):
+    def fill():
+        sensor, _, _ = fill_fifo(simulated, clock, seconds=0)
+        sensor.timestamp_enabled = True
+        sensor.fifo_temperature_batch_rate = 3
+        return sensor
+
+    sensor, other = fill(), fill()
+    clock.advance(0.1)
+    tags = [tag for tag, _ in sensor.read_fifo()]
+    assert FIFOTag.TEMPERATURE in tags
+    accel, gyro = other.read_fifo_arrays()
+    assert len(accel) == 3 * tags.count(FIFOTag.ACCEL)
+    assert len(gyro) == 3 * tags.count(FIFOTag.GYRO)
+
+
+def test_read_fifo_arrays_max_words(simulated, clock):
+    sensor, _, _ = fill_fifo(simulated, clock)
+    count = sensor.fifo_count
+    accel, gyro = sensor.read_fifo_arrays(max_words=10)
+    assert len(accel) + len(gyro) == 3 * 10
+    assert sensor.fifo_count == count - 10
+
+
+def test_read_fifo_arrays_empty(simulated):
+    sensor, _, _ = simulated()
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    accel, gyro = sensor.read_fifo_arrays()
+    assert len(accel) == len(gyro) == 0
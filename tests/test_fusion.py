@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from math import cos, radians, sin
+
+import pytest
+
+from adafruit_lsm6ds.fusion import Madgwick, Mahony
+
+FILTERS = (lambda: Madgwick(beta=0.5), lambda: Mahony(kp=2.0, ki=0.1))
+
+
+@pytest.mark.parametrize("make_filter", FILTERS)
+def test_converges_to_gravity(make_filter):
+    fusion = make_filter()
+    roll = radians(30)
+    acceleration = (0.0, 9.80665 * sin(roll), 9.80665 * cos(roll))
+    for _ in range(2000):
+        fusion.update((0.0, 0.0, 0.0), acceleration, 0.01)
+    assert fusion.euler[0] == pytest.approx(roll, abs=0.01)
+    assert fusion.euler[1] == pytest.approx(0.0, abs=0.01)
+
+
+@pytest.mark.parametrize("make_filter", FILTERS)
+def test_integrates_the_gyro(make_filter):
+    fusion = make_filter()
+    # without acceleration there is no correction, so only the gyro is integrated
+    for _ in range(100):
+        fusion.update((0.0, 0.0, 1.0), (0.0, 0.0, 0.0), 0.01)
+    assert fusion.euler[2] == pytest.approx(1.0, abs=0.001)
+    fusion.reset()
+    assert fusion.quaternion == (1.0, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("make_filter", FILTERS)
+def test_batch_matches_single_updates(make_filter):
+    gyro = [(0.1 * i, -0.05, 0.2) for i in range(20)]
+    acceleration = [(0.5, 0.2 * i, 9.8) for i in range(20)]
+    dt = [0.01 + 0.001 * i for i in range(20)]
+    single = make_filter()
+    for g, a, step in zip(gyro, acceleration, dt):
+        single.update(g, a, step)
+    batch = make_filter()
+    assert batch.update_batch(gyro, acceleration, dt) == single.quaternion
+
+
+def test_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        Madgwick().update_batch([(0.0, 0.0, 0.0)] * 2, [(0.0, 0.0, 1.0)], 0.01)
+
+
+def test_quaternion_keeps_double_precision():
+    fusion = Mahony()
+    for _ in range(10000):
+        fusion.update((1e-3, 2e-3, 3e-3), (0.0, 0.0, 0.0), 0.01)
+    w, x, y, z = fusion.quaternion
+    assert w * w + x * x + y * y + z * z == pytest.approx(1.0, abs=1e-12)
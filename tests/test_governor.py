@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds import Event, FIFOMode, FIFOTag, InactivityMode, Rate, governor
+from adafruit_lsm6ds.events import EventDispatcher
+from adafruit_lsm6ds.governor import RateGovernor
+
+TAP_CFG0 = 0x56
+TAP_CFG2 = 0x58
+WAKE_UP_DUR = 0x5C
+LIR = 0x01
+
+
+@pytest.fixture
+def governor_time(monkeypatch, clock, simulated_time):
+    monkeypatch.setattr(governor, "monotonic", clock)
+
+
+def test_governor_configures_the_sensor(simulated, governor_time):
+    sensor, device, _ = simulated()
+    RateGovernor(sensor, Rate.RATE_416_HZ, gyro_rate=Rate.RATE_104_HZ, inactivity_time=5)
+    assert sensor.accelerometer_data_rate == Rate.RATE_416_HZ
+    assert sensor.gyro_data_rate == Rate.RATE_104_HZ
+    registers = device.registers
+    assert registers[TAP_CFG2] & 0x60 == InactivityMode.GYRO_SLEEP << 5
+    # 5 s at 416 Hz rounds up to 5 steps of 512 samples
+    assert registers[WAKE_UP_DUR] & 0x0F == 5
+    assert registers[TAP_CFG0] & LIR
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"active_rate": Rate.RATE_SHUTDOWN},
+        {"active_rate": Rate.RATE_6_66K_HZ, "inactivity_time": 2},
+    ),
+)
+def test_invalid_governor(simulated, kwargs):
+    sensor, _, _ = simulated()
+    with pytest.raises(AttributeError):
+        RateGovernor(sensor, **kwargs)
+
+
+def test_update_follows_the_sleep_state(simulated, governor_time, clock):
+    sensor, device, _ = simulated()
+    rate_governor = RateGovernor(sensor, Rate.RATE_104_HZ, inactivity_time=1)
+    assert rate_governor.update()
+    assert rate_governor.data_rate == 104
+    device.set_moving(False)
+    clock.advance(3)
+    assert not rate_governor.update()
+    assert rate_governor.data_rate == 12.5
+    assert rate_governor.transitions == 1
+    clock.advance(1)
+    device.set_moving(True)
+    assert rate_governor.update()
+    assert rate_governor.transitions == 2
+    assert rate_governor.idle_fraction == pytest.approx(0.25)
+
+
+def test_wait_for_activity(simulated, governor_time, clock):
+    sensor, device, i2c = simulated()
+    rate_governor = RateGovernor(sensor, Rate.RATE_104_HZ)
+    sensor.route_events(int1=Event.SLEEP_CHANGE)
+    i2c.reset_stats()
+    assert rate_governor.wait_for_activity(device.int1)
+    # nothing is read while the pin stays idle
+    assert i2c.transactions == 0
+    device.set_moving(False)
+    assert not rate_governor.wait_for_activity(device.int1, timeout=0.5)
+    assert not rate_governor.active
+    device.set_moving(True)
+    assert rate_governor.wait_for_activity(device.int1, timeout=0.5)
+
+
+def test_handle_event_with_a_dispatcher(simulated, governor_time):
+    sensor, device, _ = simulated()
+    rate_governor = RateGovernor(sensor, Rate.RATE_104_HZ)
+    events = EventDispatcher(sensor)
+    events.add_callback(Event.SLEEP_CHANGE, rate_governor.handle_event)
+    device.set_moving(False)
+    events.poll()
+    assert not rate_governor.active
+    rate_governor.handle_event(Event.WAKE_UP, 0)
+    assert not rate_governor.active
+
+
+@pytest.mark.parametrize(
+    "mode, gyro_samples",
+    ((InactivityMode.ACCEL_LOW_POWER, True), (InactivityMode.GYRO_SLEEP, False)),
+)
+def test_inactive_data_rates(simulated, clock, mode, gyro_samples):
+    sensor, device, _ = simulated()
+    sensor.configure(accel_rate=Rate.RATE_104_HZ, gyro_rate=Rate.RATE_104_HZ, settle=False)
+    sensor.configure_inactivity(mode)
+    sensor.fifo_accel_batch_rate = Rate.RATE_104_HZ
+    sensor.fifo_gyro_batch_rate = Rate.RATE_104_HZ
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    device.set_moving(False)
+    clock.advance(1)
+    tags = [tag for tag, _ in sensor.read_fifo()]
+    assert tags.count(FIFOTag.ACCEL) == pytest.approx(12.5, abs=1)
+    assert (FIFOTag.GYRO in tags) == gyro_samples
+    assert sensor.read_events()[1][1] & 0x10
+    device.set_moving(True)
+    clock.advance(1)
+    tags = [tag for tag, _ in sensor.read_fifo()]
+    assert tags.count(FIFOTag.ACCEL) == pytest.approx(104, abs=1)
+
+
+def test_set_moving_without_inactivity_detection(simulated):
+    sensor, device, _ = simulated()
+    device.set_moving(False)
+    assert sensor.read_events()[0] == 0
+    with pytest.raises(AttributeError):
+        sensor.configure_inactivity(mode=4)
+    with pytest.raises(AttributeError):
+        sensor.configure_inactivity(duration=16)
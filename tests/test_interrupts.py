@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds import LSM6DS, FIFOMode, FIFOTag, InterruptSource, Rate
+
+
+class Counter:
+    """Stands in for a ``countio.Counter`` on an interrupt pin"""
+
+    def __init__(self, count=0):
+        self.count = count
+
+    def reset(self):
+        self.count = 0
+
+
+@pytest.fixture
+def fifo_sensor(simulated, simulated_time):
+    sensor, device, i2c = simulated()
+    sensor.fifo_watermark = 20
+    sensor.fifo_accel_batch_rate = Rate.RATE_104_HZ
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    sensor.int1_sources = InterruptSource.FIFO_WATERMARK
+    return sensor, device, i2c
+
+
+def test_watermark_drain(fifo_sensor, clock):
+    sensor, device, i2c = fifo_sensor
+    start = clock()
+    i2c.reset_stats()
+    words = list(sensor.read_fifo_on_interrupt(device.int1, timeout=1))
+    # the wait polls the pin, not the bus, and ends once the watermark is reached
+    assert i2c.transactions <= 4
+    assert clock() - start == pytest.approx(20 / 104, abs=0.002)
+    assert len(words) >= 20
+    assert all(tag == FIFOTag.ACCEL for tag, _ in words)
+    assert words[-1][1][2] == pytest.approx(9.80665, abs=0.01)
+    assert not device.int1.value
+
+
+def test_watermark_timeout(fifo_sensor, clock):
+    sensor, device, i2c = fifo_sensor
+    sensor.fifo_watermark = 200
+    start = clock()
+    i2c.reset_stats()
+    assert list(sensor.read_fifo_on_interrupt(device.int1, timeout=0.5)) == []
+    assert clock() - start == pytest.approx(0.5, abs=0.002)
+    assert i2c.transactions == 0
+    assert len(device.fifo) >= 50
+
+
+def test_wait_sleeps_between_polls(clock, simulated_time):
+    class Pin:
+        reads = 0
+
+        @property
+        def value(self):
+            self.reads += 1
+            return False
+
+    pin = Pin()
+    assert not LSM6DS.wait_for_interrupt(pin, timeout=0.1)
+    assert pin.reads <= 101
+
+
+def test_wait_on_counter_and_callable(simulated_time):
+    counter = Counter(2)
+    assert LSM6DS.wait_for_interrupt(counter, timeout=0.1)
+    assert counter.count == 0
+    assert not LSM6DS.wait_for_interrupt(counter, timeout=0.1)
+
+    timeouts = []
+    assert not LSM6DS.wait_for_interrupt(timeouts.append, 0.5)
+    assert timeouts == [0.5]
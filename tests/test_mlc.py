@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+FUNC_CFG_ACCESS = 0x01
+FIFO_STATUS2 = 0x3B
+
+
+def record_reads(i2c, device, monkeypatch):
+    """Record the first register and length of each main bank read"""
+    reads = []
+    transfer = i2c.writeto_then_readfrom
+
+    def recording_transfer(address, out_buffer, in_buffer, **kwargs):
+        in_end = kwargs.get("in_end", len(in_buffer))
+        if not device.registers[FUNC_CFG_ACCESS]:
+            reads.append((out_buffer[0], in_end - kwargs.get("in_start", 0)))
+        transfer(address, out_buffer, in_buffer, **kwargs)
+
+    monkeypatch.setattr(i2c, "writeto_then_readfrom", recording_transfer)
+    return reads
+
+
+def test_no_changes_is_one_read(simulated):
+    sensor, _, i2c = simulated()
+    i2c.reset_stats()
+    assert sensor.read_mlc_changes() == []
+    assert i2c.transactions == 1
+
+
+def test_changes_are_reported_once(simulated, simulated_time, clock):
+    sensor, device, _ = simulated()
+    clock.advance(1.0)
+    now = clock()
+    device.set_mlc_output(0, 4)
+    device.set_mlc_output(2, 1)
+    assert sensor.read_mlc_changes() == [(now, 0, 4), (now, 2, 1)]
+    assert sensor.read_mlc_changes() == []
+    # a tree that reports the class it already had is not a change
+    device.set_mlc_output(0, 4)
+    device.set_mlc_output(1, 0)
+    device.set_mlc_output(2, 8)
+    assert sensor.read_mlc_changes() == [(now, 2, 8)]
+
+
+def test_timestamps_do_not_read_fifo_status(simulated, clock, monkeypatch):
+    sensor, device, i2c = simulated()
+    sensor.timestamp_enabled = True
+    clock.advance(0.5)
+    reads = record_reads(i2c, device, monkeypatch)
+    assert sensor.read_mlc_changes() == []
+    device.set_mlc_output(7, 2)
+    changes = sensor.read_mlc_changes()
+    assert [(tree, value) for _, tree, value in changes] == [(7, 2)]
+    assert changes[0][0] == pytest.approx(0.5, abs=0.001)
+    for register, length in reads:
+        assert not register <= FIFO_STATUS2 < register + length
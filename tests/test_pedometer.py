@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds import FIFOMode, FIFOTag
+from adafruit_lsm6ds.lsm6ds33 import LSM6DS33
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+from adafruit_lsm6ds.pedometer import StepCounter
+
+
+@pytest.mark.parametrize("sensor_class", (LSM6DSOX, LSM6DS33))
+def test_step_counter(sensor_class, simulated):
+    sensor, device, _ = simulated(sensor_class)
+    sensor.pedometer_enable = True
+    assert sensor.pedometer_enable
+    device.add_steps(5)
+    assert sensor.pedometer_steps == 5
+    steps = StepCounter()
+    assert steps.poll(sensor)[1] == 5
+    assert steps.poll(sensor) is None
+    device.add_steps(2)
+    assert steps.poll(sensor)[1] == 7
+    # enabling the pedometer again resets the counter
+    sensor.pedometer_enable = True
+    assert sensor.pedometer_steps == 0
+
+
+def test_pedometer_enable_selects_the_bank_once(simulated):
+    sensor, _, i2c = simulated()
+    i2c.reset_stats()
+    sensor.pedometer_enable = True
+    # select the bank, read and write EMB_FUNC_EN_A, reset the counter, deselect the bank
+    assert i2c.transactions == 5
+    i2c.reset_stats()
+    sensor.pedometer_enable = False
+    assert i2c.transactions == 4
+    assert not sensor.pedometer_enable
+
+
+def test_step_counter_is_unsigned(simulated):
+    sensor, device, _ = simulated()
+    sensor.pedometer_enable = True
+    device.add_steps(40000)
+    assert sensor.pedometer_steps == 40000
+
+
+def test_totals_do_not_wrap():
+    steps = StepCounter(counter=65530)
+    assert steps.update(65535, 1.0) == (1.0, 5)
+    assert steps.update(3, 2.0) == (2.0, 9)
+    assert steps.update(3, 3.0) is None
+    steps.counter_reset()
+    assert steps.update(1, 4.0) == (4.0, 10)
+
+
+def test_steps_in_the_fifo(simulated, clock):
+    sensor, device, _ = simulated()
+    sensor.pedometer_enable = True
+    sensor.timestamp_enabled = True
+    sensor.fifo_pedometer = True
+    assert sensor.fifo_pedometer
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    start = clock()
+    for _ in range(3):
+        clock.advance(0.5)
+        device.add_steps()
+    words = list(sensor.read_fifo())
+    assert [tag for tag, _ in words] == [FIFOTag.STEP_COUNTER] * 3
+    assert [data[0] for _, data in words] == [1, 2, 3]
+    events = list(StepCounter().read_fifo_words(words))
+    assert [total for _, total in events] == [1, 2, 3]
+    assert [timestamp for timestamp, _ in events] == pytest.approx(
+        [0.5 + start, 1.0 + start, 1.5 + start], abs=0.001
+    )
+
+
+def test_step_interrupts(simulated):
+    sensor, device, _ = simulated()
+    sensor.pedometer_enable = True
+    sensor.route_step_interrupts(int2=True)
+    device.add_steps()
+    assert device.int2.value
+    assert not device.int1.value
+
+
+def test_step_and_mlc_routes_are_independent(simulated):
+    sensor, device, _ = simulated()
+    sensor.route_mlc_interrupts(int1=0x01)
+    sensor.route_step_interrupts(int1=True)
+    sensor.route_step_interrupts(int1=False)
+    device.set_mlc_output(0, 1)
+    assert device.int1.value
+
+
+def test_older_parts_route_steps_to_int1_only(simulated):
+    sensor, device, _ = simulated(LSM6DS33)
+    sensor.pedometer_enable = True
+    sensor.route_step_interrupts(int1=True)
+    device.add_steps()
+    assert device.int1.value
+    with pytest.raises(RuntimeError):
+        sensor.route_step_interrupts(int2=True)
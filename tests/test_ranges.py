@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from math import radians
+
+import pytest
+
+import adafruit_lsm6ds
+from adafruit_lsm6ds import AccelRange, GyroRange
+from adafruit_lsm6ds.ism330dhcx import ISM330DHCX
+from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+
+CTRL1_XL = 0x10
+CTRL2_G = 0x11
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(adafruit_lsm6ds, "sleep", lambda _: None)
+
+
+def test_families_do_not_share_range_encodings(simulated, clock):
+    dsox, dsox_device, _ = simulated(LSM6DSOX)
+    simulated(LSM6DSO32)
+    dsox.accelerometer_range = AccelRange.RANGE_8G
+    assert (dsox_device.registers[CTRL1_XL] >> 2) & 0x03 == 3
+    clock.advance(0.1)
+    assert dsox.acceleration[2] == pytest.approx(9.80665, abs=0.01)
+
+
+def test_lsm6dso32_ranges(simulated, clock):
+    sensor, device, _ = simulated(LSM6DSO32)
+    for accel_range, fs in (
+        (AccelRange.RANGE_4G, 0),
+        (AccelRange.RANGE_32G, 1),
+        (AccelRange.RANGE_8G, 2),
+        (AccelRange.RANGE_16G, 3),
+    ):
+        sensor.accelerometer_range = accel_range
+        assert (device.registers[CTRL1_XL] >> 2) & 0x03 == fs
+        clock.advance(0.1)
+        assert sensor.acceleration[2] == pytest.approx(9.80665, abs=0.1)
+
+
+@pytest.mark.parametrize(
+    "sensor_class, accel_range",
+    ((LSM6DSOX, AccelRange.RANGE_32G), (LSM6DSO32, AccelRange.RANGE_2G)),
+)
+def test_unsupported_accel_range_is_rejected(simulated, sensor_class, accel_range):
+    sensor, _, _ = simulated(sensor_class)
+    with pytest.raises(AttributeError):
+        sensor.accelerometer_range = accel_range
+    with pytest.raises(AttributeError):
+        sensor.configure(accel_range=accel_range)
+
+
+def test_4000_dps_is_only_for_the_ism330dhcx(simulated, clock):
+    dsox, _, _ = simulated(LSM6DSOX)
+    with pytest.raises(AttributeError):
+        dsox.gyro_range = GyroRange.RANGE_4000_DPS
+
+    samples = lambda _: ((0.0, 0.0, 9.80665), (0.0, 0.0, radians(3000)))  # noqa: E731
+    ism, device, _ = simulated(ISM330DHCX, samples=samples)
+    ism.gyro_range = GyroRange.RANGE_4000_DPS
+    assert device.registers[CTRL2_G] & 0x0F == 0x01
+    clock.advance(0.1)
+    assert ism.gyro[2] == pytest.approx(radians(3000), rel=0.001)
+
+    ism.gyro_range = GyroRange.RANGE_125_DPS
+    assert device.registers[CTRL2_G] & 0x0F == 0x02
+    ism.configure(gyro_range=GyroRange.RANGE_1000_DPS)
+    assert device.registers[CTRL2_G] & 0x0F == 0x08
+    assert ism.gyro_range == GyroRange.RANGE_1000_DPS
+
+
+def test_power_on_ranges_without_defaults(simulated):
+    dsox, _, _ = simulated(LSM6DSOX, configure_defaults=False)
+    assert dsox.accelerometer_range == AccelRange.RANGE_2G
+    assert dsox.gyro_range == GyroRange.RANGE_250_DPS
+    dso32, _, _ = simulated(LSM6DSO32, configure_defaults=False)
+    assert dso32.accelerometer_range == AccelRange.RANGE_4G
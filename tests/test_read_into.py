@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import tracemalloc
+from array import array
+
+import pytest
+
+import adafruit_lsm6ds
+
+CALLS = 50
+
+
+def _driver_filters():
+    """Trace the driver module, except the bound ``__exit__`` method CPython creates for
+    each ``with self.i2c_device`` statement, which is not memory the driver allocates"""
+    filters = [tracemalloc.Filter(True, adafruit_lsm6ds.__file__)]
+    with open(adafruit_lsm6ds.__file__) as source:
+        for lineno, line in enumerate(source, 1):
+            if line.strip().startswith("with self.i2c_device as"):
+                filters.append(tracemalloc.Filter(False, adafruit_lsm6ds.__file__, lineno))
+    return filters
+
+
+DRIVER = _driver_filters()
+
+
+def driver_allocations(i2c, function, *args):
+    """The largest number of memory blocks allocated by the driver module over CALLS calls of
+    ``function``, after a warm-up call. The blocks are counted when each bus transaction
+    starts, which catches buffers allocated for the call, and after the last call, which
+    catches memory kept from one call to the next"""
+    function(*args)
+    snapshots = []
+    transfer = i2c.writeto_then_readfrom
+
+    def snapshot_transfer(*transfer_args, **kwargs):
+        snapshots.append(tracemalloc.take_snapshot().filter_traces(DRIVER))
+        transfer(*transfer_args, **kwargs)
+
+    tracemalloc.start()
+    i2c.writeto_then_readfrom = snapshot_transfer
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(DRIVER)
+        for _ in range(CALLS):
+            function(*args)
+        snapshots.append(tracemalloc.take_snapshot().filter_traces(DRIVER))
+    finally:
+        del i2c.writeto_then_readfrom
+        tracemalloc.stop()
+    return max(
+        sum(stat.count_diff for stat in snapshot.compare_to(before, "lineno"))
+        for snapshot in snapshots
+    )
+
+
+@pytest.mark.parametrize(
+    "method, typecode",
+    (
+        ("read_acceleration_into", "f"),
+        ("read_gyro_into", "f"),
+        ("read_raw_acceleration_into", "h"),
+        ("read_raw_gyro_into", "h"),
+    ),
+)
+def test_read_into_does_not_allocate(method, typecode, simulated, clock):
+    sensor, _, i2c = simulated()
+    clock.advance(0.1)
+    buf = array(typecode, (0, 0, 0))
+    assert driver_allocations(i2c, getattr(sensor, method), buf) == 0
+
+
+@pytest.mark.parametrize("method", ("read_acceleration_into", "read_gyro_into"))
+def test_fixed_point_read_into_does_not_allocate(method, simulated, clock):
+    sensor, _, i2c = simulated()
+    sensor.fixed_point = True
+    clock.advance(0.1)
+    buf = array("l", (0, 0, 0))
+    assert driver_allocations(i2c, getattr(sensor, method), buf) == 0
+
+
+def test_read_timestamped_does_not_allocate_buffers(simulated, clock):
+    sensor, _, i2c = simulated()
+    sensor.timestamp_enabled = True
+    clock.advance(0.1)
+    assert driver_allocations(i2c, sensor.read_timestamped) == 0
+    clock.advance(0.05)
+    timestamp, acceleration, _, _, data_ready = sensor.read_timestamped()
+    assert timestamp == pytest.approx(0.15, abs=0.001)
+    assert acceleration[2] == pytest.approx(9.80665, abs=0.01)
+    assert data_ready[0]
+
+
+def test_read_into_values(simulated, clock):
+    sensor, _, _ = simulated()
+    clock.advance(0.1)
+    acceleration = array("f", (0, 0, 0))
+    sensor.read_acceleration_into(acceleration)
+    assert tuple(acceleration) == pytest.approx(sensor.acceleration, abs=1e-5)
+    raw = array("h", (0, 0, 0))
+    sensor.read_raw_acceleration_into(raw)
+    assert raw[2] == round(1000 / 0.122)
+
+
+def test_allocations_are_detected(simulated):
+    sensor, _, i2c = simulated()
+    # reading a register bank allocates the bytearray it returns
+    assert driver_allocations(i2c, lambda: sensor.fifo_pedometer) > 0
@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+
+import pytest
+
+from adafruit_lsm6ds import Rate, sensor_group
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+from adafruit_lsm6ds.sensor_group import SensorGroup
+from adafruit_lsm6ds.simulator import SimulatedI2C, SimulatedLSM6DS
+
+pytestmark = pytest.mark.usefixtures("simulated_time")
+
+
+@pytest.fixture(autouse=True)
+def group_time(monkeypatch, clock):
+    monkeypatch.setattr(sensor_group, "monotonic", clock)
+
+
+def make_sensor(i2c, clock, rate, address=0x6A):
+    i2c.add_device(SimulatedLSM6DS(LSM6DSOX, address=address, clock=clock))
+    sensor = LSM6DSOX(i2c, address=address)
+    sensor.configure(accel_rate=rate, gyro_rate=rate, settle=False)
+    return sensor
+
+
+def record_reads(sensor, reads, barrier=None):
+    """Record the sensor and the current thread at each ``read_all``, first waiting at
+    ``barrier`` if given"""
+    read_all = sensor.read_all
+
+    def recorded():
+        reads.append((sensor, threading.current_thread()))
+        if barrier is not None:
+            barrier.wait()
+        return read_all()
+
+    sensor.read_all = recorded
+
+
+def run(group, clock, seconds, rate=104):
+    counts = dict.fromkeys(group.sensors, 0)
+    # poll halfway between the samples of the fastest sensor
+    clock.advance(0.5 / rate)
+    for _ in range(round(seconds * rate)):
+        clock.advance(1 / rate)
+        for sensor in group.read():
+            counts[sensor] += 1
+    return counts
+
+
+def test_sensors_are_read_at_their_data_rates(clock):
+    bus_a, bus_b = SimulatedI2C(), SimulatedI2C()
+    fast = make_sensor(bus_a, clock, Rate.RATE_104_HZ)
+    slow = make_sensor(bus_b, clock, Rate.RATE_26_HZ)
+    off = make_sensor(bus_b, clock, Rate.RATE_SHUTDOWN, address=0x6B)
+    with SensorGroup([fast, slow, off]) as group:
+        bus_a.reset_stats()
+        bus_b.reset_stats()
+        counts = run(group, clock, 1)
+    assert counts[fast] == pytest.approx(104, abs=1)
+    assert counts[slow] == pytest.approx(26, abs=1)
+    assert counts[off] == 0
+    # sensors that are not due a sample are skipped without a bus transaction
+    assert bus_a.transactions == pytest.approx(104, abs=1)
+    assert bus_b.transactions == pytest.approx(26, abs=1)
+
+
+def test_buses_are_read_in_separate_workers(clock):
+    bus_a, bus_b = SimulatedI2C(), SimulatedI2C()
+    sensors = (
+        make_sensor(bus_a, clock, Rate.RATE_104_HZ),
+        make_sensor(bus_a, clock, Rate.RATE_104_HZ, address=0x6B),
+        make_sensor(bus_b, clock, Rate.RATE_104_HZ),
+    )
+    reads = []
+    # the first sensor of each bus waits for the other bus, so the buses must be read at
+    # the same time
+    barrier = threading.Barrier(2, timeout=5)
+    record_reads(sensors[0], reads, barrier)
+    record_reads(sensors[1], reads)
+    record_reads(sensors[2], reads, barrier)
+    with SensorGroup(sensors) as group:
+        assert group._executor is not None
+        clock.advance(0.01)
+        assert set(group.read()) == set(sensors)
+    threads = dict(reads)
+    assert threads[sensors[0]] is threads[sensors[1]]
+    assert threads[sensors[0]] is not threads[sensors[2]]
+    assert threading.main_thread() not in threads.values()
+    # sensors sharing a bus are read in turn, in the order they were given
+    bus_a_order = [sensor for sensor, _ in reads if sensor is not sensors[2]]
+    assert bus_a_order == list(sensors[:2])
+
+
+def test_single_bus_is_read_without_threads(clock):
+    bus = SimulatedI2C()
+    sensors = [make_sensor(bus, clock, Rate.RATE_104_HZ, address) for address in (0x6A, 0x6B)]
+    reads = []
+    for sensor in sensors:
+        record_reads(sensor, reads)
+    group = SensorGroup(sensors)
+    assert group._executor is None
+    counts = run(group, clock, 0.5)
+    assert list(counts.values()) == [52, 52]
+    assert {thread for _, thread in reads} == {threading.main_thread()}
+    assert [sensor for sensor, _ in reads[:4]] == sensors * 2
+
+
+def test_threads_can_be_turned_off(clock):
+    sensors = [make_sensor(SimulatedI2C(), clock, Rate.RATE_104_HZ) for _ in range(2)]
+    group = SensorGroup(sensors, threaded=False)
+    assert group._executor is None
+    clock.advance(0.01)
+    assert set(group.read()) == set(sensors)
+
+
+def test_refresh_rates(clock):
+    sensor = make_sensor(SimulatedI2C(), clock, Rate.RATE_104_HZ)
+    group = SensorGroup([sensor])
+    sensor.configure(accel_rate=Rate.RATE_52_HZ, gyro_rate=Rate.RATE_52_HZ, settle=False)
+    group.refresh_rates()
+    assert run(group, clock, 1)[sensor] == pytest.approx(52, abs=1)
+
+
+def test_bus_utilization(clock):
+    class TimedI2C(SimulatedI2C):
+        """Advance the simulated clock by the time each transaction takes on the bus"""
+
+        def _count(self, written, read, starts=1):
+            before = self.bus_time
+            super()._count(written, read, starts)
+            clock.advance(self.bus_time - before)
+
+    bus = TimedI2C()
+    sensor = make_sensor(bus, clock, Rate.RATE_416_HZ)
+    group = SensorGroup([sensor])
+    assert group.bus_utilization == {bus: 0.0}
+    bus.reset_stats()
+    group.reset_stats()
+    run(group, clock, 0.5, rate=416)
+    elapsed = clock() - group._stats_start
+    assert group.bus_utilization[bus] == pytest.approx(bus.bus_time / elapsed)
+    assert 0 < group.bus_utilization[bus] < 1
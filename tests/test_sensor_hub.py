@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+import pytest
+
+from adafruit_lsm6ds import FIFOMode, FIFOTag, Rate
+from adafruit_lsm6ds.lsm6ds33 import LSM6DS33
+from adafruit_lsm6ds.sensor_hub import LIS3MDL
+
+LIS3MDL_ADDRESS = 0x1C
+CTRL_REG1 = 0x20
+OUT_X_L = 0x28
+
+pytestmark = pytest.mark.usefixtures("simulated_time")
+
+
+def magnetometer(simulated, field=(6842, -3421, 684), **kwargs):
+    sensor, device, i2c = simulated()
+    registers = device.add_auxiliary_device(LIS3MDL_ADDRESS)
+    struct.pack_into("<hhh", registers, OUT_X_L, *field)
+    return LIS3MDL(sensor, **kwargs), sensor, device, i2c, registers
+
+
+def test_lis3mdl_is_configured(simulated):
+    _, _, _, _, registers = magnetometer(simulated, magnetic_range=8)
+    assert registers[CTRL_REG1 : CTRL_REG1 + 5] == bytes((0x7C, 0x20, 0x00, 0x0C, 0x40))
+
+
+def test_magnetic(simulated, clock):
+    mag, _, _, i2c, _ = magnetometer(simulated)
+    clock.advance(0.02)
+    i2c.reset_stats()
+    assert mag.magnetic == pytest.approx((100.0, -50.0, 10.0), abs=0.01)
+    # selecting the bank, reading the outputs and selecting the user bank again
+    assert i2c.transactions == 3
+
+
+def test_magnetic_range(simulated, clock):
+    mag, _, _, _, _ = magnetometer(simulated, field=(1711, 0, 0), magnetic_range=16)
+    clock.advance(0.02)
+    assert mag.magnetic[0] == pytest.approx(100.0, abs=0.01)
+    with pytest.raises(AttributeError):
+        magnetometer(simulated, magnetic_range=10)
+
+
+def test_read_all(simulated, clock):
+    mag, _, _, i2c, _ = magnetometer(simulated)
+    clock.advance(0.02)
+    i2c.reset_stats()
+    acceleration, gyro, magnetic = mag.read_all()
+    assert i2c.transactions == 4
+    assert acceleration[2] == pytest.approx(9.80665, abs=0.01)
+    assert gyro == pytest.approx((0.0, 0.0, 0.0))
+    assert magnetic == pytest.approx((100.0, -50.0, 10.0), abs=0.01)
+
+
+def test_batched_magnetometer(simulated, clock):
+    mag, sensor, _, _, _ = magnetometer(simulated, batch=True)
+    sensor.fifo_accel_batch_rate = Rate.RATE_104_HZ
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    clock.advance(0.1)
+    words = list(mag.read_fifo())
+    accel = [data for tag, data in words if tag == FIFOTag.ACCEL]
+    magnetic = [data for tag, data in words if tag == FIFOTag.SENSOR_HUB_SLAVE0]
+    assert len(magnetic) == len(accel) == pytest.approx(10, abs=1)
+    assert magnetic[-1] == pytest.approx((100.0, -50.0, 10.0), abs=0.01)
+
+
+def test_missing_device_times_out(simulated):
+    sensor, _, _ = simulated()
+    with pytest.raises(RuntimeError):
+        sensor.sensor_hub_write(LIS3MDL_ADDRESS, CTRL_REG1, 0x7C)
+
+
+def test_sensor_hub_arguments(simulated):
+    sensor, _, _ = simulated()
+    with pytest.raises(AttributeError):
+        sensor.configure_sensor_hub_read(4, LIS3MDL_ADDRESS, OUT_X_L, 6)
+    with pytest.raises(AttributeError):
+        sensor.configure_sensor_hub_read(0, LIS3MDL_ADDRESS, OUT_X_L, 8)
+    with pytest.raises(AttributeError):
+        sensor.start_sensor_hub(rate=100)
+    with pytest.raises(AttributeError):
+        sensor.read_sensor_hub_into(bytearray(19))
+
+
+def test_sensor_hub_needs_a_sensor_hub(simulated):
+    sensor, _, _ = simulated(LSM6DS33)
+    with pytest.raises(RuntimeError):
+        sensor.start_sensor_hub()
+    with pytest.raises(RuntimeError):
+        sensor.read_sensor_hub_into(bytearray(6))
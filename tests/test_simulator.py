@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds import Rate
+from adafruit_lsm6ds.ism330dhcx import ISM330DHCX
+from adafruit_lsm6ds.lsm6ds3 import LSM6DS3
+from adafruit_lsm6ds.lsm6ds3trc import LSM6DS3TRC
+from adafruit_lsm6ds.lsm6ds33 import LSM6DS33
+from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+from adafruit_lsm6ds.simulator import SimulatedI2C, SimulatedLSM6DS
+
+SENSOR_CLASSES = (LSM6DSOX, LSM6DSO32, ISM330DHCX, LSM6DS33, LSM6DS3, LSM6DS3TRC)
+
+CTRL1_XL = 0x10
+CTRL2_G = 0x11
+CTRL3_C = 0x12
+STATUS_REG = 0x1E
+OUTX_L_A = 0x28
+FUNC_CFG_ACCESS = 0x01
+
+
+def read(i2c, register, count=1):
+    buf = bytearray(count)
+    i2c.writeto_then_readfrom(0x6A, bytes((register,)), buf)
+    return buf
+
+
+def write(i2c, register, *values):
+    i2c.writeto(0x6A, bytes((register,) + values))
+
+
+@pytest.mark.parametrize("sensor_class", SENSOR_CLASSES)
+def test_who_am_i(sensor_class, simulated, clock):
+    sensor, _, i2c = simulated(sensor_class)
+    assert read(i2c, 0x0F)[0] == sensor_class.CHIP_ID
+    clock.advance(0.1)
+    assert sensor.acceleration[2] == pytest.approx(9.80665, abs=0.01)
+
+
+def test_wrong_chip_is_rejected(clock):
+    i2c = SimulatedI2C(SimulatedLSM6DS(LSM6DS33, clock=clock))
+    with pytest.raises(RuntimeError):
+        LSM6DSOX(i2c)
+
+
+def test_auto_increment(simulated):
+    _, device, i2c = simulated()
+    write(i2c, CTRL1_XL, 0x40, 0x50)
+    assert device.registers[CTRL1_XL] == 0x40
+    assert device.registers[CTRL2_G] == 0x50
+    assert read(i2c, CTRL1_XL, 2) == bytearray((0x40, 0x50))
+
+
+def test_without_auto_increment_the_address_stays(simulated):
+    _, device, i2c = simulated()
+    write(i2c, CTRL3_C, 0x00)
+    write(i2c, CTRL1_XL, 0x40, 0x50)
+    assert device.registers[CTRL1_XL] == 0x50
+    assert read(i2c, CTRL1_XL, 2) == bytearray((0x50, 0x50))
+
+
+def test_software_reset_clears_itself(simulated):
+    _, device, i2c = simulated()
+    write(i2c, CTRL1_XL, 0x40)
+    write(i2c, CTRL3_C, 0x01)
+    assert read(i2c, CTRL3_C)[0] == 0x04
+    assert device.registers[CTRL1_XL] == 0
+
+
+def test_bank_switching(simulated):
+    _, device, i2c = simulated()
+    write(i2c, FUNC_CFG_ACCESS, 0x80)
+    write(i2c, 0x04, 0x18)
+    assert device.embedded_registers[0x04] == 0x18
+    write(i2c, FUNC_CFG_ACCESS, 0x40)
+    write(i2c, 0x04, 0x22)
+    assert device.sensor_hub_registers[0x04] == 0x22
+    write(i2c, FUNC_CFG_ACCESS, 0x00)
+    assert device.registers[0x04] == 0
+    assert read(i2c, FUNC_CFG_ACCESS)[0] == 0
+    assert device.embedded_registers[0x04] == 0x18
+
+
+def test_outputs_follow_the_data_rate(simulated, clock):
+    sensor, _, i2c = simulated()
+    sensor.accelerometer_data_rate = Rate.RATE_104_HZ
+    clock.advance(1 / 104)
+    assert read(i2c, STATUS_REG)[0] & 0x01
+    read(i2c, OUTX_L_A, 6)
+    assert not read(i2c, STATUS_REG)[0] & 0x01
+    clock.advance(0.5 / 104)
+    assert not read(i2c, STATUS_REG)[0] & 0x01
+    clock.advance(0.5 / 104)
+    assert read(i2c, STATUS_REG)[0] & 0x01
+
+
+def test_outputs_follow_the_waveform(simulated, clock):
+    def waveform(t):
+        return (t, 0.0, 0.0), (0.0, 0.0, 0.0)
+
+    sensor, _, _ = simulated(samples=waveform)
+    clock.advance(1.0)
+    x = sensor.acceleration[0]
+    assert x == pytest.approx(1.0, abs=0.02)
+    clock.advance(0.001)
+    assert sensor.acceleration[0] == x
+
+
+def test_shutdown_stops_the_outputs(simulated, clock):
+    sensor, _, i2c = simulated()
+    sensor.accelerometer_data_rate = Rate.RATE_SHUTDOWN
+    read(i2c, OUTX_L_A, 6)
+    clock.advance(1.0)
+    assert not read(i2c, STATUS_REG)[0] & 0x01
+
+
+def test_bus_counters(simulated):
+    _, _, i2c = simulated()
+    i2c.reset_stats()
+    read(i2c, OUTX_L_A, 6)
+    assert i2c.transactions == 1
+    assert i2c.bytes_written == 1
+    assert i2c.bytes_read == 6
+    assert i2c.bus_time == pytest.approx((9 * 7 + 21) / 400000)
+
+
+def test_missing_device(clock):
+    i2c = SimulatedI2C(frequency=100000)
+    with pytest.raises(OSError):
+        read(i2c, 0x0F)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds import LSM6DS_SPI_DEFAULT_BAUDRATE, FIFOMode, FIFOTag, Rate
+from adafruit_lsm6ds.ism330dhcx import ISM330DHCX
+from adafruit_lsm6ds.lsm6ds33 import LSM6DS33
+from adafruit_lsm6ds.lsm6dso32 import LSM6DSO32
+from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
+from adafruit_lsm6ds.simulator import SimulatedLSM6DS, SimulatedSPI
+
+CTRL1_XL = 0x10
+
+
+def make_spi(sensor_class, clock, **kwargs):
+    device = SimulatedLSM6DS(sensor_class, clock=clock)
+    spi = SimulatedSPI(device)
+    return sensor_class(spi, spi_cs=spi.chip_select, **kwargs), device, spi
+
+
+@pytest.mark.parametrize("sensor_class", (LSM6DSOX, LSM6DSO32, ISM330DHCX, LSM6DS33))
+def test_spi_default_baudrate(sensor_class, clock):
+    sensor, _, spi = make_spi(sensor_class, clock)
+    assert spi.baudrate == LSM6DS_SPI_DEFAULT_BAUDRATE
+    clock.advance(0.1)
+    assert sensor.acceleration[2] == pytest.approx(9.80665, abs=0.01)
+
+
+def test_spi_baudrate(clock):
+    _, _, spi = make_spi(LSM6DSOX, clock, spi_baudrate=1000000)
+    assert spi.baudrate == 1000000
+
+
+def test_spi_reads_and_writes(clock):
+    sensor, device, spi = make_spi(LSM6DSOX, clock)
+    sensor.accelerometer_data_rate = Rate.RATE_208_HZ
+    assert device.registers[CTRL1_XL] >> 4 == Rate.RATE_208_HZ
+    clock.advance(0.1)
+    spi.reset_stats()
+    acceleration, _, _, data_ready = sensor.read_all()
+    # the whole burst is one transaction: the address, then STATUS_REG to OUTZ_H_A
+    assert spi.transactions == 1
+    assert spi.bytes_written == 1
+    assert spi.bytes_read == 16
+    assert acceleration[2] == pytest.approx(9.80665, abs=0.01)
+    assert data_ready[0]
+
+
+def test_spi_fifo(clock):
+    sensor, _, _ = make_spi(LSM6DSOX, clock)
+    sensor.fifo_accel_batch_rate = Rate.RATE_104_HZ
+    sensor.fifo_mode = FIFOMode.CONTINUOUS
+    clock.advance(0.5)
+    words = list(sensor.read_fifo())
+    assert len(words) == pytest.approx(52, abs=1)
+    assert all(tag == FIFOTag.ACCEL for tag, _ in words)
+    assert words[-1][1][2] == pytest.approx(9.80665, abs=0.01)
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import adafruit_lsm6ds
+
+OUTX_L_A = 0x28
+
+
+def test_stats_need_instrumentation(simulated):
+    sensor, _, _ = simulated()
+    with pytest.raises(RuntimeError):
+        sensor.stats()
+    with pytest.raises(RuntimeError):
+        sensor.reset_stats()
+    with pytest.raises(RuntimeError):
+        sensor.stats_per_method = True
+    assert not sensor.stats_per_method
+
+
+def test_stats_count_transactions_per_register(simulated, monkeypatch):
+    sensor, _, i2c = simulated(instrument=True)
+
+    def fail(_):
+        raise AssertionError("the call stack was inspected")
+
+    monkeypatch.setattr(adafruit_lsm6ds._InstrumentedDevice, "_method", fail)
+    sensor.reset_stats()
+    i2c.reset_stats()
+    for _ in range(3):
+        sensor.acceleration  # noqa: B018
+    stats = sensor.stats()
+    assert stats["transactions"] == i2c.transactions == 3
+    assert stats["bytes_read"] == 18
+    assert stats["bytes_written"] == 3
+    assert stats["registers"][OUTX_L_A]["transactions"] == 3
+    assert stats["methods"] == {}
+    sensor.reset_stats()
+    assert sensor.stats()["transactions"] == 0
+
+
+def test_stats_per_method(simulated):
+    sensor, _, _ = simulated(instrument=True)
+    sensor.stats_per_method = True
+    assert sensor.stats_per_method
+    sensor.reset_stats()
+    sensor.acceleration  # noqa: B018
+    sensor.read_all()
+    sensor.configure(accel_rate=adafruit_lsm6ds.Rate.RATE_52_HZ, settle=False)
+    methods = sensor.stats()["methods"]
+    assert methods["acceleration"]["transactions"] == 1
+    assert methods["read_all"]["transactions"] == 1
+    # the read and write of configure are counted under configure, not its helpers
+    assert methods["configure"]["transactions"] == 2
+    assert set(methods) == {"acceleration", "read_all", "configure"}
+
+
+def test_stats_count_only_bus_transactions_with_the_cache(simulated):
+    sensor, _, _ = simulated(instrument=True, cache_registers=True)
+    sensor.reset_stats()
+    sensor.accelerometer_data_rate  # noqa: B018
+    assert sensor.stats()["transactions"] == 0
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_lsm6ds.ucf import MAGIC, compile_ucf, ucf_commands
+
+# writes two bytes to page 1 of the embedded functions' advanced pages, then configures the
+# FIFO, whose FIFO_CTRL2 and FIFO_CTRL3 share the addresses of PAGE_ADDRESS and PAGE_VALUE
+UCF = """\
+--This is a comment
+Ac 10 00
+Ac 11 00
+Ac 01 80
+Ac 17 40
+Ac 02 11
+Ac 08 EA
+Ac 09 46
+Ac 09 53
+Ac 02 01
+Ac 17 00
+Ac 01 00
+WAIT 5
+Ac 07 10
+Ac 08 00
+Ac 09 00
+"""
+
+
+def commands(source):
+    return [
+        (bytes(buf[:end]) if buf is not None else None, end) for buf, end in ucf_commands(source)
+    ]
+
+
+def test_text_commands():
+    assert commands(UCF.splitlines()) == [
+        (b"\x10\x00\x00", 3),
+        (b"\x01\x80", 2),
+        (b"\x17\x40", 2),
+        (b"\x02\x11", 2),
+        (b"\x08\xea", 2),
+        (b"\x09\x46", 2),
+        (b"\x09\x53", 2),
+        (b"\x02\x01", 2),
+        (b"\x17\x00", 2),
+        (b"\x01\x00", 2),
+        (None, 5),
+        (b"\x07\x10\x00\x00", 4),
+    ]
+
+
+def test_compiled_commands_match_the_text(tmp_path):
+    text = tmp_path / "config.ucf"
+    text.write_text(UCF)
+    compiled = compile_ucf(str(text), str(tmp_path / "config.bin"))
+    assert compiled.startswith(MAGIC)
+    assert (tmp_path / "config.bin").read_bytes() == compiled
+    expected = commands(UCF.splitlines())
+    assert commands(str(text)) == expected
+    assert commands(compiled) == expected
+    assert commands(str(tmp_path / "config.bin")) == expected
+
+
+def test_long_waits_are_split():
+    compiled = compile_ucf(["WAIT 70000"])
+    assert commands(compiled) == [(None, 0xFFFF), (None, 70000 - 0xFFFF)]
+
+
+@pytest.mark.parametrize("cut", (1, 3, 6))
+def test_truncated_compiled_data(tmp_path, cut):
+    # cut inside the last record's header, inside its values, and inside a wait
+    compiled = compile_ucf(["Ac 10 00", "Ac 11 00", "Ac 12 44", "WAIT 300"])
+    truncated = compiled[: len(MAGIC) + cut] if cut != 6 else compiled[:-1]
+    with pytest.raises(ValueError):
+        commands(truncated)
+    path = tmp_path / "truncated.bin"
+    path.write_bytes(truncated)
+    with pytest.raises(ValueError):
+        commands(str(path))
+
+
+def test_not_compiled_data():
+    with pytest.raises(ValueError):
+        commands(b"Ac 10 00")
+
+
+def test_load_mlc(simulated, tmp_path):
+    sensor, device, _ = simulated()
+    path = tmp_path / "config.ucf"
+    path.write_text(UCF)
+    sensor.load_mlc(str(path))
+    assert device.pages == {(1, 0xEA): 0x46, (1, 0xEB): 0x53}
+    assert device.registers[0x07] == 0x10